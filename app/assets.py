@@ -0,0 +1,93 @@
+import os
+import threading
+
+import pygame
+
+from app.display import clear_on_quit, display_format
+from app.text_cache import get_font
+
+# Каталог ресурсов относительно пакета, а не текущей папки запуска
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+
+def asset_path(name):
+    return os.path.join(ASSETS_DIR, name)
+
+
+class AssetManager:
+    # Картинки загружаются и переводятся в формат экрана один раз; масштабированные копии
+    # хранятся по размеру. Декодирование можно начать в фоне, пока показывается меню
+    def __init__(self, directory=ASSETS_DIR):
+        self.directory = directory
+        self.images = {}  # имя -> поверхность в формате экрана
+        self.scaled = {}  # (имя, размер) -> масштабированная поверхность
+        self.pending = {}  # имя -> поверхность, загруженная в фоне и ещё не переведённая
+        self.lock = threading.Lock()
+        self.loader = None
+
+    def __len__(self):
+        return len(self.images)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def clear(self):
+        self.wait()
+        self.images.clear()
+        self.scaled.clear()
+        self.pending.clear()
+
+    def wait(self):
+        if self.loader is not None:
+            self.loader.join()
+            self.loader = None
+
+    def image(self, name, size=None):
+        surface = self.images.get(name)
+        if surface is None:
+            self.wait()
+            with self.lock:
+                surface = self.pending.pop(name, None)
+            if surface is None:
+                surface = pygame.image.load(self.path(name))
+            clear_on_quit(self.clear)
+            surface = self.images[name] = display_format(surface, alpha=True)
+        if size is None:
+            return surface
+
+        key = (name, tuple(size))
+        scaled = self.scaled.get(key)
+        if scaled is None:
+            scaled = self.scaled[key] = pygame.transform.scale(surface, key[1])
+        return scaled
+
+    def preload(self, images=(), fonts=()):
+        # Синхронная загрузка: images - имена или пары (имя, размер), fonts - аргументы get_font
+        for item in images:
+            if isinstance(item, str):
+                self.image(item)
+            else:
+                self.image(*item)
+        for font in fonts:
+            get_font(*font)
+
+    def preload_async(self, names):
+        # Файлы читаются и декодируются в фоновом потоке; перевод в формат экрана - при первом image()
+        self.wait()
+        names = [name for name in names if name not in self.images]
+
+        def load():
+            for name in names:
+                try:
+                    surface = pygame.image.load(self.path(name))
+                except (pygame.error, OSError):
+                    continue  # ошибка повторится и будет видна при синхронной загрузке
+                with self.lock:
+                    self.pending[name] = surface
+
+        self.loader = threading.Thread(target=load, name='asset-preload', daemon=True)
+        self.loader.start()
+        return self.loader
+
+
+assets = AssetManager()
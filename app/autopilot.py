@@ -0,0 +1,69 @@
+import numpy as np
+import pygame
+
+# Восемь направлений (единичные векторы) и их клавиши; для силы выбирается ближайшее по углу
+DIRECTIONS = np.array([(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)], dtype=np.float64)
+DIRECTIONS /= np.hypot(DIRECTIONS[:, 0], DIRECTIONS[:, 1])[:, None]
+DIRECTION_KEYS = [(pygame.K_d,), (pygame.K_d, pygame.K_s), (pygame.K_s,), (pygame.K_a, pygame.K_s),
+                  (pygame.K_a,), (pygame.K_a, pygame.K_w), (pygame.K_w,), (pygame.K_d, pygame.K_w)]
+
+
+def enemy_arrays(game):
+    # Центры и скорости (пикселей за шаг симуляции) всех врагов массивами; у пула скорости - срез без копирования
+    pool = game.enemy_pool
+    if pool is not None:
+        n = pool.count
+        velocities = pool.vel[:n] if game.step_scale == 1.0 else pool.vel[:n] * game.step_scale
+        return pool.pos[:n] + pool.size[:n] / 2, velocities
+    enemies = game.enemies
+    centers = np.array([enemy.rect.center for enemy in enemies], dtype=np.float64).reshape(-1, 2)
+    velocities = np.array([(enemy.speed * enemy.direction[0], enemy.speed * enemy.direction[1])
+                           for enemy in enemies], dtype=np.float64).reshape(-1, 2)
+    return centers, velocities * game.step_scale
+
+
+class ThreatFieldPolicy:
+    # Автопилот для нагрузочных прогонов: поле отталкивания от врагов (в текущем и предсказанном
+    # через lookahead шагов положении) и от краёв экрана считается одним проходом NumPy за кадр.
+    # Используется через CallbackInput(ThreatFieldPolicy())
+    def __init__(self, lookahead=15, radius=250, wall_margin=120, wall_weight=4.0):
+        self.lookahead = lookahead
+        self.radius = radius
+        self.wall_margin = wall_margin
+        self.wall_weight = wall_weight
+
+    def player_center(self, game):
+        rect = game.player_rect
+        if rect.width == 0:  # до первого шага игрок ещё не ставился на поле
+            rect = pygame.Rect(game.PLAYER_START, game.ship_size)
+        return np.array(rect.center, dtype=np.float64)
+
+    def force(self, game):
+        player = self.player_center(game)
+        centers, velocities = enemy_arrays(game)
+        total = np.zeros(2)
+        radius_sq = self.radius * self.radius
+        for steps in (0, self.lookahead):
+            offset = player - (centers + velocities * steps) if steps else player - centers
+            dist_sq = np.einsum('ij,ij->i', offset, offset)
+            # Сила 1/d^2 вдоль направления от врага: offset / d^3; дальше радиуса - ноль
+            weight = np.where(dist_sq < radius_sq, 1 / (dist_sq * np.sqrt(dist_sq) + 1), 0.0)
+            total += weight @ offset
+
+        # Края экрана отталкивают по тому же закону, но сильнее: это целая стена, а не один враг
+        width, height = game.screen.get_size()
+        for axis, low, high in ((0, player[0], width - player[0]), (1, player[1], height - player[1])):
+            if low < self.wall_margin:
+                total[axis] += self.wall_weight / max(low, 1) ** 2
+            if high < self.wall_margin:
+                total[axis] -= self.wall_weight / max(high, 1) ** 2
+        return total, player, (width, height)
+
+    def __call__(self, game):
+        total, player, (width, height) = self.force(game)
+        if not total.any():
+            # Угрозы нет - возвращаемся к центру экрана, где больше места для манёвра
+            total = np.array((width / 2, height / 2)) - player
+            if np.abs(total).max() < game.PLAYER_SPEED * game.step_scale:
+                return ()
+        return DIRECTION_KEYS[int(np.argmax(DIRECTIONS @ total))]
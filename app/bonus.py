@@ -1,22 +1,38 @@
-import pygame
-import time
-
-class Bonus:
-    def __init__(self, pos, type_, width, height, duration=5):
-        global SCREEN_WIDTH, SCREEN_HEIGHT
-        SCREEN_HEIGHT = height
-        SCREEN_WIDTH = width
-        self.rect = pygame.Rect(pos[0], pos[1], 32, 32)
-        self.type_ = type_
-        self.duration = duration
-        self.spawn_time = time.time()
-        self.active = True
-
-    def update(self):
-        current_time = time.time()
-        if current_time - self.spawn_time > self.duration:
-            self.active = False
-
-    def draw(self, screen):
-        color = (0, 255, 0) if self.type_ == 'life' else (0, 0, 255)
-        pygame.draw.rect(screen, color, self.rect)
\ No newline at end of file
+import pygame
+import time
+
+from app.sprites import get_sprite
+
+class Bonus:
+    COLORS = {'life': (0, 255, 0), 'shield': (0, 0, 255)}
+    __slots__ = ('rect', 'type_', 'color', 'duration', 'time_source', 'spawn_time', 'active', 'slot')
+
+    def __init__(self, pos, type_, width, height, duration=5, time_source=None):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(pos, type_, width, height, duration, time_source)
+
+    def reset(self, pos, type_, width, height, duration=5, time_source=None):
+        global SCREEN_WIDTH, SCREEN_HEIGHT
+        SCREEN_HEIGHT = height
+        SCREEN_WIDTH = width
+        self.rect.update(pos[0], pos[1], 32, 32)
+        self.type_ = type_
+        self.color = self.COLORS.get(type_, self.COLORS['shield'])
+        self.duration = duration
+        self.time_source = time_source  # None - системные часы
+        self.spawn_time = self.now()
+        self.active = True
+        self.slot = None  # Индекс в списке Game.bonuses, для удаления перестановкой
+
+    def now(self):
+        if self.time_source is None:
+            return time.time()
+        return self.time_source.now()
+
+    def update(self):
+        current_time = self.now()
+        if current_time - self.spawn_time > self.duration:
+            self.active = False
+
+    def draw(self, screen):
+        return screen.blit(get_sprite(self.rect.size, self.color), self.rect)
\ No newline at end of file
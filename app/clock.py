@@ -0,0 +1,51 @@
+import time
+
+import pygame
+
+
+class SystemClock:
+    # Реальное время: миллисекунды pygame для игрового цикла и секунды для таймеров
+    def ticks(self):
+        return pygame.time.get_ticks()
+
+    def now(self):
+        return time.time()
+
+    def sync(self, sim_ms):
+        pass
+
+
+class SimulatedClock:
+    # Игровое время, которое двигается только вызовом advance
+    def __init__(self, start_ms=0):
+        self.ms = start_ms
+
+    def advance(self, ms):
+        self.ms += ms
+
+    def ticks(self):
+        return int(self.ms)
+
+    def now(self):
+        return self.ms / 1000
+
+    def sync(self, sim_ms):
+        # Без окна часы идут вместе с шагами симуляции
+        self.ms = sim_ms
+
+
+class StepClock:
+    # Темп кадров - по источнику (обычно реальному времени), а таймеры игры - по времени
+    # последнего шага симуляции: тогда сессия зависит только от сида и нажатий
+    def __init__(self, source=None):
+        self.source = source if source is not None else SystemClock()
+        self.sim_ms = 0
+
+    def ticks(self):
+        return self.source.ticks()
+
+    def now(self):
+        return self.sim_ms / 1000
+
+    def sync(self, sim_ms):
+        self.sim_ms = sim_ms
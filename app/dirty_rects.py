@@ -0,0 +1,38 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    # Обновляет на экране только области, где объекты были в прошлом кадре и есть сейчас
+    def __init__(self, screen, background=(0, 0, 0), max_dirty_fraction=0.5):
+        self.screen = screen
+        self.background = background
+        self.max_dirty_fraction = max_dirty_fraction
+        self.prev_rects = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        # Следующий кадр будет перерисован и показан целиком
+        self.full_redraw = True
+
+    def begin_frame(self):
+        if self.full_redraw:
+            self.screen.fill(self.background)
+        else:
+            for rect in self.prev_rects:
+                self.screen.fill(self.background, rect)
+
+    def present(self, rects):
+        rects = [rect for rect in rects if rect]
+        dirty = self.prev_rects + rects
+        self.prev_rects = rects
+
+        width, height = self.screen.get_size()
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+        if self.full_redraw or dirty_area > self.max_dirty_fraction * width * height:
+            # Грязных областей слишком много - дешевле показать весь кадр
+            self.full_redraw = False
+            pygame.display.flip()
+            return False
+
+        pygame.display.update(dirty)
+        return True
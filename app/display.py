@@ -0,0 +1,27 @@
+import pygame
+
+# Очистки кешей поверхностей и шрифтов, которые выполняются при pygame.quit()
+_quit_handlers = []
+
+
+def _run_quit_handlers():
+    handlers = list(_quit_handlers)
+    _quit_handlers.clear()
+    for clear in handlers:
+        clear()
+
+
+def clear_on_quit(clear):
+    # pygame вызывает функции выхода один раз: после pygame.quit() очистка регистрируется заново
+    if clear in _quit_handlers:
+        return
+    if not _quit_handlers:
+        pygame.register_quit(_run_quit_handlers)
+    _quit_handlers.append(clear)
+
+
+def display_format(surface, alpha=False):
+    # Перевод в формат экрана возможен только при открытом окне; без него поверхность остаётся как есть
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
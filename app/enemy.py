@@ -1,25 +1,80 @@
-import random
-import pygame
-
-
-class Enemy:
-    def __init__(self, pos, width, height, size=(32, 32)):
-        global SCREEN_WIDTH, SCREEN_HEIGHT
-        SCREEN_HEIGHT = height
-        SCREEN_WIDTH = width
-        self.rect = pygame.Rect(pos[0], pos[1], *size)
-        self.speed = random.uniform(1, 3)  # Скорость перемещения каждого врага
-        self.direction = [random.choice([-1, 1]), random.choice([-1, 1])]  # Случайное направление движения
-
-    def move(self):
-        # Ограничиваем перемещение врагов пределами экрана
-        self.rect.move_ip(self.speed * self.direction[0], self.speed * self.direction[1])
-
-        # Отражаем назад, если достигли края экрана
-        if self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH:
-            self.direction[0] *= -1
-        if self.rect.top <= 0 or self.rect.bottom >= SCREEN_HEIGHT:
-            self.direction[1] *= -1
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, (255, 0, 0), self.rect)
\ No newline at end of file
+import random
+import pygame
+
+from app.sprites import get_sprite
+
+
+class Enemy:
+    COLOR = (255, 0, 0)
+    MAX_SPEED = 3  # пикселей за шаг по каждой оси (шаг при 60 Гц, см. Game.BASE_RATE)
+    # Без __dict__: объект меньше, а доступ к полям быстрее
+    __slots__ = ('rect', 'speed', 'direction', 'grid', 'prev_pos', 'slot', 'carry')
+
+    def __init__(self, pos, width, height, size=(32, 32), rng=None):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.direction = [0, 0]
+        self.carry = [0.0, 0.0]
+        self.reset(pos, width, height, size, rng)
+
+    def reset(self, pos, width, height, size=(32, 32), rng=None):
+        # Повторная инициализация объекта из пула: Rect и список направления не пересоздаются
+        global SCREEN_WIDTH, SCREEN_HEIGHT
+        SCREEN_HEIGHT = height
+        SCREEN_WIDTH = width
+        self.rect.update(pos[0], pos[1], *size)
+        rng = rng if rng is not None else random  # генератор игры, чтобы сессию можно было повторить
+        self.speed = rng.uniform(1, self.MAX_SPEED)  # Скорость перемещения каждого врага
+        self.direction[0] = rng.choice([-1, 1])  # Случайное направление движения
+        self.direction[1] = rng.choice([-1, 1])
+        self.grid = None  # Пространственный хеш, в котором зарегистрирован враг
+        self.prev_pos = self.rect.topleft  # Положение до последнего шага, для интерполяции
+        self.slot = None  # Индекс в списке Game.enemies, для удаления перестановкой
+        self.carry[0] = self.carry[1] = 0.0  # Дробный остаток пути, когда шаг длиннее или короче базового
+
+    def move(self, scale=1.0):
+        # scale - длина шага симуляции в базовых шагах (Game.step_scale)
+        self.prev_pos = self.rect.topleft
+        # Ограничиваем перемещение врагов пределами экрана
+        if scale == 1.0:
+            self.rect.move_ip(self.speed * self.direction[0], self.speed * self.direction[1])
+        else:
+            # Базовый шаг - целые пиксели, как у move_ip; их и растягиваем, а дробь переносим дальше
+            carry = self.carry
+            dx = int(self.speed * self.direction[0]) * scale + carry[0]
+            dy = int(self.speed * self.direction[1]) * scale + carry[1]
+            carry[0] = dx - int(dx)
+            carry[1] = dy - int(dy)
+            self.rect.move_ip(int(dx), int(dy))
+
+        # Отражаем назад, если достигли края экрана
+        if self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH:
+            self.direction[0] *= -1
+            self.carry[0] = 0.0
+        if self.rect.top <= 0 or self.rect.bottom >= SCREEN_HEIGHT:
+            self.direction[1] *= -1
+            self.carry[1] = 0.0
+
+        # Переносим врага в новые ячейки сетки, если он их сменил
+        if self.grid is not None:
+            self.grid.update(self)
+
+    def bounce(self, other):
+        # Упругий отскок двух врагов: по оси с меньшим перекрытием оба летят друг от друга
+        rect, other_rect = self.rect, other.rect
+        overlap_x = min(rect.right, other_rect.right) - max(rect.left, other_rect.left)
+        overlap_y = min(rect.bottom, other_rect.bottom) - max(rect.top, other_rect.top)
+        axis = 0 if overlap_x <= overlap_y else 1
+        side = 1 if rect.center[axis] >= other_rect.center[axis] else -1
+        self.direction[axis] = side
+        other.direction[axis] = -side
+
+    def draw_rect(self, alpha=1.0):
+        # Положение для отрисовки между прошлым и текущим шагом
+        if alpha == 1.0:
+            return self.rect
+        prev_x, prev_y = self.prev_pos
+        return self.rect.move(round((prev_x - self.rect.x) * (1 - alpha)),
+                              round((prev_y - self.rect.y) * (1 - alpha)))
+
+    def draw(self, screen, alpha=1.0):
+        return screen.blit(get_sprite(self.rect.size, self.COLOR), self.draw_rect(alpha))
\ No newline at end of file
@@ -0,0 +1,204 @@
+import random
+
+import numpy as np
+import pygame
+
+from app.enemy import Enemy
+from app.sprites import blit_rects
+from app.swept import time_of_impact
+from app.sweep_prune import sweep_pairs
+
+
+class EnemyPool:
+    COLOR = (255, 0, 0)
+
+    ARRAYS = ('pos', 'prev_pos', 'vel', 'size', 'origin', 'origin_vel', 'origin_step')
+
+    def __init__(self, width, height, capacity=64, analytic=False, step_scale=1.0):
+        self.width = width
+        self.height = height
+        # Скорости vel - в пикселях за базовый шаг (60 Гц); шаг move() длится step_scale базовых шагов
+        self.step_scale = step_scale
+        self.count = 0
+        # Аналитическое движение: положение на шаге t вычисляется из начального состояния
+        # (треугольная волна по каждой оси), а не накапливается шаг за шагом. Выигрыш даёт только
+        # перемотка advance(), а Game шаги не пропускает: столкновения и появление врагов проверяются
+        # на каждом шаге, в том числе без окна и при повторе. Поэтому в обычной игре режим выключен
+        self.analytic = analytic
+        self.steps = 0  # число сделанных шагов move()
+        # Структура массивов: строка i - это враг i, координаты хранятся без округления
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev_pos = np.zeros((capacity, 2), dtype=np.float64)  # до последнего шага
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.size = np.zeros((capacity, 2), dtype=np.float64)
+        self.order = np.zeros(0, dtype=np.intp)  # порядок по левому краю с прошлого кадра
+        # Начальное состояние для аналитического движения: положение и скорость на шаге origin_step
+        self.origin = np.zeros((capacity, 2), dtype=np.float64)
+        self.origin_vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.origin_step = np.zeros(capacity, dtype=np.float64)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        capacity = len(self.pos) * 2
+        for name in self.ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=np.float64)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, pos, speed, direction, size=(32, 32)):
+        if self.count == len(self.pos):
+            self._grow()
+        i = self.count
+        self.pos[i] = pos
+        self.prev_pos[i] = pos
+        self.vel[i] = (speed * direction[0], speed * direction[1])
+        self.size[i] = size
+        self.origin[i] = pos
+        self.origin_vel[i] = self.vel[i]
+        self.origin_step[i] = self.steps
+        self.count += 1
+        self.order = np.append(self.order, i)
+        return i
+
+    def spawn(self, pos, size=(32, 32), rng=None):
+        # Те же случайные параметры, что и у Enemy
+        rng = rng if rng is not None else random
+        speed = rng.uniform(1, Enemy.MAX_SPEED)
+        direction = (rng.choice([-1, 1]), rng.choice([-1, 1]))
+        return self.add(pos, speed, direction, size)
+
+    def evaluate(self, step):
+        # Положения и текущие скорости на шаге step (может быть дробным) без пошагового интегрирования:
+        # по оси враг ходит между 0 и span = край - размер, путь - треугольная волна с периодом 2 * span
+        n = self.count
+        origin_vel = self.origin_vel[:n]
+        span = np.array((self.width, self.height), dtype=np.float64) - self.size[:n]
+        period = 2 * span
+        phase = origin_vel * ((step - self.origin_step[:n]) * self.step_scale)[:, None]
+        phase += self.origin[:n]
+        np.mod(phase, period, out=phase)
+        forward = phase <= span
+        return np.where(forward, phase, period - phase), np.where(forward, origin_vel, -origin_vel)
+
+    def rebase(self, indices):
+        # Скорость изменилась не по формуле (отскок от другого врага) - новое начало отсчёта
+        self.origin[indices] = self.pos[indices]
+        self.origin_vel[indices] = self.vel[indices]
+        self.origin_step[indices] = self.steps
+
+    def advance(self, steps):
+        # Перемотка на steps шагов вперёд за один расчёт; столкновения по пути не проверяются
+        if not self.analytic:
+            for _ in range(steps):
+                self.move()
+            return
+        n = self.count
+        self.steps += steps
+        # После одного шага прошлое положение - текущее; после перемотки его надо вычислить
+        self.prev_pos[:n] = self.pos[:n] if steps == 1 else self.evaluate(self.steps - 1)[0]
+        self.pos[:n], self.vel[:n] = self.evaluate(self.steps)
+
+    def move(self):
+        if self.analytic:
+            self.advance(1)
+            return
+        self.steps += 1
+        n = self.count
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        self.prev_pos[:n] = pos
+        pos += vel if self.step_scale == 1.0 else vel * self.step_scale
+
+        # Отражаем назад тех, кто достиг края экрана (как в Enemy.move)
+        far = pos + self.size[:n]
+        vel[:, 0] = np.where((pos[:, 0] <= 0) | (far[:, 0] >= self.width), -vel[:, 0], vel[:, 0])
+        vel[:, 1] = np.where((pos[:, 1] <= 0) | (far[:, 1] >= self.height), -vel[:, 1], vel[:, 1])
+
+    def collide(self, rect):
+        # Индексы врагов, чей AABB пересекается с rect (строго, как Rect.colliderect)
+        n = self.count
+        pos = self.pos[:n]
+        far = pos + self.size[:n]
+        hits = ((pos[:, 0] < rect.right) & (far[:, 0] > rect.left) &
+                (pos[:, 1] < rect.bottom) & (far[:, 1] > rect.top))
+        return np.flatnonzero(hits)
+
+    def sweep(self, rect, start):
+        # Непрерывная проверка: rect пришёл из start, враги - из prev_pos в pos за тот же шаг.
+        # Возвращает индексы задетых врагов и моменты первого касания
+        n = self.count
+        prev, pos, size = self.prev_pos[:n], self.pos[:n], self.size[:n]
+        # Широкая фаза: охват пути игрока против охвата пути каждого врага
+        area = rect.union(pygame.Rect(start, rect.size))
+        low = np.minimum(prev, pos)
+        high = np.maximum(prev, pos) + size
+        candidates = np.flatnonzero((low[:, 0] < area.right) & (high[:, 0] > area.left) &
+                                    (low[:, 1] < area.bottom) & (high[:, 1] > area.top))
+        if len(candidates) == 0:
+            return candidates, np.zeros(0)
+        impacts = time_of_impact(start, (rect.x - start[0], rect.y - start[1]), rect.size,
+                                 prev[candidates], pos[candidates] - prev[candidates], size[candidates])
+        hit = np.isfinite(impacts)
+        return candidates[hit], impacts[hit]
+
+    def remove(self, indices):
+        if len(indices) == 0:
+            return
+        n = self.count
+        keep = np.ones(n, dtype=bool)
+        keep[indices] = False
+        left = int(keep.sum())
+        for name in self.ARRAYS:
+            arr = getattr(self, name)
+            arr[:left] = arr[:n][keep]
+        self.count = left
+        # Индексы сдвинулись: переводим порядок на новые номера, не теряя упорядоченности
+        if len(self.order) == n:
+            new_index = np.cumsum(keep) - 1
+            self.order = new_index[self.order[keep[self.order]]]
+
+    def clear(self):
+        self.count = 0
+        self.order = np.zeros(0, dtype=np.intp)
+
+    def bounce(self):
+        # Столкновения врагов между собой: широкая фаза - sort-and-sweep по оси x,
+        # отскок как в Enemy.bounce - по оси меньшего перекрытия друг от друга
+        n = self.count
+        pos, size, vel = self.pos[:n], self.size[:n], self.vel[:n]
+        if len(self.order) != n:  # массивы меняли в обход add/remove
+            self.order = np.arange(n)
+        self.order, a, b = sweep_pairs(self.order, pos, size)
+        if len(a) == 0:
+            return 0
+        overlap = np.minimum(pos[a] + size[a], pos[b] + size[b]) - np.maximum(pos[a], pos[b])
+        axis = (overlap[:, 1] < overlap[:, 0]).astype(np.intp)
+        centers = pos + size / 2
+        side = np.where(centers[a, axis] >= centers[b, axis], 1.0, -1.0)
+        vel[a, axis] = np.abs(vel[a, axis]) * side
+        vel[b, axis] = -np.abs(vel[b, axis]) * side
+        if self.analytic:
+            self.rebase(np.concatenate((a, b)))
+        return len(a)
+
+    def positions(self, alpha=1.0):
+        # Положения, интерполированные между двумя последними шагами
+        n = self.count
+        if alpha == 1.0:
+            return self.pos[:n]
+        if self.analytic:
+            # Точное положение на дробном шаге: у стены путь отражается, а не срезается хордой
+            return self.evaluate(self.steps - 1 + alpha)[0]
+        prev = self.prev_pos[:n]
+        return prev + (self.pos[:n] - prev) * alpha
+
+    def rects(self, alpha=1.0):
+        n = self.count
+        boxes = np.concatenate((self.positions(alpha), self.size[:n]), axis=1).astype(int)
+        return [pygame.Rect(*box) for box in boxes.tolist()]
+
+    def draw(self, screen, alpha=1.0):
+        return blit_rects(screen, self.COLOR, self.rects(alpha))
@@ -0,0 +1,9 @@
+import pygame
+
+
+def wait_events(timeout=None):
+    # Спим до первого события (или до таймаута в мс), затем забираем всю очередь
+    first = pygame.event.wait() if timeout is None else pygame.event.wait(timeout)
+    events = [] if first.type == pygame.NOEVENT else [first]
+    events.extend(pygame.event.get())
+    return events
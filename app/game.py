@@ -1,211 +1,495 @@
-import random
-import pygame
-import time
-
-from app.bonus import Bonus
-from app.enemy import Enemy
-from app.inputBox import InputBox
-
-
-class Game:
-    def __init__(self, screen, difficulty):
-        global SCREEN_WIDTH, SCREEN_HEIGHT
-        SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_size()
-        self.screen = screen
-        self.difficulty = difficulty
-        if difficulty == 'Легкий':
-            self.spawn_interval = 2000
-            self.lives = 3
-        elif difficulty == 'Средний':
-            self.spawn_interval = 1500
-            self.lives = 2
-        else:
-            self.spawn_interval = 1000
-            self.lives = 1
-        self.clock = pygame.time.Clock()
-        self.player_name = ''
-        self.enemies = []
-        self.bonuses = []
-        self.start_time = None
-        self.last_spawn_time = None
-        self.elapsed_seconds = None
-        self.game_over = False
-        self.shield_active = False
-        self.shield_start_time = None
-        self.last_bonus_time = 0
-
-    def spawn_enemy(self, player_position):
-        safe_radius = 3 * 64
-
-        while True:
-            new_pos = (
-                random.randint(safe_radius, SCREEN_WIDTH - safe_radius - 32),
-                random.randint(safe_radius, SCREEN_HEIGHT - safe_radius - 32)
-            )
-            # Вычисляем расстояние между новой позицией и игроком
-            distance_to_player = ((new_pos[0] - player_position[0]) ** 2 +
-                                  (new_pos[1] - player_position[1]) ** 2) ** 0.5
-            if distance_to_player > safe_radius:
-                break
-
-        enemy = Enemy(new_pos, SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.enemies.append(enemy)
-
-    def check_collision(self, player_rect):
-        collision_occurred = False
-        enemies_to_remove = []
-        for i, enemy in enumerate(self.enemies):
-            if player_rect.colliderect(enemy.rect):
-                collision_occurred = True
-                enemies_to_remove.append(i)
-
-        for index in reversed(enemies_to_remove):
-            del self.enemies[index]
-
-        if collision_occurred and not self.shield_active:
-            self.lives -= 1
-            if self.lives <= 0:
-                print("Игра закончена!")
-                return True
-        return False
-
-    def format_time(self, seconds):
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}:{secs:02d}"
-
-    def process_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-        return True
-
-    def game_logic(self, current_time, player_position, player_speed):
-        # Перемещение игрока
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_w]: player_position[1] -= player_speed
-        if keys[pygame.K_a]: player_position[0] -= player_speed
-        if keys[pygame.K_s]: player_position[1] += player_speed
-        if keys[pygame.K_d]: player_position[0] += player_speed
-
-        # Ограничиваем передвижение игрока пределами экрана
-        player_position[0] = max(player_position[0], 0)
-        player_position[0] = min(player_position[0], SCREEN_WIDTH - self.ship_image.get_width())
-        player_position[1] = max(player_position[1], 0)
-        player_position[1] = min(player_position[1], SCREEN_HEIGHT - self.ship_image.get_height())
-
-        # Спавн врагов
-        if current_time - self.last_spawn_time > self.spawn_interval:
-            self.spawn_enemy(player_position)
-            self.last_spawn_time = current_time
-
-        # Обновляем положение и активность бонусов
-        for bonus in self.bonuses[:]:
-            bonus.update()
-            if not bonus.active:
-                self.bonuses.remove(bonus)
-
-        # Проверка столкновений с врагами
-        player_rect = pygame.Rect(*player_position, self.ship_image.get_width(), self.ship_image.get_height())
-        if self.check_collision(player_rect):
-            return False
-
-        # Появление новых бонусов каждые 7 секунд
-        if current_time - self.last_bonus_time > 7000:
-            bonus_type = random.choice(['shield', 'life'])
-            bonus_pos = [
-                random.randint(32, SCREEN_WIDTH - 64),
-                random.randint(32, SCREEN_HEIGHT - 64)
-            ]
-            bonus = Bonus(bonus_pos, bonus_type, SCREEN_WIDTH, SCREEN_HEIGHT)
-            self.bonuses.append(bonus)
-            self.last_bonus_time = current_time
-
-        # Проверка столкновений с бонусами
-        for bonus in self.bonuses[:]:
-            if player_rect.colliderect(bonus.rect):
-                if bonus.type_ == 'shield':
-                    self.shield_active = True
-                    self.shield_start_time = time.time()
-                elif bonus.type_ == 'life':
-                    self.lives += 1
-                self.bonuses.remove(bonus)
-
-        # Время действия щита истекло?
-        if self.shield_active and time.time() - self.shield_start_time > 5:
-            self.shield_active = False
-
-        return True
-
-    def render_game(self, player_position, formatted_time):
-        self.screen.fill((0, 0, 0))
-        self.screen.blit(self.ship_image, tuple(player_position))
-
-        # Рендер таймера
-        font = pygame.font.SysFont(None, 32)
-        timer_text = font.render(f"Время: {formatted_time}", True, (255, 255, 255))
-        lives_text = font.render(f'Жизни: {self.lives}', True, (255, 255, 255))
-        self.screen.blit(timer_text, (10, 10))
-        self.screen.blit(lives_text, (10, 50))
-
-        # Рендер щитов
-        if self.shield_active:
-            remaining_shield_time = max(0, 5 - (time.time() - self.shield_start_time))
-            shield_timer_text = font.render(f'Щит: {remaining_shield_time:.1f} сек.', True, (255, 255, 255))
-            self.screen.blit(shield_timer_text, (10, 80))
-
-        #Рисуем врагов
-        for enemy in self.enemies:
-            enemy.move()
-            enemy.draw(self.screen)
-        for bonus in self.bonuses:
-            bonus.draw(self.screen)
-
-        pygame.display.flip()
-
-    def collect_results(self):
-        input_box = InputBox(self.screen)
-        done = False
-        while not done:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.player_name = input_box.text.rstrip('\n')
-                    done = True
-                else:
-                    input_box.update([event])
-            input_box.draw(self.screen)
-            pygame.display.flip()
-        return {
-            'name': self.player_name,
-            'duration': self.elapsed_seconds,
-            'difficulty': self.difficulty
-        }
-
-    def run_game(self):
-        player_position = [400, 300]
-        player_speed = 5
-        original_ship_image = pygame.image.load('../assets/ship1.gif')
-        ship_size = (64, 64)
-        self.ship_image = pygame.transform.scale(original_ship_image, ship_size)
-
-        running = True
-        self.last_spawn_time = pygame.time.get_ticks()
-        self.start_time = pygame.time.get_ticks() / 1000
-        while running:
-            current_time = pygame.time.get_ticks()
-            self.elapsed_seconds = (current_time - self.start_time * 1000) / 1000
-            formatted_time = self.format_time(self.elapsed_seconds)
-
-            if not self.process_events():
-                break
-
-            running = self.game_logic(current_time, player_position, player_speed)
-
-            self.render_game(player_position, formatted_time)
-
-            self.clock.tick(60)
-
-        results = self.collect_results()
-        return results
\ No newline at end of file
+import gc
+import math
+import random
+import numpy as np
+import pygame
+
+from app.assets import assets as default_assets
+from app.bonus import Bonus
+from app.clock import SystemClock
+from app.dirty_rects import DirtyRectRenderer
+from app.enemy import Enemy
+from app.enemy_pool import EnemyPool
+from app.events import wait_events
+from app.inputBox import CARET_BLINK_MS, InputBox
+from app.object_pool import ObjectPool, RegisteredList, slot_append, swap_remove
+from app.profiler import FrameProfiler
+from app.replay import play
+from app.scheduler import Scheduler
+from app.spatial_hash import SpatialHash
+from app.swept import time_of_impact
+from app.sweep_prune import SweepAndPrune
+from app.sprites import blit_rects
+from app.text_cache import Label, get_font, render_text
+
+
+class Game:
+    PLAYER_START = (400, 300)
+    # Скорости игрока и врагов заданы в пикселях за шаг при BASE_RATE; при другой частоте шагов
+    # они умножаются на step_scale, чтобы скорость в пикселях в секунду не зависела от sim_rate
+    BASE_RATE = 60
+    PLAYER_SPEED = 5
+    SHIP_SIZE = (64, 64)
+    MAX_FRAME_TIME = 250  # мс; дольше кадр не догоняем, чтобы не уйти в "спираль смерти"
+    BONUS_INTERVAL = 7000  # мс
+    SHIELD_DURATION = 5  # сек.
+
+    def __init__(self, screen, difficulty, use_enemy_pool=False, input_source=None, time_source=None,
+                 sim_rate=60, render_rate=60, dirty_rects=False, records=None, seed=None,
+                 profiler=None, assets=None, enemy_collisions=False, analytic_enemies=False,
+                 swept_collisions=False):
+        global SCREEN_WIDTH, SCREEN_HEIGHT
+        SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_size()
+        self.screen = screen
+        self.difficulty = difficulty
+        if difficulty == 'Легкий':
+            self.spawn_interval = 2000
+            self.lives = 3
+        elif difficulty == 'Средний':
+            self.spawn_interval = 1500
+            self.lives = 2
+        else:
+            self.spawn_interval = 1000
+            self.lives = 1
+        self.clock = pygame.time.Clock()
+        # Источник нажатий (по умолчанию клавиатура) и источник времени
+        self.input_source = input_source if input_source is not None else pygame.key
+        self.time_source = time_source if time_source is not None else SystemClock()
+        # Собственный генератор случайных чисел: по сиду и нажатиям сессия повторяется точно
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.ship_size = self.SHIP_SIZE
+        # Частота шагов симуляции и частота отрисовки задаются независимо
+        self.sim_rate = sim_rate
+        self.render_rate = render_rate
+        self.step_scale = self.BASE_RATE / sim_rate
+        self.prev_player_position = None
+        self.hud = None  # Надписи HUD создаются при первой отрисовке
+        # Необязательная отрисовка только изменившихся областей вместо fill + flip
+        self.renderer = DirtyRectRenderer(screen) if dirty_rects else None
+        self.records = records  # Хранилище рекордов: по нему показываем место игрока
+        # Замер фаз кадра; по умолчанию выключен и почти ничего не стоит (F3 - оверлей, F4 - трасса)
+        self.profiler = profiler if profiler is not None else FrameProfiler(budget_ms=1000 / render_rate)
+        # Картинки загружаются один раз на процесс, а не при каждом запуске игры
+        self.assets = assets if assets is not None else default_assets
+        self.player_name = ''
+        # Отработавшие враги и бонусы переиспользуются вместо создания новых объектов
+        self.enemy_objects = ObjectPool(Enemy)
+        self.bonus_objects = ObjectPool(Bonus)
+        # Сетки для быстрого поиска соседей игрока среди врагов и бонусов
+        self.enemy_grid = SpatialHash(64)
+        self.bonus_grid = SpatialHash(64)
+        # Широкая фаза столкновений врагов между собой (sort-and-sweep по оси x)
+        self.enemy_sweep = SweepAndPrune()
+        # Списки врагов и бонусов - основное состояние: объекты, добавленные в них любым способом,
+        # сразу попадают в сетки и в широкую фазу, поэтому списки можно дополнять и подменять снаружи
+        self._enemies = RegisteredList(self.register_enemy, self.unregister_enemy)
+        self._bonuses = RegisteredList(self.bonus_grid.insert, self.bonus_grid.remove)
+        self.player_rect = pygame.Rect(0, 0, 0, 0)
+        # Векторизованное хранилище врагов: при нём список self.enemies не используется
+        if analytic_enemies and not use_enemy_pool:
+            raise ValueError("Аналитическое движение врагов поддерживается только вместе с use_enemy_pool")
+        self.enemy_pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT, analytic=analytic_enemies,
+                                    step_scale=self.step_scale) if use_enemy_pool else None
+        # Необязательные столкновения врагов между собой; флаг можно включить и после появления врагов
+        self.enemy_collisions = enemy_collisions
+        # Непрерывная проверка столкновений игрока с врагами по отрезкам движения за шаг:
+        # при низкой частоте шагов игрок и враг не проскакивают друг сквозь друга
+        self.swept_collisions = swept_collisions
+        self.impact_time = None  # момент первого касания (0..1 внутри шага) при последнем столкновении
+        self.start_time = None
+        self.last_spawn_time = None
+        self.session_start = None  # (last_spawn_time, start_time) в начале сессии
+        self.elapsed_seconds = None
+        self.game_over = False
+        self.lives_lost = 0  # столкновения без щита; бонусные жизни сюда не входят
+        self.shield_active = False
+        self.shield_start_time = None
+        self.last_bonus_time = 0
+        # Появление врагов и бонусов, исчезновение бонусов и конец щита - события в очереди по игровому времени
+        self.timers = Scheduler()
+        self.timer_keys = {}  # значения полей, по которым поставлен таймер
+        self.timer_handles = {}
+        self.bonus_timers = {}  # бонус -> таймер его исчезновения
+
+    def spawn_enemy(self, player_position):
+        safe_radius = 3 * 64
+
+        while True:
+            new_pos = (
+                self.rng.randint(safe_radius, SCREEN_WIDTH - safe_radius - 32),
+                self.rng.randint(safe_radius, SCREEN_HEIGHT - safe_radius - 32)
+            )
+            # Вычисляем расстояние между новой позицией и игроком
+            distance_to_player = ((new_pos[0] - player_position[0]) ** 2 +
+                                  (new_pos[1] - player_position[1]) ** 2) ** 0.5
+            if distance_to_player > safe_radius:
+                break
+
+        if self.enemy_pool is not None:
+            self.enemy_pool.spawn(new_pos, rng=self.rng)
+            return
+
+        enemy = self.enemy_objects.acquire(new_pos, SCREEN_WIDTH, SCREEN_HEIGHT, rng=self.rng)
+        slot_append(self.enemies, enemy)
+
+    @property
+    def enemies(self):
+        return self._enemies
+
+    @enemies.setter
+    def enemies(self, items):
+        self._enemies.clear()
+        self._enemies.extend(items)
+
+    @property
+    def bonuses(self):
+        return self._bonuses
+
+    @bonuses.setter
+    def bonuses(self, items):
+        self._bonuses.clear()
+        self._bonuses.extend(items)
+
+    def register_enemy(self, enemy):
+        enemy.grid = self.enemy_grid
+        self.enemy_grid.insert(enemy)
+        self.enemy_sweep.insert(enemy)
+
+    def unregister_enemy(self, enemy):
+        enemy.grid = None
+        self.enemy_grid.remove(enemy)
+        self.enemy_sweep.remove(enemy)
+
+    def check_collision(self, player_rect, player_start=None):
+        # player_start - положение игрока до шага; с ним и swept_collisions проверка непрерывная
+        swept = self.swept_collisions and player_start is not None
+        impacts = ()
+        if self.enemy_pool is not None:
+            if swept:
+                hit_indices, impacts = self.enemy_pool.sweep(player_rect, player_start)
+            else:
+                hit_indices = self.enemy_pool.collide(player_rect)
+            collision_occurred = len(hit_indices) > 0
+            self.enemy_pool.remove(hit_indices)
+        else:
+            grid = self.enemy_grid
+            if swept:
+                hit_enemies, impacts = self.sweep_enemies(grid, player_rect, player_start)
+            else:
+                hit_enemies = grid.colliding(player_rect)
+            collision_occurred = bool(hit_enemies)
+
+            for enemy in hit_enemies:
+                swap_remove(self.enemies, enemy)
+                self.enemy_objects.release(enemy)
+
+        self.impact_time = float(min(impacts)) if len(impacts) else None
+        if collision_occurred and not self.shield_active:
+            self.lives -= 1
+            self.lives_lost += 1
+            if self.lives <= 0:
+                print("Игра закончена!")
+                return True
+        return False
+
+    def sweep_enemies(self, grid, player_rect, player_start):
+        # Кандидаты из сетки: враг за шаг сдвигается не больше чем на MAX_SPEED по каждой оси,
+        # (с учётом длины шага), поэтому все, кого задел путь игрока, сейчас лежат в его охвате,
+        # расширенном на эту величину
+        area = player_rect.union(pygame.Rect(player_start, player_rect.size))
+        margin = 2 * math.ceil(Enemy.MAX_SPEED * self.step_scale + 1)
+        candidates = grid.colliding(area.inflate(margin, margin))
+        if not candidates:
+            return [], ()
+        starts = np.array([enemy.prev_pos for enemy in candidates], dtype=np.float64)
+        ends = np.array([enemy.rect.topleft for enemy in candidates], dtype=np.float64)
+        sizes = np.array([enemy.rect.size for enemy in candidates], dtype=np.float64)
+        impacts = time_of_impact(player_start, (player_rect.x - player_start[0], player_rect.y - player_start[1]),
+                                 player_rect.size, starts, ends - starts, sizes)
+        hit = np.isfinite(impacts)
+        return [enemy for enemy, is_hit in zip(candidates, hit) if is_hit], impacts[hit]
+
+    def format_time(self, seconds):
+        minutes = int(seconds // 60)
+        secs = int(seconds % 60)
+        return f"{minutes}:{secs:02d}"
+
+    def process_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F4 and self.profiler.enabled:
+                    print(f"Трасса кадров записана: {self.profiler.export_chrome_trace()}")
+        return True
+
+    def game_logic(self, current_time, player_position, player_speed):
+        # Перемещение игрока; player_speed - пикселей за базовый шаг
+        player_start = (player_position[0], player_position[1])
+        if self.step_scale != 1.0:
+            player_speed *= self.step_scale
+        keys = self.input_source.get_pressed()
+        if keys[pygame.K_w]: player_position[1] -= player_speed
+        if keys[pygame.K_a]: player_position[0] -= player_speed
+        if keys[pygame.K_s]: player_position[1] += player_speed
+        if keys[pygame.K_d]: player_position[0] += player_speed
+
+        # Ограничиваем передвижение игрока пределами экрана
+        player_position[0] = max(player_position[0], 0)
+        player_position[0] = min(player_position[0], SCREEN_WIDTH - self.ship_size[0])
+        player_position[1] = max(player_position[1], 0)
+        player_position[1] = min(player_position[1], SCREEN_HEIGHT - self.ship_size[1])
+
+        # Наступившие события: появление врагов и бонусов, исчезновение бонусов, конец щита
+        self.timers.advance(current_time)
+        self.sync_timers()
+        self.timers.run_due(player_position)
+
+        # Проверка столкновений с врагами
+        player_rect = self.player_rect
+        player_rect.update(*player_position, *self.ship_size)
+        with self.profiler.phase('check_collision'):
+            game_over = self.check_collision(player_rect, player_start)
+        if game_over:
+            return False
+
+        # Проверка столкновений с бонусами
+        for bonus in self.bonus_grid.colliding(player_rect):
+            if bonus.type_ == 'shield':
+                self.shield_active = True
+                self.shield_start_time = self.time_source.now()
+                self.rearm('shield', (True, self.shield_start_time), self.timers.time + self.SHIELD_DURATION * 1000,
+                           self.on_shield_timer)
+            elif bonus.type_ == 'life':
+                self.lives += 1
+            self.remove_bonus(bonus)
+
+        return True
+
+    def sync_timers(self):
+        # Поля состояния могли поменять при срабатывании или снаружи - тогда переставляем таймер.
+        # Проверяются три поля, сколько бы бонусов ни было на экране
+        key = (self.last_spawn_time, self.spawn_interval)
+        if self.timer_keys.get('spawn') != key:
+            self.rearm('spawn', key, self.last_spawn_time + self.spawn_interval, self.on_spawn_timer)
+        key = self.last_bonus_time
+        if self.timer_keys.get('bonus') != key:
+            self.rearm('bonus', key, self.last_bonus_time + self.BONUS_INTERVAL, self.on_bonus_timer)
+        key = (self.shield_active, self.shield_start_time)
+        if self.timer_keys.get('shield') != key:
+            due = None
+            if self.shield_active:
+                remaining = self.SHIELD_DURATION - (self.time_source.now() - self.shield_start_time)
+                due = self.timers.time + remaining * 1000
+            self.rearm('shield', key, due, self.on_shield_timer)
+
+    def rearm(self, name, key, due, callback):
+        timer = self.timer_handles.pop(name, None)
+        if timer is not None:
+            timer.cancel()
+        self.timer_keys[name] = key
+        if due is not None:
+            self.timer_handles[name] = self.timers.schedule_at(due, callback)
+
+    def on_spawn_timer(self, player_position):
+        self.spawn_enemy(player_position)
+        self.last_spawn_time = self.timers.time
+
+    def on_bonus_timer(self, player_position):
+        bonus_type = self.rng.choice(['shield', 'life'])
+        bonus_pos = [
+            self.rng.randint(32, SCREEN_WIDTH - 64),
+            self.rng.randint(32, SCREEN_HEIGHT - 64)
+        ]
+        bonus = self.bonus_objects.acquire(bonus_pos, bonus_type, SCREEN_WIDTH, SCREEN_HEIGHT,
+                                           time_source=self.time_source)
+        slot_append(self.bonuses, bonus)
+        self.bonus_timers[bonus] = self.timers.schedule(bonus.duration * 1000, self.on_bonus_expired, bonus)
+        self.last_bonus_time = self.timers.time
+
+    def on_bonus_expired(self, player_position, bonus):
+        bonus.active = False
+        self.remove_bonus(bonus)
+
+    def on_shield_timer(self, player_position):
+        self.shield_active = False
+
+    def remove_bonus(self, bonus):
+        timer = self.bonus_timers.pop(bonus, None)
+        if timer is not None:
+            timer.cancel()
+        self.bonus_grid.remove(bonus)
+        swap_remove(self.bonuses, bonus)
+        self.bonus_objects.release(bonus)
+
+    def move_enemies(self):
+        if self.enemy_pool is not None:
+            self.enemy_pool.move()
+        for enemy in self.enemies:
+            enemy.move(self.step_scale)
+        if self.enemy_collisions:
+            self.collide_enemies()
+
+    def collide_enemies(self):
+        if self.enemy_pool is not None:
+            return self.enemy_pool.bounce()
+        pairs = self.enemy_sweep.pairs()
+        for first, second in pairs:
+            first.bounce(second)
+        return len(pairs)
+
+    def step(self, sim_time, player_position, player_speed):
+        # Один шаг симуляции фиксированной длины; прошлое положение нужно для интерполяции
+        self.prev_player_position = tuple(player_position)
+        self.time_source.sync(sim_time)
+        with self.profiler.phase('game_logic'):
+            running = self.game_logic(sim_time, player_position, player_speed)
+        with self.profiler.phase('move_enemies'):
+            self.move_enemies()
+        return running
+
+    def interpolate_player(self, player_position, alpha):
+        if self.prev_player_position is None:
+            return tuple(player_position)
+        prev_x, prev_y = self.prev_player_position
+        return (prev_x + (player_position[0] - prev_x) * alpha,
+                prev_y + (player_position[1] - prev_y) * alpha)
+
+    def render_game(self, player_position, formatted_time, alpha=1.0):
+        # alpha - доля пути между двумя последними шагами симуляции
+        if self.renderer is not None:
+            self.renderer.begin_frame()
+        else:
+            self.screen.fill((0, 0, 0))
+        drawn = [self.screen.blit(self.ship_image, self.interpolate_player(player_position, alpha))]
+
+        # Рендер таймера
+        if self.hud is None:
+            font = get_font(None, 32)
+            self.hud = {'timer': Label(font), 'lives': Label(font), 'shield': Label(font)}
+        timer_text = self.hud['timer'].render(f"Время: {formatted_time}")
+        lives_text = self.hud['lives'].render(f'Жизни: {self.lives}')
+        drawn.append(self.screen.blit(timer_text, (10, 10)))
+        drawn.append(self.screen.blit(lives_text, (10, 50)))
+
+        # Рендер щитов
+        if self.shield_active:
+            remaining_shield_time = max(0, self.SHIELD_DURATION - (self.time_source.now() - self.shield_start_time))
+            shield_timer_text = self.hud['shield'].render(f'Щит: {remaining_shield_time:.1f} сек.')
+            drawn.append(self.screen.blit(shield_timer_text, (10, 80)))
+
+        #Рисуем врагов
+        with self.profiler.phase('draw_enemies'):
+            if self.enemy_pool is not None:
+                drawn.extend(self.enemy_pool.draw(self.screen, alpha))
+            drawn.extend(blit_rects(self.screen, Enemy.COLOR, [enemy.draw_rect(alpha) for enemy in self.enemies]))
+            for bonus_type, color in Bonus.COLORS.items():
+                rects = [bonus.rect for bonus in self.bonuses if bonus.type_ == bonus_type]
+                drawn.extend(blit_rects(self.screen, color, rects))
+
+        if self.profiler.overlay:
+            drawn.append(self.profiler.draw(self.screen))
+
+        with self.profiler.phase('display'):
+            if self.renderer is not None:
+                self.renderer.present(drawn)
+            else:
+                pygame.display.flip()
+
+    def placement_text(self):
+        if self.records is None or self.elapsed_seconds is None:
+            return None
+        return f'Ваше место: {self.records.rank_of(self.elapsed_seconds, self.difficulty)}'
+
+    def collect_results(self):
+        input_box = InputBox(self.screen)
+        placement = self.placement_text()
+        done = False
+        while not done:
+            input_box.draw(self.screen)
+            if placement is not None:
+                placement_surface = render_text(get_font(None, 32), placement, (255, 255, 255))
+                self.screen.blit(placement_surface,
+                                 placement_surface.get_rect(midbottom=(input_box.rect.centerx, input_box.rect.top - 20)))
+            pygame.display.flip()
+
+            # Между нажатиями спим; таймаут нужен только для мигания курсора
+            events = wait_events(CARET_BLINK_MS)
+            for event in events:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                    self.player_name = input_box.text.rstrip('\n')
+                    done = True
+                else:
+                    input_box.update([event])
+        return {
+            'name': self.player_name,
+            'duration': self.elapsed_seconds,
+            'difficulty': self.difficulty
+        }
+
+    def begin_session(self):
+        # Начало отсчёта игрового времени; запоминаем его для журнала ввода
+        self.last_spawn_time = self.time_source.ticks()
+        self.start_time = self.time_source.ticks() / 1000
+        self.session_start = (self.last_spawn_time, self.start_time)
+
+    def run_game(self):
+        player_position = list(self.PLAYER_START)
+        player_speed = self.PLAYER_SPEED
+        self.ship_image = self.assets.image('ship1.gif', self.ship_size)
+
+        running = True
+        step_ms = 1000 / self.sim_rate
+        self.begin_session()
+        sim_time = self.start_time * 1000
+        previous_ticks = sim_time
+        accumulator = 0
+        profiler = self.profiler
+        # Всё созданное до начала сессии (меню, шрифты, рекорды) сборщик мусора больше не обходит
+        gc.collect()
+        gc.freeze()
+        try:
+            while running:
+                profiler.begin_frame()
+                # Копим реальное время кадра и тратим его шагами симуляции постоянной длины
+                current_time = self.time_source.ticks()
+                accumulator += min(current_time - previous_ticks, self.MAX_FRAME_TIME)
+                previous_ticks = current_time
+
+                with profiler.phase('process_events'):
+                    keep_running = self.process_events()
+                if not keep_running:
+                    break
+
+                while running and accumulator >= step_ms:
+                    sim_time += step_ms
+                    running = self.step(sim_time, player_position, player_speed)
+                    accumulator -= step_ms
+
+                self.elapsed_seconds = (sim_time - self.start_time * 1000) / 1000
+                formatted_time = self.format_time(self.elapsed_seconds)
+                alpha = min(accumulator / step_ms, 1.0)
+                with profiler.phase('render_game'):
+                    self.render_game(player_position, formatted_time, alpha)
+
+                with profiler.phase('idle'):
+                    self.clock.tick(self.render_rate)
+        finally:
+            gc.unfreeze()
+
+        results = self.collect_results()
+        return results
+
+    def run_headless(self, max_frames=None):
+        # Симуляция без окна, отрисовки и clock.tick: шаги по 1000 / sim_rate мс подряд,
+        # тем же циклом, что и повтор журнала; длину кадра задаёт только sim_rate
+        self.begin_session()
+        play(self, max_frames)
+        return {
+            'name': self.player_name,
+            'duration': self.elapsed_seconds,
+            'difficulty': self.difficulty
+        }
\ No newline at end of file
@@ -0,0 +1,48 @@
+import pygame
+
+from app.clock import SimulatedClock
+
+
+class KeyState:
+    # Замена результата pygame.key.get_pressed() для набора нажатых клавиш
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    # Заранее записанные нажатия: по одному набору клавиш на кадр
+    def __init__(self, frames):
+        self.frames = [KeyState(keys) for keys in frames]
+        self.frame = 0
+
+    def get_pressed(self):
+        if self.frame >= len(self.frames):
+            return KeyState()
+        keys = self.frames[self.frame]
+        self.frame += 1
+        return keys
+
+
+class CallbackInput:
+    # Нажатия вычисляет функция policy(game) -> набор клавиш
+    def __init__(self, policy):
+        self.policy = policy
+        self.game = None
+
+    def get_pressed(self):
+        return KeyState(self.policy(self.game))
+
+
+def create_headless_game(difficulty, size=(1920, 1080), input_source=None, **options):
+    # Игра без окна: внеэкранная поверхность и симулированные часы
+    from app.game import Game
+
+    game = Game(pygame.Surface(size), difficulty,
+                input_source=input_source or ScriptedInput([]),
+                time_source=SimulatedClock(), **options)
+    if isinstance(input_source, CallbackInput):
+        input_source.game = game
+    return game
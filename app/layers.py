@@ -0,0 +1,45 @@
+import pygame
+
+from app.display import display_format
+
+
+class LayerCache:
+    # Неизменная часть экрана собирается в одну поверхность один раз для каждого размера окна
+    def __init__(self, background=(0, 0, 0)):
+        self.background = background
+        self.layers = {}
+
+    def __len__(self):
+        return len(self.layers)
+
+    def get(self, name, size, build):
+        key = (name, tuple(size))
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = pygame.Surface(key[1])
+            layer.fill(self.background)
+            build(layer)
+            layer = self.layers[key] = display_format(layer)
+        return layer
+
+    def clear(self):
+        self.layers.clear()
+
+
+def composite_highlight(screen, layer, highlights, previous, current, background=(0, 0, 0)):
+    # highlights - список (поверхность, rect) подсвеченных вариантов элементов.
+    # Без прошлого кадра выводится весь слой, иначе восстанавливается только старая подсветка
+    if previous is None:
+        screen.blit(layer, (0, 0))
+        dirty = [screen.get_rect()]
+    else:
+        previous_rect = highlights[previous][1]
+        screen.blit(layer, previous_rect, previous_rect)
+        dirty = [previous_rect]
+
+    surface, rect = highlights[current]
+    screen.fill(background, rect)
+    screen.blit(surface, rect)
+    if previous is not None:
+        dirty.append(rect)
+    return dirty
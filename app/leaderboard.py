@@ -0,0 +1,53 @@
+import bisect
+
+# Порядок в таблице рекордов: сначала сложный уровень, внутри уровня - по убыванию времени
+DIFFICULTY_RANK = {"Сложный": 1, "Средний": 2, "Легкий": 3}
+
+
+class Leaderboard:
+    # Отсортированный индекс таблицы рекордов: вставка и поиск места бинарным поиском
+    def __init__(self, records=()):
+        # Начальный индекс строим одной сортировкой, а не вставками по одной (это было бы O(n^2))
+        entries = sorted((self.make_key(record['duration'], record['difficulty'], seq), record)
+                         for seq, record in enumerate(records))
+        self.keys = [key for key, _ in entries]
+        self.rows = [record for _, record in entries]
+        self.next_seq = len(entries)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def make_key(self, duration, difficulty, seq):
+        # seq сохраняет порядок добавления среди равных результатов, как стабильная сортировка
+        return DIFFICULTY_RANK[difficulty], -duration, seq
+
+    def rank_of(self, duration, difficulty):
+        # Место (с единицы), которое займёт новый результат
+        key = self.make_key(duration, difficulty, self.next_seq)
+        return bisect.bisect_left(self.keys, key) + 1
+
+    def insert(self, record):
+        key = self.make_key(record['duration'], record['difficulty'], self.next_seq)
+        self.next_seq += 1
+        index = bisect.bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.rows.insert(index, record)
+        return index + 1
+
+    def page(self, offset=0, limit=None):
+        end = None if limit is None else offset + limit
+        return self.rows[offset:end]
+
+    def keyed_page(self, offset=0, limit=None):
+        # Страница вместе с ключами строк: от ключа крайней строки читается соседняя страница
+        end = None if limit is None else offset + limit
+        return list(zip(self.keys[offset:end], self.rows[offset:end]))
+
+    def page_after(self, key, limit):
+        start = bisect.bisect_right(self.keys, key)
+        return list(zip(self.keys[start:start + limit], self.rows[start:start + limit]))
+
+    def page_before(self, key, limit):
+        end = bisect.bisect_left(self.keys, key)
+        start = max(0, end - limit)
+        return list(zip(self.keys[start:end], self.rows[start:end]))
@@ -1,37 +1,85 @@
-import pygame
-from menu import Menu
-from app.game import Game
-
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-    pygame.display.set_caption("Космический боец")
-    clock = pygame.time.Clock()
-
-    menu = Menu(screen)
-
-    while True:
-        action = menu.show_menu()
-
-        if action == 'play':
-            level_difficulty = menu.select_level()
-            game = Game(screen, level_difficulty)
-            result = game.run_game()
-
-            if result is not None:
-                menu.records.save_record(result)
-
-        elif action == 'records':
-            menu.show_records()
-
-        elif action == 'help':
-            menu.show_help()
-
-        elif action == 'exit':
-            break
-
-    pygame.quit()
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+import time
+
+STARTED = time.perf_counter()  # до импорта pygame: его загрузка тоже входит во время запуска
+
+import argparse
+
+import pygame
+from menu import Menu
+from app.assets import assets
+from app.clock import StepClock
+from app.game import Game
+from app.records import SqliteRecords
+from app.replay import InputRecorder
+from app.startup import StartupTimer, init_pygame
+
+
+def open_records():
+    # Рекорды пишутся в фоне: после игры главный цикл не ждёт диска
+    records = SqliteRecords('../data/records.db', write_behind=True)
+    records.migrate_from_text('../data/records.txt')
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Космический боец')
+    parser.add_argument('--fast-start', action='store_true',
+                        help='инициализировать только окно и шрифты, без звука и джойстиков')
+    parser.add_argument('--startup-timings', action='store_true',
+                        help='вывести время этапов запуска до первого кадра меню')
+    args = parser.parse_args(argv)
+
+    timer = StartupTimer(STARTED)
+    timer.mark('импорт модулей')
+    init_pygame(fast=args.fast_start)
+    timer.mark('инициализация pygame')
+    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    pygame.display.set_caption("Космический боец")
+    clock = pygame.time.Clock()
+    timer.mark('создание окна')
+    # Картинки игры читаются в фоне, пока игрок смотрит на меню
+    assets.preload_async(['ship1.gif'])
+
+    # Рекорды открываются, только когда понадобятся: таблице рекордов или концу игры
+    menu = Menu(screen, open_records=open_records)
+    if args.startup_timings:
+        def report():
+            timer.mark('первый кадр меню')
+            print(timer.report())
+        menu.on_first_frame = report
+
+    try:
+        while True:
+            action = menu.show_menu()
+
+            if action == 'play':
+                level_difficulty = menu.select_level()
+                # Таймеры игры идут по шагам симуляции, а нажатия пишутся в журнал:
+                # последнюю сессию можно повторить через app.replay.replay
+                recorder = InputRecorder(pygame.key)
+                game = Game(screen, level_difficulty, use_enemy_pool=True, dirty_rects=True, enemy_collisions=True,
+                            swept_collisions=True, records=menu.records, input_source=recorder,
+                            time_source=StepClock())
+                result = game.run_game()
+                recorder.to_log(game).save('../data/last_session.rec')
+
+                if result is not None:
+                    menu.records.save_record(result)
+
+            elif action == 'records':
+                menu.show_records()
+
+            elif action == 'help':
+                menu.show_help()
+
+            elif action == 'exit':
+                break
+    finally:
+        # Очередь отложенных записей дописывается до выхода
+        if menu.store is not None:
+            menu.store.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
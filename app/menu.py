@@ -1,216 +1,276 @@
-import pygame
-from records import Records
-
-
-class Menu:
-    def __init__(self, screen):
-        self.screen = screen
-        self.records = Records()
-        self.width, self.height = screen.get_size()
-
-
-    def center_text(self, surface, y_pos):
-        rect = surface.get_rect(center=(self.width // 2, y_pos))
-        return rect
-
-    def show_menu(self):
-        font = pygame.font.Font(None, 36)
-        buttons = [
-            ('Играть', lambda: 'play'),
-            ('Рекорды', lambda: 'records'),
-            ('Помощь', lambda: 'help'),
-            ('Выход', lambda: 'exit')
-        ]
-
-        selected_button = 0
-        running = True
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        selected_button -= 1
-                    elif event.key == pygame.K_DOWN:
-                        selected_button += 1
-                    elif event.key == pygame.K_RETURN:
-                        return buttons[selected_button][1]()
-
-                    selected_button %= len(buttons)
-
-            self.screen.fill((0, 0, 0))
-
-            y_pos = self.height // 2 - len(buttons) * 25
-            for i, button in enumerate(buttons):
-                color = (255, 255, 255) if i != selected_button else (0, 255, 0)
-                text_surface = font.render(button[0], True, color)
-                rect = self.center_text(text_surface, y_pos)
-                self.screen.blit(text_surface, rect)
-                y_pos += 50
-
-            pygame.display.flip()
-
-    def select_level(self):
-        font = pygame.font.Font(None, 36)
-        levels = ['Легкий', 'Средний', 'Сложный']
-        selected_level = 0
-        running = True
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT:
-                        selected_level -= 1
-                    elif event.key == pygame.K_RIGHT:
-                        selected_level += 1
-                    elif event.key == pygame.K_RETURN:
-                        return levels[selected_level]
-
-                    selected_level %= len(levels)
-
-            self.screen.fill((0, 0, 0))
-
-            x_pos = self.width // 2 - len(levels) * 75 // 2
-            y_pos = self.height // 2
-
-            for i, level in enumerate(levels):
-                color = (255, 255, 255) if i != selected_level else (0, 255, 0)
-                text_surface = font.render(level, True, color)
-                rect = text_surface.get_rect(
-                    center=(x_pos + i * 150, y_pos))
-                self.screen.blit(text_surface, rect)
-
-            pygame.display.flip()
-
-    def show_records(self):
-        font = pygame.font.Font(None, 36)
-
-        records = self.records.load_records()
-
-        scroll_offset = 0
-        visible_rows = (self.height - 100) // 40
-        total_rows = len(records)
-
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    elif event.key == pygame.K_UP:
-                        scroll_offset = max(scroll_offset - 1, 0)
-                    elif event.key == pygame.K_DOWN and total_rows - visible_rows > 0:
-                        scroll_offset = min(scroll_offset + 1, total_rows - visible_rows)
-
-            self.screen.fill((0, 0, 0))
-
-            # Параметры таблицы
-            padding = 20
-            column_width_ratio = [0.1, 0.25, 0.4, 0.25]
-            column_widths = [w * (self.width - 2 * padding) for w in column_width_ratio]
-            table_x = padding
-            table_y = padding
-            row_height = 40
-            header_height = 60
-
-            title_headers = ["Место", "Имя игрока", "Продолжительность (сек)", "Сложность"]
-
-            # Линия сетки таблицы
-            pygame.draw.line(self.screen, (255, 255, 255), (table_x, table_y), (table_x + sum(column_widths), table_y),
-                             2)
-            pygame.draw.line(self.screen, (255, 255, 255), (table_x, table_y + header_height),
-                             (table_x + sum(column_widths), table_y + header_height), 2)
-            for i in range(visible_rows + 1):
-                pygame.draw.line(self.screen, (255, 255, 255), (table_x, table_y + header_height + i * row_height),
-                                 (table_x + sum(column_widths), table_y + header_height + i * row_height), 2)
-
-            current_x = table_x
-            for width in column_widths:
-                pygame.draw.line(self.screen, (255, 255, 255), (current_x, table_y),
-                                 (current_x, table_y + header_height + visible_rows * row_height), 2)
-                current_x += width
-            pygame.draw.line(self.screen, (255, 255, 255), (current_x, table_y),
-                             (current_x, table_y + header_height + visible_rows * row_height), 2)
-
-            # Наполнение таблицы данными
-            x_offset = table_x
-            for idx, header in enumerate(title_headers):
-                text_surface = font.render(header, True, (255, 255, 0))
-                text_rect = text_surface.get_rect(midtop=(x_offset + column_widths[idx] / 2, table_y + padding))
-                self.screen.blit(text_surface, text_rect)
-                x_offset += column_widths[idx]
-
-            # Данные игроков
-            y_pos = table_y + header_height
-            displayed_records = records[scroll_offset:scroll_offset + visible_rows]
-            for idx, record in enumerate(displayed_records):
-                true_row_idx = scroll_offset + idx + 1
-                columns = [
-                    str(true_row_idx),
-                    record["name"],
-                    "{:.2f}".format(record["duration"]),
-                    record["difficulty"].capitalize()
-                ]
-
-                x_offset = table_x
-                for col_idx, value in enumerate(columns):
-                    text_surface = font.render(value, True, (255, 255, 255))
-                    text_rect = text_surface.get_rect(midleft=(x_offset + padding, y_pos + padding))
-                    self.screen.blit(text_surface, text_rect)
-                    x_offset += column_widths[col_idx]
-
-                y_pos += row_height
-
-            pygame.display.flip()
-
-    def show_help(self):
-        title_font = pygame.font.SysFont('arial', 48, bold=True)
-        content_font = pygame.font.SysFont('verdana', 24)
-
-        help_title = "Справка по игре Космический боец"
-        help_lines = [
-            ("Управление:", ["WASD - движение"]),
-            ("Выход:", ["ESC - выход из игры"]),
-            ("Типы сущностей:", [
-                "- Красные: Противники, столкновение отнимает одну жизнь.",
-                "- Зелёные: Бонусы, увеличивают количество жизней на 1.",
-                "- Синие: Щиты, обеспечивают временную защиту."
-            ]),
-            ("Режимы сложности:", [
-                "- Легкий: Начальные жизни - 3, появление врагов каждые 2 сек.",
-                "- Средний: Начальные жизни - 2, враги каждые 1,5 сек.",
-                "- Сложный: Начальная жизнь - 1, враги каждый 1 сек."
-            ]),
-            ("Цель игры:", ["Продержитесь как можно дольше, избегайте столкновений с красными объектами."])
-        ]
-
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    running = False
-
-            self.screen.fill((0, 0, 0))
-
-            x_offset = 100
-            y_pos = 100
-
-            title_surface = title_font.render(help_title, True, (255, 255, 255))
-            title_rect = title_surface.get_rect(topleft=(x_offset, y_pos))
-            self.screen.blit(title_surface, title_rect)
-            y_pos += 60
-
-            # Вывод пунктов справки
-            for category, details in help_lines:
-                cat_surface = content_font.render(category, True, (255, 255, 0))
-                cat_rect = cat_surface.get_rect(topleft=(x_offset, y_pos))
-                self.screen.blit(cat_surface, cat_rect)
-                y_pos += 30
-
-                # Детализация каждого пункта
-                for detail in details:
-                    det_surface = content_font.render(detail, True, (255, 255, 255))
-                    det_rect = det_surface.get_rect(topleft=(x_offset + 20, y_pos))
-                    self.screen.blit(det_surface, det_rect)
-                    y_pos += 30
-
-            pygame.display.flip()
\ No newline at end of file
+import pygame
+from records import Records
+from app.events import wait_events
+from app.layers import LayerCache, composite_highlight
+from app.record_cursor import RecordCursor
+from app.text_cache import get_font, render_text
+
+
+class Menu:
+    def __init__(self, screen, records=None, open_records=Records):
+        self.screen = screen
+        # Хранилище рекордов открывается при первом обращении, а не до первого кадра меню
+        self.store = records
+        self.open_records = open_records
+        self.on_first_frame = None  # вызывается один раз, когда меню впервые показано на экране
+        self.width, self.height = screen.get_size()
+        self.layers = LayerCache()
+
+    @property
+    def records(self):
+        if self.store is None:
+            self.store = self.open_records()
+        return self.store
+
+
+    def center_text(self, surface, y_pos):
+        rect = surface.get_rect(center=(self.width // 2, y_pos))
+        return rect
+
+    def show_menu(self):
+        font = get_font(None, 36, system=False)
+        buttons = [
+            ('Играть', lambda: 'play'),
+            ('Рекорды', lambda: 'records'),
+            ('Помощь', lambda: 'help'),
+            ('Выход', lambda: 'exit')
+        ]
+
+        y_pos = self.height // 2 - len(buttons) * 25
+        labels = []
+        highlights = []
+        for i, button in enumerate(buttons):
+            text_surface = render_text(font, button[0], (255, 255, 255))
+            rect = self.center_text(text_surface, y_pos + i * 50)
+            labels.append((text_surface, rect))
+            highlights.append((render_text(font, button[0], (0, 255, 0)), rect))
+        layer = self.layers.get('menu', self.screen.get_size(), lambda surface: surface.blits(labels))
+
+        selected_button = 0
+        shown_button = None
+        running = True
+
+        while running:
+            # Поверх готового слоя перерисовываем только пункт, с которого ушла подсветка, и новый
+            if shown_button != selected_button:
+                pygame.display.update(composite_highlight(self.screen, layer, highlights, shown_button,
+                                                          selected_button))
+                shown_button = selected_button
+                if self.on_first_frame is not None:
+                    self.on_first_frame()
+                    self.on_first_frame = None
+
+            # Ждём ввода, не нагружая процессор: следующая перерисовка - только после события
+            for event in wait_events():
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_UP:
+                        selected_button -= 1
+                    elif event.key == pygame.K_DOWN:
+                        selected_button += 1
+                    elif event.key == pygame.K_RETURN:
+                        return buttons[selected_button][1]()
+
+                    selected_button %= len(buttons)
+
+    def select_level(self):
+        font = get_font(None, 36, system=False)
+        levels = ['Легкий', 'Средний', 'Сложный']
+
+        x_pos = self.width // 2 - len(levels) * 75 // 2
+        y_pos = self.height // 2
+        labels = []
+        highlights = []
+        for i, level in enumerate(levels):
+            text_surface = render_text(font, level, (255, 255, 255))
+            rect = text_surface.get_rect(center=(x_pos + i * 150, y_pos))
+            labels.append((text_surface, rect))
+            highlights.append((render_text(font, level, (0, 255, 0)), rect))
+        layer = self.layers.get('levels', self.screen.get_size(), lambda surface: surface.blits(labels))
+
+        selected_level = 0
+        shown_level = None
+        running = True
+
+        while running:
+            if shown_level != selected_level:
+                pygame.display.update(composite_highlight(self.screen, layer, highlights, shown_level,
+                                                          selected_level))
+                shown_level = selected_level
+
+            for event in wait_events():
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_LEFT:
+                        selected_level -= 1
+                    elif event.key == pygame.K_RIGHT:
+                        selected_level += 1
+                    elif event.key == pygame.K_RETURN:
+                        return levels[selected_level]
+
+                    selected_level %= len(levels)
+
+    def render_record_row(self, font, row_number, record, column_widths, row_height, padding):
+        # Строка таблицы собирается в одну поверхность и дальше выводится одним blit
+        row_surface = pygame.Surface((int(sum(column_widths)), row_height), pygame.SRCALPHA)
+        columns = [
+            str(row_number),
+            record["name"],
+            "{:.2f}".format(record["duration"]),
+            record["difficulty"].capitalize()
+        ]
+
+        x_offset = 0
+        for col_idx, value in enumerate(columns):
+            text_surface = font.render(value, True, (255, 255, 255))
+            text_rect = text_surface.get_rect(midleft=(x_offset + padding, padding))
+            row_surface.blit(text_surface, text_rect)
+            x_offset += column_widths[col_idx]
+        return row_surface
+
+    def show_records(self):
+        font = get_font(None, 36, system=False)
+
+        scroll_offset = 0
+        visible_rows = (self.height - 100) // 40
+        # Загружаем только видимое окно с запасом, а не всю таблицу
+        cursor = RecordCursor(self.records, visible_rows)
+        total_rows = len(cursor)
+        row_cache = {}
+
+        # Параметры таблицы
+        padding = 20
+        column_width_ratio = [0.1, 0.25, 0.4, 0.25]
+        column_widths = [w * (self.width - 2 * padding) for w in column_width_ratio]
+        table_x = padding
+        table_y = padding
+        row_height = 40
+        header_height = 60
+
+        title_headers = ["Место", "Имя игрока", "Продолжительность (сек)", "Сложность"]
+
+        def build_table(surface):
+            # Линия сетки таблицы
+            pygame.draw.line(surface, (255, 255, 255), (table_x, table_y), (table_x + sum(column_widths), table_y), 2)
+            pygame.draw.line(surface, (255, 255, 255), (table_x, table_y + header_height),
+                             (table_x + sum(column_widths), table_y + header_height), 2)
+            for i in range(visible_rows + 1):
+                pygame.draw.line(surface, (255, 255, 255), (table_x, table_y + header_height + i * row_height),
+                                 (table_x + sum(column_widths), table_y + header_height + i * row_height), 2)
+
+            current_x = table_x
+            for width in column_widths:
+                pygame.draw.line(surface, (255, 255, 255), (current_x, table_y),
+                                 (current_x, table_y + header_height + visible_rows * row_height), 2)
+                current_x += width
+            pygame.draw.line(surface, (255, 255, 255), (current_x, table_y),
+                             (current_x, table_y + header_height + visible_rows * row_height), 2)
+
+            # Заголовки столбцов
+            x_offset = table_x
+            for idx, header in enumerate(title_headers):
+                text_surface = render_text(font, header, (255, 255, 0))
+                text_rect = text_surface.get_rect(midtop=(x_offset + column_widths[idx] / 2, table_y + padding))
+                surface.blit(text_surface, text_rect)
+                x_offset += column_widths[idx]
+
+        # Сетка и заголовки не меняются - при прокрутке обновляется только область строк
+        layer = self.layers.get('records', self.screen.get_size(), build_table)
+        body_rect = pygame.Rect(0, table_y + header_height, self.width, self.height - table_y - header_height)
+        self.screen.blit(layer, (0, 0))
+        first_frame = True
+
+        running = True
+        needs_redraw = True
+        while running:
+            # Перерисовываем таблицу только после прокрутки
+            if needs_redraw:
+                needs_redraw = False
+                self.screen.blit(layer, body_rect, body_rect)
+
+                # Данные игроков
+                y_pos = table_y + header_height
+                displayed_records = cursor.rows(scroll_offset)
+                for idx, record in enumerate(displayed_records):
+                    row_index = scroll_offset + idx
+                    row_surface = row_cache.get(row_index)
+                    if row_surface is None:
+                        row_surface = self.render_record_row(font, row_index + 1, record, column_widths,
+                                                             row_height, padding)
+                        row_cache[row_index] = row_surface
+                    self.screen.blit(row_surface, (table_x, y_pos))
+                    y_pos += row_height
+
+                # Отрисованные строки храним только для загруженного окна
+                window_start, window_end = cursor.window_range()
+                for row_index in [i for i in row_cache if not window_start <= i < window_end]:
+                    del row_cache[row_index]
+
+                if first_frame:
+                    pygame.display.flip()
+                    first_frame = False
+                else:
+                    pygame.display.update(body_rect)
+
+            for event in wait_events():
+                if event.type == pygame.KEYDOWN:
+                    previous_offset = scroll_offset
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_UP:
+                        scroll_offset = max(scroll_offset - 1, 0)
+                    elif event.key == pygame.K_DOWN and total_rows - visible_rows > 0:
+                        scroll_offset = min(scroll_offset + 1, total_rows - visible_rows)
+                    needs_redraw = needs_redraw or scroll_offset != previous_offset
+
+    def show_help(self):
+        layer = self.layers.get('help', self.screen.get_size(), self.build_help)
+        self.screen.blit(layer, (0, 0))
+        pygame.display.flip()
+
+        running = True
+        while running:
+            for event in wait_events():
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
+
+    def build_help(self, surface):
+        title_font = get_font('arial', 48, bold=True)
+        content_font = get_font('verdana', 24)
+
+        help_title = "Справка по игре Космический боец"
+        help_lines = [
+            ("Управление:", ["WASD - движение"]),
+            ("Выход:", ["ESC - выход из игры"]),
+            ("Типы сущностей:", [
+                "- Красные: Противники, столкновение отнимает одну жизнь.",
+                "- Зелёные: Бонусы, увеличивают количество жизней на 1.",
+                "- Синие: Щиты, обеспечивают временную защиту."
+            ]),
+            ("Режимы сложности:", [
+                "- Легкий: Начальные жизни - 3, появление врагов каждые 2 сек.",
+                "- Средний: Начальные жизни - 2, враги каждые 1,5 сек.",
+                "- Сложный: Начальная жизнь - 1, враги каждый 1 сек."
+            ]),
+            ("Цель игры:", ["Продержитесь как можно дольше, избегайте столкновений с красными объектами."])
+        ]
+
+        x_offset = 100
+        y_pos = 100
+
+        title_surface = render_text(title_font, help_title, (255, 255, 255))
+        title_rect = title_surface.get_rect(topleft=(x_offset, y_pos))
+        surface.blit(title_surface, title_rect)
+        y_pos += 60
+
+        # Вывод пунктов справки
+        for category, details in help_lines:
+            cat_surface = render_text(content_font, category, (255, 255, 0))
+            cat_rect = cat_surface.get_rect(topleft=(x_offset, y_pos))
+            surface.blit(cat_surface, cat_rect)
+            y_pos += 30
+
+            # Детализация каждого пункта
+            for detail in details:
+                det_surface = render_text(content_font, detail, (255, 255, 255))
+                det_rect = det_surface.get_rect(topleft=(x_offset + 20, y_pos))
+                surface.blit(det_surface, det_rect)
+                y_pos += 30
\ No newline at end of file
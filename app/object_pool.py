@@ -0,0 +1,98 @@
+class ObjectPool:
+    # Свободный список отработавших объектов: acquire и release за O(1), без новых аллокаций
+    def __init__(self, cls, max_free=1024):
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            item = self.free.pop()
+            item.reset(*args, **kwargs)
+            return item
+        return self.cls(*args, **kwargs)
+
+    def release(self, item):
+        # Чужие объекты (например, подставленные в тестах) в пул не берём
+        if isinstance(item, self.cls) and len(self.free) < self.max_free:
+            self.free.append(item)
+
+
+def slot_append(items, item):
+    # Объект помнит свой индекс в списке, чтобы его можно было удалить без поиска
+    item.slot = len(items)
+    items.append(item)
+
+
+def swap_remove(items, item):
+    # Удаление за O(1): на место удаляемого встаёт последний элемент, порядок списка не сохраняется
+    slot = getattr(item, 'slot', None)
+    if not isinstance(slot, int) or slot >= len(items) or items[slot] is not item:
+        slot = items.index(item)  # список собрали снаружи, индексы не заполнены
+    # Перестановка идёт мимо обработчиков RegisteredList: последний элемент остаётся в списке,
+    # и снимать его с учёта не нужно - сообщаем только об удалённом
+    last = list.pop(items)
+    if last is not item:
+        list.__setitem__(items, slot, last)
+        last.slot = slot
+    if isinstance(items, RegisteredList):
+        items.on_remove(item)
+
+
+class RegisteredList(list):
+    # Список, который сообщает владельцу о каждом добавленном и убранном объекте: так сетки
+    # столкновений остаются в согласии со списком, кто бы его ни менял (append, присваивание, pop)
+    def __init__(self, on_add, on_remove, items=()):
+        super().__init__()
+        self.on_add = on_add
+        self.on_remove = on_remove
+        self.extend(items)
+
+    def append(self, item):
+        self.on_add(item)
+        super().append(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def insert(self, index, item):
+        self.on_add(item)
+        super().insert(index, item)
+
+    def __setitem__(self, index, value):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        new = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        for item in old:
+            self.on_remove(item)
+        for item in new:
+            self.on_add(item)
+
+    def __delitem__(self, index):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for item in old:
+            self.on_remove(item)
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self.on_remove(item)
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self.on_remove(item)
+
+    def clear(self):
+        items = list(self)
+        super().clear()
+        for item in items:
+            self.on_remove(item)
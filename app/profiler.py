@@ -0,0 +1,135 @@
+import json
+import math
+import os
+import time
+from collections import deque
+
+import pygame
+
+from app.text_cache import get_font
+
+
+class _NullPhase:
+    # Замер выключен: вход и выход ничего не делают
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class FrameProfiler:
+    # Время фаз кадра по монотонным часам perf_counter_ns: скользящие перцентили,
+    # график на экране и запись в формате Chrome trace (chrome://tracing, Perfetto)
+    OVERLAY_SIZE = (360, 220)
+    GRAPH_HEIGHT = 80
+
+    def __init__(self, window=300, budget_ms=1000 / 60, max_trace_events=200000, enabled=False,
+                 trace_filename='../data/frame_trace.json'):
+        self.enabled = enabled
+        self.overlay = False
+        self.window = window
+        self.budget_ms = budget_ms
+        self.trace_filename = trace_filename
+        self.samples = {}  # фаза -> последние window длительностей в мс
+        self.frame_times = deque(maxlen=window)
+        self.trace = deque(maxlen=max_trace_events)
+        self.frame_start = None
+
+    def toggle(self):
+        # Замеры идут, пока показан оверлей: без него они ничего не стоят
+        self.overlay = not self.overlay
+        self.enabled = self.overlay
+        self.frame_start = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self.frame_start is not None:
+            self.frame_times.append((now - self.frame_start) / 1e6)
+            self.trace.append({'name': 'frame', 'ph': 'X', 'ts': self.frame_start / 1000,
+                               'dur': (now - self.frame_start) / 1000, 'pid': 1, 'tid': 0})
+        self.frame_start = now
+
+    def record(self, name, start_ns, end_ns):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append((end_ns - start_ns) / 1e6)
+        self.trace.append({'name': name, 'ph': 'X', 'ts': start_ns / 1000, 'dur': (end_ns - start_ns) / 1000,
+                           'pid': 1, 'tid': 1})
+
+    def percentile(self, name, q):
+        # Перцентиль q (0-100) методом ближайшего ранга, в мс
+        values = self.frame_times if name == 'frame' else self.samples.get(name, ())
+        if not values:
+            return None
+        ordered = sorted(values)
+        index = max(0, min(len(ordered), math.ceil(q / 100 * len(ordered))) - 1)
+        return ordered[index]
+
+    def stats(self):
+        names = (['frame'] if self.frame_times else []) + list(self.samples)
+        return {name: {'p50': self.percentile(name, 50), 'p95': self.percentile(name, 95),
+                       'p99': self.percentile(name, 99)} for name in names}
+
+    def export_chrome_trace(self, filename=None):
+        filename = filename or self.trace_filename
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, 'w') as file:
+            json.dump({'traceEvents': list(self.trace), 'displayTimeUnit': 'ms'}, file)
+        return filename
+
+    def draw(self, screen):
+        # Полупрозрачная панель в правом верхнем углу: столбики времени кадров и перцентили фаз
+        width, height = self.OVERLAY_SIZE
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        graph_height = self.GRAPH_HEIGHT
+        frames = list(self.frame_times)[-width:]
+        scale = graph_height / max([2 * self.budget_ms] + frames)
+        for x, frame_ms in enumerate(frames):
+            color = (0, 200, 0) if frame_ms <= self.budget_ms else (220, 0, 0)
+            pygame.draw.line(panel, color, (x, graph_height), (x, graph_height - int(frame_ms * scale)))
+        budget_y = graph_height - int(self.budget_ms * scale)
+        pygame.draw.line(panel, (255, 255, 0), (0, budget_y), (width, budget_y))
+
+        font = get_font(None, 20)
+        y_pos = graph_height + 4
+        for name, values in self.stats().items():
+            line = f"{name}: p50 {values['p50']:.2f}  p95 {values['p95']:.2f}  p99 {values['p99']:.2f} мс"
+            panel.blit(font.render(line, True, (255, 255, 255)), (4, y_pos))
+            y_pos += 16
+            if y_pos > height - 16:
+                break
+
+        return screen.blit(panel, (screen.get_width() - width, 0))
@@ -0,0 +1,51 @@
+class RecordCursor:
+    # Окно рекордов вокруг видимой части таблицы; остальное не загружается.
+    # При прокрутке окно дочитывается от ключа крайней строки (keyset), а не через LIMIT/OFFSET:
+    # хранилище не пропускает offset строк, поэтому подгрузка в конце таблицы не дороже, чем в начале
+    def __init__(self, records, page_size, prefetch=None):
+        self.records = records
+        self.page_size = page_size
+        self.prefetch = page_size if prefetch is None else prefetch
+        self.total = records.count()
+        self.window_start = 0
+        self.window = []
+        self.keys = []  # ключи строк окна в хранилище
+        self.loaded = False
+
+    def __len__(self):
+        return self.total
+
+    def in_window(self, offset):
+        window_end = self.window_start + len(self.window)
+        wanted_end = min(offset + self.page_size, self.total)
+        return self.loaded and self.window_start <= offset and wanted_end <= window_end
+
+    def rows(self, offset):
+        # Видимые строки начиная с offset; при выходе за окно подгружаем его заново с запасом
+        if not self.in_window(offset):
+            self.load(max(0, offset - self.prefetch))
+        begin = offset - self.window_start
+        return self.window[begin:begin + self.page_size]
+
+    def load(self, start):
+        size = self.page_size + 2 * self.prefetch
+        entries = list(zip(self.keys, self.window))
+        window_end = self.window_start + len(self.window)
+        if self.window and self.window_start < start <= window_end:
+            # Прокрутка вниз: общую часть окна оставляем, недостающее читаем после последней строки
+            kept = entries[start - self.window_start:]
+            entries = kept + self.records.records_after(self.keys[-1], size - len(kept))
+        elif self.window and start < self.window_start < start + size:
+            # Прокрутка вверх: читаем строки перед первой строкой окна
+            entries = self.records.records_before(self.keys[0], self.window_start - start) + entries
+            entries = entries[:size]
+        else:
+            # Первое окно или прыжок далеко от текущего окна
+            entries = self.records.keyed_records(limit=size, offset=start)
+        self.keys = [key for key, _ in entries]
+        self.window = [record for _, record in entries]
+        self.window_start = start
+        self.loaded = True
+
+    def window_range(self):
+        return self.window_start, self.window_start + len(self.window)
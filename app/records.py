@@ -1,30 +1,354 @@
-import sqlite3
-
-
-class Records:
-    def __init__(self, filename="../data/records.txt"):
-        self.filename = filename
-
-    def save_record(self, data):
-        with open(self.filename, "a") as file:
-            file.write(f"{data['name']}, {data['duration']:.2f}, {data['difficulty']}\n")
-
-    def load_records(self):
-        try:
-            with open(self.filename, "r") as file:
-                lines = file.readlines()
-                records = []
-                for line in lines:
-                    parts = line.strip().split(',')
-                    records.append({
-                        'name': parts[0].strip(),
-                        'duration': float(parts[1]),
-                        'difficulty': parts[2].strip()
-                    })
-
-                sorted_records = sorted(records,
-                                        key=lambda r: ({"Сложный": 1, "Средний": 2, "Легкий": 3}[r['difficulty']],
-                                                       -r['duration']))
-                return sorted_records
-        except FileNotFoundError:
-            return []
\ No newline at end of file
+import logging
+import os
+import queue
+import sqlite3
+import threading
+
+from app.leaderboard import DIFFICULTY_RANK, Leaderboard
+
+
+def parse_record(line):
+    parts = line.strip().split(',')
+    return {
+        'name': parts[0].strip(),
+        'duration': float(parts[1]),
+        'difficulty': parts[2].strip()
+    }
+
+
+def format_record(data):
+    return f"{data['name']}, {data['duration']:.2f}, {data['difficulty']}\n"
+
+
+def stored_record(data):
+    # Запись в том виде, в каком она читается обратно: время округлено до сотых
+    return {'name': data['name'], 'duration': round(data['duration'], 2), 'difficulty': data['difficulty']}
+
+
+_STOP = object()
+log = logging.getLogger(__name__)
+
+
+class RecordWriter:
+    # Отложенная запись рекордов в фоновом потоке: главный цикл только кладёт запись в очередь.
+    # Очередь ограничена, поэтому при зависшем диске save_record в худшем случае подождёт,
+    # а не накопит неограниченно много. Записи пишутся пачками - один flush/fsync на пачку
+    def __init__(self, write_batch, max_pending=256, batch_size=64):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.unwritten = []  # записи из неудавшейся пачки, повторяются со следующей
+        self.error = None
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name='records-writer', daemon=True)
+        self.thread.start()
+
+    def write(self, record):
+        if self.closed:
+            raise ValueError("Запись рекорда после закрытия хранилища")
+        self.queue.put(record)
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is _STOP
+            try:
+                self.write_pending([record for record in batch if record is not _STOP])
+            except Exception as error:
+                # Неожиданная ошибка (например, испорченная запись): повтор её не исправит, поэтому
+                # пачку отбрасываем, а поток продолжает работу - иначе flush и close ждали бы вечно
+                log.exception("Не удалось записать пачку рекордов")
+                self.unwritten = []
+                self.error = error
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if stop:
+                return
+
+    def write_pending(self, records):
+        records = self.unwritten + records
+        if not records:
+            return
+        try:
+            self.write_batch(records)
+        except (OSError, sqlite3.Error) as error:
+            self.unwritten = records
+            self.error = error
+        else:
+            self.unwritten = []
+            self.error = None
+
+    def flush(self):
+        # Ждём, пока всё поставленное в очередь дойдёт до диска: после этого чтение видит свои записи
+        self.queue.join()
+
+    def close(self):
+        # Дописываем очередь и останавливаем поток; ошибку последней записи сообщаем здесь
+        if not self.closed:
+            self.closed = True
+            self.queue.put(_STOP)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+class Records:
+    def __init__(self, filename="../data/records.txt", write_behind=False, max_pending=256, encoding=None):
+        self.filename = filename
+        self.encoding = encoding  # None - кодировка системы, как было до появления параметра
+        self.index = None  # Индекс таблицы рекордов, читается из файла один раз
+        # Необязательная запись в фоне: на сетевом диске дозапись файла может занимать сотни мс
+        self.writer = RecordWriter(self.append_records, max_pending) if write_behind else None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+    def append_records(self, records):
+        with open(self.filename, "a", encoding=self.encoding) as file:
+            file.writelines(format_record(record) for record in records)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def leaderboard(self):
+        if self.index is None:
+            self.index = Leaderboard(self.read_records())
+        return self.index
+
+    def save_record(self, data):
+        # Индекс читаем до записи, иначе новая строка попадёт в него дважды: из файла и через insert
+        index = self.leaderboard()
+        if self.writer is not None:
+            self.writer.write(data)
+        else:
+            with open(self.filename, "a", encoding=self.encoding) as file:
+                file.write(format_record(data))
+        # Возвращаем занятое место; индекс обновляем без пересортировки
+        return index.insert(stored_record(data))
+
+    def rank_of(self, duration, difficulty):
+        return self.leaderboard().rank_of(round(duration, 2), difficulty)
+
+    def read_records(self):
+        # Записи в порядке файла, без сортировки; отложенные записи сначала дописываются
+        if self.writer is not None:
+            self.writer.flush()
+        try:
+            with open(self.filename, "r", encoding=self.encoding) as file:
+                return [parse_record(line) for line in file if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def load_records(self, limit=None, offset=0):
+        return self.leaderboard().page(offset, limit)
+
+    def keyed_records(self, limit=None, offset=0):
+        return self.leaderboard().keyed_page(offset, limit)
+
+    def records_after(self, key, limit):
+        return self.leaderboard().page_after(key, limit)
+
+    def records_before(self, key, limit):
+        return self.leaderboard().page_before(key, limit)
+
+    def count(self):
+        return len(self.leaderboard())
+
+
+def insert_rows(connection, records):
+    connection.executemany(
+        "INSERT INTO records (name, duration, difficulty, difficulty_rank) VALUES (?, ?, ?, ?)",
+        [(r['name'], round(r['duration'], 2), r['difficulty'], DIFFICULTY_RANK[r['difficulty']])
+         for r in records])
+
+
+def insert_records(connection, records):
+    # Одна транзакция на пачку: фиксация (и синхронизация с диском) один раз
+    with connection:
+        insert_rows(connection, records)
+
+
+# Порядок таблицы рекордов; id (он же rowid) хранится в конце индекса records_leaderboard,
+# поэтому и прямой, и обратный порядок читаются по индексу без сортировки
+TABLE_ORDER = "difficulty_rank, duration DESC, id"
+REVERSED_TABLE_ORDER = "difficulty_rank DESC, duration, id DESC"
+KEYED_COLUMNS = "difficulty_rank, duration, id, name, difficulty"
+
+
+def keyed_row(row):
+    rank, duration, row_id, name, difficulty = row
+    return (rank, duration, row_id), {'name': name, 'duration': duration, 'difficulty': difficulty}
+
+
+# Текстовый файл рекордов писался в кодировке системы: под Windows это cp1251 (так сохранён
+# data/records.txt), под Linux и macOS - UTF-8. Русский текст в cp1251 почти никогда не бывает
+# корректным UTF-8, поэтому UTF-8 пробуем первой
+TEXT_ENCODINGS = ('utf-8', 'cp1251')
+
+
+def read_text_records(filename, encodings=TEXT_ENCODINGS):
+    for encoding in encodings[:-1]:
+        try:
+            return Records(filename, encoding=encoding).read_records()
+        except UnicodeDecodeError:
+            pass
+    return Records(filename, encoding=encodings[-1]).read_records()
+
+
+class SqliteRecords:
+    def __init__(self, filename="../data/records.db", write_behind=False, max_pending=256):
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "id INTEGER PRIMARY KEY, name TEXT NOT NULL, duration REAL NOT NULL, "
+            "difficulty TEXT NOT NULL, difficulty_rank INTEGER NOT NULL)")
+        # Индекс повторяет порядок таблицы рекордов, поэтому top-N читается без сортировки
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS records_leaderboard "
+            "ON records (difficulty_rank, duration DESC)")
+        self.connection.commit()
+        self.index = None  # Индекс таблицы рекордов в памяти, читается из базы один раз
+        self.index_version = None  # PRAGMA data_version, при котором индекс сверялся с базой
+        # Фоновый поток пишет через своё соединение; главное соединение им не пользуется одновременно
+        self.writer = None
+        self.writer_connection = None
+        if write_behind:
+            self.writer_connection = sqlite3.connect(filename, check_same_thread=False)
+            self.writer = RecordWriter(lambda records: insert_records(self.writer_connection, records),
+                                       max_pending)
+
+    def close(self):
+        try:
+            if self.writer is not None:
+                self.writer.close()
+        finally:
+            if self.writer_connection is not None:
+                self.writer_connection.close()
+            self.connection.close()
+
+    def sync(self):
+        # Чтение видит собственные отложенные записи
+        if self.writer is not None:
+            self.writer.flush()
+
+    def data_version(self):
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def check_index(self):
+        # data_version меняется, когда в базу пишет другое соединение: другая касса с общей базой
+        # или наш фоновый поток. Свои записи в индексе уже есть - тогда число строк совпадает,
+        # иначе индекс перечитываем, чтобы место и число записей не расходились со страницами из SQL
+        if self.index is None or self.data_version() == self.index_version:
+            return
+        self.sync()
+        version = self.data_version()
+        count = self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        if count == len(self.index):
+            self.index_version = version
+        else:
+            self.index = None
+
+    def leaderboard(self):
+        self.check_index()
+        if self.index is None:
+            self.sync()
+            self.index_version = self.data_version()
+            rows = self.connection.execute("SELECT name, duration, difficulty FROM records ORDER BY id")
+            self.index = Leaderboard({'name': name, 'duration': duration, 'difficulty': difficulty}
+                                     for name, duration, difficulty in rows)
+        return self.index
+
+    def save_record(self, data):
+        # Место берём из индекса в памяти: при отложенной записи главный цикл не ждёт очередь и базу.
+        # Индекс читаем до записи, иначе новая строка попадёт в него дважды
+        index = self.leaderboard()
+        if self.writer is not None:
+            self.writer.write(data)
+        else:
+            insert_records(self.connection, [data])
+        return index.insert(stored_record(data))
+
+    def rank_of(self, duration, difficulty):
+        # Бинарный поиск по индексу в памяти вместо COUNT по базе (на миллионе строк - сотни мс)
+        return self.leaderboard().rank_of(round(duration, 2), difficulty)
+
+    def save_records(self, records):
+        self.sync()
+        insert_records(self.connection, records)
+        if self.index is not None:
+            for record in records:
+                self.index.insert(stored_record(record))
+
+    def load_records(self, limit=None, offset=0):
+        return [record for _, record in self.keyed_records(limit, offset)]
+
+    def keyed_records(self, limit=None, offset=0):
+        # Строки вместе с ключом (difficulty_rank, duration, id) - по нему читается соседняя страница
+        self.sync()
+        rows = self.connection.execute(
+            f"SELECT {KEYED_COLUMNS} FROM records ORDER BY {TABLE_ORDER} LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset))
+        return [keyed_row(row) for row in rows]
+
+    def records_after(self, key, limit):
+        # Страница после строки key без OFFSET: условие (difficulty_rank, -duration, id) > key
+        # разбито на три диапазона индекса, каждый читается с нужного места без пропуска строк
+        rank, duration, row_id = key
+        return self.keyed_ranges(
+            [("difficulty_rank = ? AND duration = ? AND id > ?", (rank, duration, row_id)),
+             ("difficulty_rank = ? AND duration < ?", (rank, duration)),
+             ("difficulty_rank > ?", (rank,))],
+            TABLE_ORDER, limit)
+
+    def records_before(self, key, limit):
+        # То же в обратную сторону: индекс читается с конца, строки разворачиваются в порядок таблицы
+        rank, duration, row_id = key
+        rows = self.keyed_ranges(
+            [("difficulty_rank = ? AND duration = ? AND id < ?", (rank, duration, row_id)),
+             ("difficulty_rank = ? AND duration > ?", (rank, duration)),
+             ("difficulty_rank < ?", (rank,))],
+            REVERSED_TABLE_ORDER, limit)
+        rows.reverse()
+        return rows
+
+    def keyed_ranges(self, ranges, order, limit):
+        self.sync()
+        rows = []
+        for condition, params in ranges:
+            if len(rows) >= limit:
+                break
+            rows += self.connection.execute(
+                f"SELECT {KEYED_COLUMNS} FROM records WHERE {condition} ORDER BY {order} LIMIT ?",
+                (*params, limit - len(rows)))
+        return [keyed_row(row) for row in rows]
+
+    def count(self):
+        self.check_index()
+        if self.index is not None:
+            return len(self.index)
+        self.sync()
+        return self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def migrate_from_text(self, text_filename="../data/records.txt", encodings=TEXT_ENCODINGS):
+        # Однократный перенос рекордов из текстового файла; факт переноса помним в user_version.
+        # Строки и user_version фиксируются одной транзакцией: после сбоя перенос повторится целиком,
+        # а не добавит записи второй раз
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= 1:
+            return 0
+        records = read_text_records(text_filename, encodings) if os.path.exists(text_filename) else []
+        self.sync()
+        with self.connection:
+            insert_rows(self.connection, records)
+            self.connection.execute("PRAGMA user_version = 1")
+        if self.index is not None:
+            for record in records:
+                self.index.insert(stored_record(record))
+        return len(records)
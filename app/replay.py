@@ -0,0 +1,142 @@
+import struct
+
+import pygame
+
+from app.clock import SimulatedClock, StepClock
+from app.headless import KeyState
+
+# Заголовок журнала: метка, версия, сложность, флаги настроек Game, размер экрана, частота шагов,
+# сид и начало отсчёта времени
+HEADER = struct.Struct('<4sBBBHHHQId')
+MAGIC = b'SFRP'
+VERSION = 2  # версия 1 не хранила настройки Game, и повтор расходился с записью
+DIFFICULTIES = ['Легкий', 'Средний', 'Сложный']
+# Настройки Game, от которых зависит симуляция; в заголовке - по биту на настройку
+OPTION_FLAGS = ('use_enemy_pool', 'enemy_collisions', 'analytic_enemies', 'swept_collisions')
+# Каждому шагу симуляции соответствует один байт: по биту на клавишу
+KEY_BITS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+
+def pack_keys(keys):
+    mask = 0
+    for bit, key in enumerate(KEY_BITS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def unpack_keys(mask):
+    return KeyState(key for bit, key in enumerate(KEY_BITS) if mask & (1 << bit))
+
+
+def game_options(game):
+    return {'use_enemy_pool': game.enemy_pool is not None,
+            'enemy_collisions': game.enemy_collisions,
+            'analytic_enemies': game.enemy_pool is not None and game.enemy_pool.analytic,
+            'swept_collisions': game.swept_collisions}
+
+
+class InputLog:
+    def __init__(self, difficulty, size, sim_rate, seed, session_start, frames=b'', options=None):
+        self.difficulty = difficulty
+        self.size = tuple(size)
+        self.sim_rate = sim_rate
+        self.seed = seed
+        self.session_start = tuple(session_start)  # (last_spawn_time, start_time) из Game
+        self.frames = bytes(frames)
+        self.options = {name: False for name in OPTION_FLAGS}
+        self.options.update(options or {})
+
+    def __len__(self):
+        return len(self.frames)
+
+    def to_bytes(self):
+        spawn_ticks, start_time = self.session_start
+        flags = sum(1 << bit for bit, name in enumerate(OPTION_FLAGS) if self.options[name])
+        header = HEADER.pack(MAGIC, VERSION, DIFFICULTIES.index(self.difficulty), flags, self.size[0],
+                             self.size[1], self.sim_rate, self.seed, spawn_ticks, start_time)
+        return header + self.frames
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ValueError("Журнал ввода повреждён: нет заголовка")
+        magic, version, difficulty, flags, width, height, sim_rate, seed, spawn_ticks, start_time = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Неизвестный формат журнала ввода")
+        options = {name: bool(flags & (1 << bit)) for bit, name in enumerate(OPTION_FLAGS)}
+        return cls(DIFFICULTIES[difficulty], (width, height), sim_rate, seed, (spawn_ticks, start_time),
+                   data[HEADER.size:], options)
+
+    def save(self, filename):
+        with open(filename, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+
+class InputRecorder:
+    # Пропускает нажатия от источника и пишет их в журнал по байту на шаг
+    def __init__(self, source):
+        self.source = source
+        self.frames = bytearray()
+
+    def get_pressed(self):
+        keys = self.source.get_pressed()
+        self.frames.append(pack_keys(keys))
+        return keys
+
+    def to_log(self, game):
+        return InputLog(game.difficulty, game.screen.get_size(), game.sim_rate, game.seed, game.session_start,
+                        self.frames, game_options(game))
+
+
+class ReplayInput:
+    # Нажатия из журнала; после его конца клавиши отпущены
+    def __init__(self, log):
+        self.frames = log.frames
+        self.frame = 0
+
+    def get_pressed(self):
+        if self.frame >= len(self.frames):
+            return KeyState()
+        keys = unpack_keys(self.frames[self.frame])
+        self.frame += 1
+        return keys
+
+
+def play(game, steps=None):
+    # Шаги симуляции подряд, с тем же накоплением времени, что и в Game.run_game;
+    # steps=None - до конца игры
+    step_ms = 1000 / game.sim_rate
+    player_position = list(game.PLAYER_START)
+    sim_time = game.start_time * 1000
+    running = True
+    done = 0
+    while running and (steps is None or done < steps):
+        sim_time += step_ms
+        running = game.step(sim_time, player_position, game.PLAYER_SPEED)
+        done += 1
+    game.elapsed_seconds = (sim_time - game.start_time * 1000) / 1000
+    game.game_over = not running
+    return player_position
+
+
+def replay(log, **options):
+    # Повтор записанной сессии без окна: тот же сид, те же нажатия, то же игровое время и настройки
+    # Game из журнала; options дополняют или переопределяют их
+    from app.game import Game
+
+    spawn_ticks, start_time = log.session_start
+    game = Game(pygame.Surface(log.size), log.difficulty, input_source=ReplayInput(log),
+                time_source=StepClock(SimulatedClock(spawn_ticks)), sim_rate=log.sim_rate, seed=log.seed,
+                **dict(log.options, **options))
+    game.last_spawn_time = spawn_ticks
+    game.start_time = start_time
+    game.session_start = log.session_start
+    player_position = play(game, len(log))
+    return game, player_position
\ No newline at end of file
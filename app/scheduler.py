@@ -0,0 +1,65 @@
+import heapq
+import itertools
+
+
+class Timer:
+    __slots__ = ('due', 'callback', 'args', 'cancelled')
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        # Отменённый таймер остаётся в куче и просто пропускается, когда до него дойдёт очередь
+        self.cancelled = True
+
+
+class Scheduler:
+    # Очередь отложенных событий игры - куча по игровому времени (мс). За кадр смотрим только
+    # на вершину кучи, поэтому стоимость не зависит от числа ожидающих таймеров
+    def __init__(self, time_scale=1.0):
+        self.time = None
+        self.time_scale = time_scale
+        self.paused = False
+        self.source_time = None
+        self.queue = []
+        self.counter = itertools.count()  # порядок среди событий с одинаковым сроком
+
+    def __len__(self):
+        return len(self.queue)
+
+    def advance(self, source_time):
+        # Игровое время идёт вслед за временем шага: на паузе стоит, time_scale ускоряет или замедляет
+        if self.time is None:
+            self.time = source_time
+        elif not self.paused:
+            self.time += (source_time - self.source_time) * self.time_scale
+        self.source_time = source_time
+        return self.time
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def schedule_at(self, due, callback, *args):
+        timer = Timer(due, callback, args)
+        heapq.heappush(self.queue, (due, next(self.counter), timer))
+        return timer
+
+    def schedule(self, delay, callback, *args):
+        return self.schedule_at(self.time + delay, callback, *args)
+
+    def run_due(self, *context):
+        # Событие срабатывает, когда игровое время строго больше срока (как прежние проверки "> интервала")
+        fired = 0
+        queue = self.queue
+        while queue and queue[0][0] < self.time:
+            timer = heapq.heappop(queue)[2]
+            if not timer.cancelled:
+                timer.callback(*context, *timer.args)
+                fired += 1
+        return fired
@@ -0,0 +1,83 @@
+class SpatialHash:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        # Для каждого объекта храним диапазон занятых ячеек (x0, y0, x1, y1)
+        self.ranges = {}
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def __contains__(self, obj):
+        return obj in self.ranges
+
+    def cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _add_to_cells(self, obj, cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), {})[obj] = None
+
+    def _remove_from_cells(self, obj, cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    continue
+                cell.pop(obj, None)
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    def insert(self, obj):
+        if obj in self.ranges:
+            self.update(obj)
+            return
+        cell_range = self.cell_range(obj.rect)
+        self.ranges[obj] = cell_range
+        self._add_to_cells(obj, cell_range)
+
+    def update(self, obj):
+        # Перекладываем объект только если он пересёк границу ячейки
+        old_range = self.ranges.get(obj)
+        if old_range is None:
+            self.insert(obj)
+            return
+        new_range = self.cell_range(obj.rect)
+        if new_range == old_range:
+            return
+        self._remove_from_cells(obj, old_range)
+        self._add_to_cells(obj, new_range)
+        self.ranges[obj] = new_range
+
+    def remove(self, obj):
+        cell_range = self.ranges.pop(obj, None)
+        if cell_range is not None:
+            self._remove_from_cells(obj, cell_range)
+
+    def clear(self):
+        self.cells.clear()
+        self.ranges.clear()
+
+    def rebuild(self, objects):
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def query(self, rect):
+        # Кандидаты из ячеек, которые покрывает rect (без повторов)
+        x0, y0, x1, y1 = self.cell_range(rect)
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found)
+
+    def colliding(self, rect):
+        return [obj for obj in self.query(rect) if rect.colliderect(obj.rect)]
\ No newline at end of file
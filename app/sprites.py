@@ -0,0 +1,35 @@
+import pygame
+
+from app.display import clear_on_quit, display_format
+
+# Заранее отрисованные спрайты в формате экрана, по ключу (размер, цвет)
+_sprites = {}
+
+
+def get_sprite(size, color):
+    key = (tuple(size), tuple(color))
+    sprite = _sprites.get(key)
+    if sprite is None:
+        clear_on_quit(_sprites.clear)
+        sprite = pygame.Surface(key[0])
+        sprite.fill(color)
+        sprite = _sprites[key] = display_format(sprite)
+    return sprite
+
+
+def blit_batch(screen, sprite, rects):
+    # Один вызов Surface.blits на все объекты одного вида; возвращает области отрисовки
+    if not rects:
+        return []
+    return screen.blits([(sprite, rect) for rect in rects])
+
+
+def blit_rects(screen, color, rects):
+    # Объекты одного цвета группируем по размеру: один спрайт и один blits на группу
+    by_size = {}
+    for rect in rects:
+        by_size.setdefault(rect.size, []).append(rect)
+    drawn = []
+    for size, group in by_size.items():
+        drawn.extend(blit_batch(screen, get_sprite(size, color), group))
+    return drawn
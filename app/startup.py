@@ -0,0 +1,36 @@
+import time
+
+import pygame
+
+# Модули pygame, нужные игре: окно с событиями и шрифты. Звук и джойстики не используются,
+# а их инициализация (особенно звука) занимает заметную часть запуска
+FAST_START_MODULES = ('display', 'font')
+
+
+def init_pygame(fast=False):
+    if not fast:
+        return pygame.init()
+    for name in FAST_START_MODULES:
+        getattr(pygame, name).init()
+    return len(FAST_START_MODULES), 0
+
+
+class StartupTimer:
+    # Длительность этапов запуска по монотонным часам: каждый этап - от предыдущей отметки
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.phases = []  # (этап, секунды)
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def total(self):
+        return self.last - self.start
+
+    def report(self):
+        lines = [f"{name:<28} {seconds * 1000:8.1f} мс" for name, seconds in self.phases]
+        lines.append(f"{'итого до первого кадра':<28} {self.total() * 1000:8.1f} мс")
+        return '\n'.join(lines)
@@ -0,0 +1,79 @@
+import bisect
+
+import numpy as np
+
+
+def left_edge(obj):
+    return obj.rect.left
+
+
+class SweepAndPrune:
+    # Широкая фаза столкновений объектов между собой: список упорядочен по левому краю,
+    # и проход по нему сравнивает только объекты, чьи проекции на ось x пересекаются.
+    # За кадр объекты сдвигаются на несколько пикселей, порядок почти не меняется, поэтому
+    # пересортировка почти линейна (list.sort - адаптивная сортировка вставками и слиянием серий)
+    def __init__(self):
+        self.items = []
+        self.members = set()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, obj):
+        return obj in self.members
+
+    def insert(self, obj):
+        if obj in self.members:
+            return
+        self.members.add(obj)
+        bisect.insort(self.items, obj, key=left_edge)
+
+    def remove(self, obj):
+        if obj in self.members:
+            self.members.discard(obj)
+            self.items.remove(obj)
+
+    def rebuild(self, objects):
+        self.items = list(objects)
+        self.members = set(self.items)
+
+    def pairs(self):
+        # Пары пересекающихся объектов (строго, как Rect.colliderect)
+        items = self.items
+        items.sort(key=left_edge)
+        pairs = []
+        count = len(items)
+        for i, first in enumerate(items):
+            rect = first.rect
+            right, top, bottom = rect.right, rect.top, rect.bottom
+            for j in range(i + 1, count):
+                other = items[j].rect
+                if other.left >= right:
+                    break
+                if other.top < bottom and other.bottom > top:
+                    pairs.append((first, items[j]))
+        return pairs
+
+
+def sweep_pairs(order, pos, size):
+    # То же для массивов: order - перестановка, сортирующая враги по левому краю на прошлом кадре.
+    # Устойчивая сортировка NumPy для float - timsort, на почти упорядоченных данных почти линейна.
+    # Возвращает новый порядок и индексы пар пересекающихся прямоугольников
+    order = order[np.argsort(pos[order, 0], kind='stable')]
+    lefts = pos[order, 0]
+    rights = lefts + size[order, 0]
+    tops = pos[order, 1]
+    bottoms = tops + size[order, 1]
+    count = len(order)
+
+    # Для i-го в порядке кандидаты - следующие за ним, пока их левый край левее его правого.
+    # Номера пар строятся сразу для всех: first повторяет i, second идёт подряд от i + 1
+    ends = np.searchsorted(lefts, rights, side='left').astype(np.int32)
+    index = np.arange(count, dtype=np.int32)
+    counts = np.maximum(ends - index - 1, 0)
+    starts = np.cumsum(counts, dtype=np.int32) - counts
+    first = np.repeat(index, counts)
+    second = np.arange(len(first), dtype=np.int32) + np.repeat(index + 1 - starts, counts)
+
+    keep = (tops[first] < bottoms[second]) & (tops[second] < bottoms[first])
+    return order, order[first[keep]], order[second[keep]]
@@ -0,0 +1,29 @@
+import numpy as np
+
+
+def time_of_impact(start, delta, size, other_starts, other_deltas, other_sizes):
+    # Непрерывная проверка столкновений прямоугольника start/size, сдвинувшегося за шаг на delta,
+    # со многими прямоугольниками (массивы n x 2), которые за тот же шаг сдвинулись на other_deltas.
+    # Движение считается равномерным на t от 0 до 1; переходим к относительному движению: второй
+    # прямоугольник стоит, первый сдвигается на delta - other_delta. По каждой оси перекрытие идёт
+    # на открытом интервале t (как у Rect.colliderect, касание краями не считается).
+    # Возвращает массив моментов первого касания, np.inf - столкновения за шаг нет
+    start = np.asarray(start, dtype=np.float64)
+    relative = np.asarray(delta, dtype=np.float64) - other_deltas
+    low = other_starts - (start + np.asarray(size, dtype=np.float64))  # перекрытие при low < relative * t < high
+    high = other_starts + other_sizes - start
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = low / relative
+        second = high / relative
+    still = relative == 0
+    overlapping = (low < 0) & (high > 0)  # для неподвижной по оси пары - перекрытие на всём шаге
+    enter = np.where(relative > 0, first, second)
+    exit_ = np.where(relative > 0, second, first)
+    enter = np.where(still, np.where(overlapping, -np.inf, np.inf), enter)
+    exit_ = np.where(still, np.where(overlapping, np.inf, -np.inf), exit_)
+
+    t_enter = enter.max(axis=1)
+    t_exit = exit_.min(axis=1)
+    hit = (t_enter < t_exit) & (t_enter < 1) & (t_exit > 0)
+    return np.where(hit, np.maximum(t_enter, 0), np.inf)
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+import pygame
+
+from app.display import clear_on_quit
+
+# Общий реестр шрифтов: поиск SysFont - это поиск файла шрифта, делаем его один раз
+_fonts = {}
+
+
+def _clear_fonts():
+    _fonts.clear()
+    text_cache.clear()
+
+
+def get_font(name=None, size=32, bold=False, italic=False, system=True):
+    key = (name, size, bold, italic, system)
+    font = _fonts.get(key)
+    if font is None:
+        clear_on_quit(_clear_fonts)
+        if system:
+            font = pygame.font.SysFont(name, size, bold, italic)
+        else:
+            font = pygame.font.Font(name, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    # Ограниченный LRU-кеш отрисованных надписей по ключу (шрифт, текст, цвет)
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
+
+
+class Label:
+    # Надпись HUD: перерисовывается только при изменении текста
+    def __init__(self, font, color=(255, 255, 255)):
+        self.font = font
+        self.color = color
+        self.text = None
+        self.surface = None
+
+    def render(self, text):
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+        return self.surface
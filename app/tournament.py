@@ -0,0 +1,133 @@
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pygame
+
+from app.autopilot import ThreatFieldPolicy
+from app.headless import CallbackInput, create_headless_game
+
+DIFFICULTIES = ['Легкий', 'Средний', 'Сложный']
+MAX_SECONDS = 600  # предел длительности сессии, чтобы осторожный бот не играл бесконечно
+
+
+class IdlePolicy:
+    # Игрок стоит на месте
+    def __call__(self, game):
+        return ()
+
+
+class RandomWalkPolicy:
+    # Случайное направление, которое держится hold_frames шагов; случайность от сида игры
+    MOVES = [(), (pygame.K_w,), (pygame.K_a,), (pygame.K_s,), (pygame.K_d,),
+             (pygame.K_w, pygame.K_a), (pygame.K_w, pygame.K_d), (pygame.K_s, pygame.K_a), (pygame.K_s, pygame.K_d)]
+
+    def __init__(self, hold_frames=15):
+        self.hold_frames = hold_frames
+        self.rng = None
+        self.keys = ()
+        self.frames_left = 0
+
+    def __call__(self, game):
+        if self.rng is None:
+            self.rng = random.Random(game.seed)
+        if self.frames_left == 0:
+            self.keys = self.rng.choice(self.MOVES)
+            self.frames_left = self.hold_frames
+        self.frames_left -= 1
+        return self.keys
+
+
+POLICIES = {'idle': IdlePolicy, 'random': RandomWalkPolicy, 'autopilot': ThreatFieldPolicy}
+
+
+def run_session(session, policy=None, size=(1920, 1080), max_seconds=MAX_SECONDS, use_enemy_pool=True,
+                name='bot'):
+    # Одна сессия без окна. policy - функция game -> клавиши или источник ввода с get_pressed;
+    # копируется на каждую сессию, чтобы состояние бота не переходило между играми
+    difficulty, seed = session
+    policy = copy.deepcopy(policy if policy is not None else IdlePolicy())
+    input_source = policy if hasattr(policy, 'get_pressed') else CallbackInput(policy)
+    game = create_headless_game(difficulty, size, input_source=input_source, seed=seed,
+                                use_enemy_pool=use_enemy_pool)
+    result = game.run_headless(max_frames=int(max_seconds * game.sim_rate))
+    result['name'] = f'{name}-{seed}'
+    result['seed'] = seed
+    result['lives_lost'] = game.lives_lost
+    result['enemies_alive'] = len(game.enemy_pool) if game.enemy_pool is not None else len(game.enemies)
+    result['game_over'] = game.game_over
+    return result
+
+
+class ResultLog:
+    # Результаты сессий построчно в JSON со всеми полями (в таблице рекордов остались бы только
+    # имя, время и уровень). Файл открывается заново на каждый прогон, чтобы прогоны не смешивались
+    def __init__(self, filename):
+        self.file = open(filename, 'w', encoding='utf-8')
+
+    def save_record(self, data):
+        self.file.write(json.dumps(data, ensure_ascii=False) + '\n')
+
+    def close(self):
+        self.file.close()
+
+
+def quiet_worker():
+    # Сообщения игры ("Игра закончена!") из тысяч сессий только засоряют вывод
+    sys.stdout = open(os.devnull, 'w')
+
+
+def run_tournament(sessions, sink=None, workers=None, chunksize=None, **options):
+    # Сессии (сложность, сид) раздаются процессам пачками по chunksize: на каждую сессию
+    # приходится мало межпроцессного обмена, и масштабирование близко к линейному по ядрам.
+    # Результаты отдаются по мере готовности пачек в порядке sessions и пишутся в sink.save_record
+    sessions = list(sessions)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(sessions) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=quiet_worker) as executor:
+        for result in executor.map(partial(run_session, **options), sessions, chunksize=chunksize):
+            if sink is not None:
+                sink.save_record(result)
+            yield result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Массовый прогон игр без окна для настройки сложности')
+    parser.add_argument('--sessions', type=int, default=1000, help='число сессий на каждый уровень сложности')
+    parser.add_argument('--difficulty', choices=DIFFICULTIES, action='append',
+                        help='уровень сложности (можно несколько раз); по умолчанию все')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random', help='поведение бота')
+    parser.add_argument('--workers', type=int, default=None, help='число процессов (по умолчанию - ядер)')
+    parser.add_argument('--seed', type=int, default=0, help='первый сид')
+    parser.add_argument('--max-seconds', type=float, default=MAX_SECONDS, help='предел длительности сессии')
+    parser.add_argument('--output', default='tournament.jsonl',
+                        help='файл результатов, по строке JSON на сессию; перезаписывается')
+    args = parser.parse_args(argv)
+
+    sessions = [(difficulty, args.seed + i) for difficulty in args.difficulty or DIFFICULTIES
+                for i in range(args.sessions)]
+    sink = ResultLog(args.output)
+    totals = {}
+    try:
+        for result in run_tournament(sessions, sink, workers=args.workers, policy=POLICIES[args.policy](),
+                                     max_seconds=args.max_seconds):
+            total = totals.setdefault(result['difficulty'], [0, 0.0, 0])
+            total[0] += 1
+            total[1] += result['duration']
+            total[2] += result['enemies_alive']
+    finally:
+        sink.close()
+    for difficulty, (count, duration, enemies) in totals.items():
+        print(f"{difficulty:<8} сессий {count:>6}  средняя длительность {duration / count:8.2f} с  "
+              f"врагов в конце {enemies / count:6.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import os
+import random
+import sys
+import time
+
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.enemy import Enemy
+from app.game import Game
+
+# Замер стоимости поиска столкновений игрока с врагами за кадр при разном числе врагов:
+# запрос к сетке Game.enemy_grid против полного перебора списка врагов.
+# Удаление сбитых врагов в замер не входит - оно происходит только при попадании.
+# Запуск из корня репозитория: python benchmarks/collision_bench.py
+
+SCREEN_SIZE = (3840, 2160)
+ENEMY_COUNTS = [10, 100, 1000, 10000]
+FRAMES = 200
+
+
+def make_game(enemy_count):
+    game = Game(pygame.Surface(SCREEN_SIZE), 'Сложный')
+    rnd = random.Random(enemy_count)
+    for _ in range(enemy_count):
+        pos = (rnd.randint(0, SCREEN_SIZE[0] - 32), rnd.randint(0, SCREEN_SIZE[1] - 32))
+        game.enemies.append(Enemy(pos, *SCREEN_SIZE))
+    return game
+
+
+def linear_scan(enemies, player_rect):
+    return [enemy for enemy in enemies if player_rect.colliderect(enemy.rect)]
+
+
+def bench(enemy_count):
+    game = make_game(enemy_count)
+    player_rect = pygame.Rect(0, 0, 64, 64)
+    rnd = random.Random(0)
+    positions = [(rnd.randint(0, SCREEN_SIZE[0] - 64), rnd.randint(0, SCREEN_SIZE[1] - 64))
+                 for _ in range(FRAMES)]
+
+    candidates = 0
+    start = time.perf_counter()
+    for pos in positions:
+        player_rect.topleft = pos
+        game.enemy_grid.colliding(player_rect)
+    grid_time = (time.perf_counter() - start) / FRAMES
+
+    for pos in positions:
+        player_rect.topleft = pos
+        candidates += len(game.enemy_grid.query(player_rect))
+
+    start = time.perf_counter()
+    for pos in positions:
+        player_rect.topleft = pos
+        linear_scan(game.enemies, player_rect)
+    linear_time = (time.perf_counter() - start) / FRAMES
+
+    return grid_time, linear_time, candidates / FRAMES
+
+
+def main():
+    print(f"{'врагов':>8} {'сетка, мкс/кадр':>18} {'кандидатов':>12} {'перебор, мкс/кадр':>20}")
+    for enemy_count in ENEMY_COUNTS:
+        grid_time, linear_time, candidates = bench(enemy_count)
+        print(f"{enemy_count:>8} {grid_time * 1e6:>18.1f} {candidates:>12.1f} {linear_time * 1e6:>20.1f}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
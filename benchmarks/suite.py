@@ -0,0 +1,293 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+
+import numpy as np
+import pygame
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'app'))  # menu.py импортирует records без пакета
+
+from app.autopilot import ThreatFieldPolicy
+from app.enemy import Enemy
+from app.game import Game
+from app.records import Records, SqliteRecords
+
+# Набор замеров игрового цикла и таблицы рекордов. Результаты пишутся в JSON и сравниваются
+# с сохранённой базой: замедление больше допуска считается регрессией (код выхода 1).
+# Запуск из корня репозитория:
+#   python benchmarks/suite.py                       - полный набор, сравнение с baseline.json
+#   python benchmarks/suite.py --quick               - без таблиц рекордов больше 10 000 строк
+#   python benchmarks/suite.py --update-baseline     - записать текущие результаты как базу
+# База зависит от машины: обновляйте её на той же машине, где проводите сравнение.
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SCREEN_SIZE = (3840, 2160)
+PLAYER_POSITION = [1888, 1048]
+ENEMY_COUNTS = [10, 100, 1000, 10000]
+RENDER_ENEMY_COUNTS = [100, 1000]
+AUTOPILOT_ENEMY_COUNTS = [1000, 5000]
+MOTION_ENEMY_COUNTS = [1000, 10000]
+FAST_FORWARD_STEPS = 3600  # минута игры при 60 шагах в секунду
+COLLISION_ENEMY_COUNTS = {'list': [100, 1000], 'pool': [100, 1000, 5000]}
+RECORD_COUNTS = [1000, 10000, 100000, 1000000]
+QUICK_RECORD_COUNTS = [1000, 10000]
+DIFFICULTIES = ['Легкий', 'Средний', 'Сложный']
+REPEATS = 7
+FLOOR_US = 5  # абсолютный порог регрессии: меньший прирост - шум таймера на коротких замерах
+
+
+def measure(func, number=1, repeats=REPEATS):
+    # Время одного вызова в микросекундах: медиана и минимум по нескольким повторам
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number * 1e6)
+    return {'median_us': statistics.median(times), 'min_us': min(times), 'number': number, 'repeats': repeats}
+
+
+def make_game(enemy_count, use_enemy_pool, enemy_collisions=False):
+    # Враги вне зоны игрока: столкновений нет, и число врагов не меняется между повторами
+    game = Game(pygame.Surface(SCREEN_SIZE), 'Сложный', use_enemy_pool=use_enemy_pool, seed=enemy_count,
+                enemy_collisions=enemy_collisions)
+    game.ship_image = pygame.Surface(game.ship_size)
+    game.spawn_interval = float('inf')
+    game.last_spawn_time = 0
+    game.last_bonus_time = float('inf')
+    rnd = random.Random(enemy_count)
+    safe_area = pygame.Rect(PLAYER_POSITION, game.ship_size).inflate(128, 128)
+    placed = 0
+    while placed < enemy_count:
+        pos = (rnd.randint(0, SCREEN_SIZE[0] - 32), rnd.randint(0, SCREEN_SIZE[1] - 32))
+        if safe_area.colliderect(pygame.Rect(pos, (32, 32))):
+            continue
+        if use_enemy_pool:
+            game.enemy_pool.add(pos, rnd.uniform(1, Enemy.MAX_SPEED), (rnd.choice([-1, 1]), rnd.choice([-1, 1])))
+        else:
+            game.enemies.append(Enemy(pos, *SCREEN_SIZE, rng=rnd))
+        placed += 1
+    return game
+
+
+def bench_game(results):
+    for use_enemy_pool in (False, True):
+        storage = 'pool' if use_enemy_pool else 'list'
+        for enemy_count in ENEMY_COUNTS:
+            game = make_game(enemy_count, use_enemy_pool)
+            player_position = list(PLAYER_POSITION)
+            player_rect = pygame.Rect(PLAYER_POSITION, game.ship_size)
+            results[f'game_logic[{storage},{enemy_count}]'] = measure(
+                lambda: game.game_logic(1000, player_position, 0), number=100)
+            results[f'check_collision[{storage},{enemy_count}]'] = measure(
+                lambda: game.check_collision(player_rect), number=100)
+
+
+def bench_swept_collision(results):
+    # Непрерывная проверка столкновений игрока: путь за шаг в 20 пикселей по диагонали
+    for use_enemy_pool in (False, True):
+        storage = 'pool' if use_enemy_pool else 'list'
+        for enemy_count in ENEMY_COUNTS:
+            game = make_game(enemy_count, use_enemy_pool)
+            game.swept_collisions = True
+            player_rect = pygame.Rect(PLAYER_POSITION, game.ship_size)
+            player_start = (PLAYER_POSITION[0] - 20, PLAYER_POSITION[1] - 20)
+            results[f'check_collision_swept[{storage},{enemy_count}]'] = measure(
+                lambda: game.check_collision(player_rect, player_start), number=100)
+
+
+def bench_enemy_collisions(results):
+    # Столкновения врагов между собой: пересортировка почти упорядоченного списка и проход по нему
+    for storage, enemy_counts in COLLISION_ENEMY_COUNTS.items():
+        for enemy_count in enemy_counts:
+            game = make_game(enemy_count, storage == 'pool', enemy_collisions=True)
+            game.collide_enemies()
+            results[f'collide_enemies[{storage},{enemy_count}]'] = measure(game.collide_enemies, number=20)
+
+
+def bench_enemy_motion(results):
+    # Шаг врагов пула: пошаговое интегрирование и вычисление по формуле; перемотка на минуту вперёд
+    for enemy_count in MOTION_ENEMY_COUNTS:
+        for mode in ('integrate', 'analytic'):
+            game = make_game(enemy_count, True)
+            game.enemy_pool.analytic = mode == 'analytic'
+            results[f'move_enemies[{mode},{enemy_count}]'] = measure(game.enemy_pool.move, number=100)
+        pool = make_game(enemy_count, True).enemy_pool
+        pool.analytic = True
+        results[f'enemy_pool.advance[analytic,{enemy_count}]'] = measure(
+            lambda: pool.advance(FAST_FORWARD_STEPS), number=20)
+
+
+def bench_render(results):
+    pygame.display.set_mode((1, 1))
+    for use_enemy_pool in (False, True):
+        storage = 'pool' if use_enemy_pool else 'list'
+        for enemy_count in RENDER_ENEMY_COUNTS:
+            game = make_game(enemy_count, use_enemy_pool)
+            results[f'render_game[{storage},{enemy_count}]'] = measure(
+                lambda: game.render_game(PLAYER_POSITION, '1:23', 0.5), number=20)
+
+
+def bench_autopilot(results):
+    # Автопилот ведёт нагрузочные прогоны и не должен заметно влиять на их замеры
+    policy = ThreatFieldPolicy()
+    for enemy_count in AUTOPILOT_ENEMY_COUNTS:
+        game = make_game(enemy_count, True)
+        game.player_rect.update(PLAYER_POSITION, game.ship_size)
+        results[f'autopilot[pool,{enemy_count}]'] = measure(lambda: policy(game), number=100)
+
+
+def random_record(rnd, index):
+    return {'name': f'Игрок {index}', 'duration': round(rnd.uniform(1, 600), 2),
+            'difficulty': rnd.choice(DIFFICULTIES)}
+
+
+def bench_records(results, record_counts, directory):
+    for record_count in record_counts:
+        rnd = random.Random(record_count)
+        rows = [random_record(rnd, i) for i in range(record_count)]
+
+        text_filename = os.path.join(directory, f'records_{record_count}.txt')
+        with open(text_filename, 'w') as file:
+            file.writelines(f"{r['name']}, {r['duration']:.2f}, {r['difficulty']}\n" for r in rows)
+
+        # Первое чтение строит индекс по всему файлу, дальше страницы берутся из памяти
+        def load_cold():
+            Records(text_filename).load_records(limit=20)
+
+        results[f'records.load_records[text,cold,{record_count}]'] = measure(load_cold, repeats=3)
+        records = Records(text_filename)
+        records.load_records(limit=20)
+        results[f'records.load_records[text,page,{record_count}]'] = measure(
+            lambda: records.load_records(limit=20, offset=record_count // 2), number=100)
+        results[f'records.save_record[text,{record_count}]'] = measure(
+            lambda: records.save_record(random_record(rnd, -1)), number=20)
+
+        sqlite_records = SqliteRecords(os.path.join(directory, f'records_{record_count}.db'))
+        sqlite_records.save_records(rows)
+        results[f'records.load_records[sqlite,page,{record_count}]'] = measure(
+            lambda: sqlite_records.load_records(limit=20, offset=record_count // 2), number=20)
+        middle_key = sqlite_records.keyed_records(limit=1, offset=record_count // 2)[0][0]
+        results[f'records.records_after[sqlite,page,{record_count}]'] = measure(
+            lambda: sqlite_records.records_after(middle_key, 20), number=20)
+        sqlite_records.leaderboard()
+        results[f'records.rank_of[sqlite,{record_count}]'] = measure(
+            lambda: sqlite_records.rank_of(rnd.uniform(1, 600), rnd.choice(DIFFICULTIES)), number=100)
+        results[f'records.save_record[sqlite,{record_count}]'] = measure(
+            lambda: sqlite_records.save_record(random_record(rnd, -1)), number=5, repeats=3)
+        sqlite_records.close()
+
+
+def bench_menu(results, directory):
+    import menu as menu_module
+
+    screen = pygame.display.set_mode((1280, 720))
+    record_count = 100000
+    rnd = random.Random(record_count)
+    records = SqliteRecords(os.path.join(directory, 'menu_records.db'))
+    records.save_records([random_record(rnd, i) for i in range(record_count)])
+    menu = menu_module.Menu(screen, records)
+    scroll_frames = 200
+    script = []
+    # По одному нажатию на кадр: иначе wait_events заберёт всю очередь сразу и кадр будет один
+    menu_module.wait_events = lambda timeout=None: [script.pop()]
+
+    def show_records():
+        # Прокрутка вниз на scroll_frames строк и выход; время делится на число кадров
+        script[:] = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, unicode='')] + \
+            [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN, unicode='')] * scroll_frames
+        menu.show_records()
+
+    result = measure(show_records, repeats=3)
+    for key in ('median_us', 'min_us'):
+        result[key] /= scroll_frames + 1
+    result['number'] = scroll_frames + 1
+    results['menu.show_records[frame]'] = result
+    records.close()
+
+
+def compare(results, baseline, tolerance, floor_us=FLOOR_US):
+    # Регрессия - лучшее время выросло больше чем на tolerance относительно базы;
+    # минимум меньше медианы зависит от фоновой нагрузки на машину. Прирост меньше floor_us
+    # не считаем: у замеров короче микросекунды шум таймера сам по себе больше tolerance
+    regressions = []
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<50} {result['min_us']:>12.1f} мкс  (нет в базе)")
+            continue
+        ratio = result['min_us'] / base['min_us']
+        mark = ''
+        if ratio > 1 + tolerance and result['min_us'] - base['min_us'] > floor_us:
+            mark = '  РЕГРЕССИЯ'
+            regressions.append(name)
+        print(f"{name:<50} {result['min_us']:>12.1f} мкс  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Замеры производительности игры и таблицы рекордов')
+    parser.add_argument('--output', default='bench_output.json', help='куда записать результаты')
+    parser.add_argument('--baseline', default=BASELINE, help='файл базы для сравнения')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='допустимое замедление (0.25 = 25%%)')
+    parser.add_argument('--floor', type=float, default=FLOOR_US,
+                        help='прирост в мкс, который не считается регрессией при любом отношении')
+    parser.add_argument('--update-baseline', action='store_true', help='записать результаты как новую базу')
+    parser.add_argument('--quick', action='store_true', help='таблицы рекордов не больше 10 000 строк')
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results = {}
+    bench_game(results)
+    bench_swept_collision(results)
+    bench_enemy_collisions(results)
+    bench_enemy_motion(results)
+    bench_render(results)
+    bench_autopilot(results)
+    with tempfile.TemporaryDirectory() as directory:
+        bench_records(results, QUICK_RECORD_COUNTS if args.quick else RECORD_COUNTS, directory)
+        bench_menu(results, directory)
+    pygame.quit()
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+        print(f"База обновлена: {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+    regressions = compare(results, baseline, args.tolerance, args.floor)
+    if regressions:
+        print(f"Регрессий: {len(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
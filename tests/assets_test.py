@@ -0,0 +1,76 @@
+import os
+
+import pygame
+import pytest
+
+from app.assets import ASSETS_DIR, AssetManager, asset_path
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    surface = pygame.Surface((10, 20))
+    surface.fill((255, 0, 0))
+    pygame.image.save(surface, str(tmp_path / 'ship.bmp'))
+    return tmp_path
+
+
+# Тест №1.1 (позитивный)
+def test_path_relative_to_package():
+    """Путь к ресурсу не зависит от текущей папки запуска."""
+    assert asset_path('ship1.gif') == os.path.join(ASSETS_DIR, 'ship1.gif')
+    assert os.path.isabs(asset_path('ship1.gif'))
+    assert os.path.basename(ASSETS_DIR) == 'assets'
+
+
+# Тест №1.2 (позитивный)
+def test_image_loaded_once(image_dir, monkeypatch):
+    """Картинка читается с диска один раз, масштабированная копия хранится по размеру."""
+    assets = AssetManager(str(image_dir))
+    loads = []
+    load = pygame.image.load
+    monkeypatch.setattr(pygame.image, 'load', lambda path: loads.append(path) or load(path))
+
+    first = assets.image('ship.bmp', (64, 64))
+    second = assets.image('ship.bmp', (64, 64))
+    other = assets.image('ship.bmp', (32, 32))
+
+    assert first is second
+    assert first.get_size() == (64, 64)
+    assert other.get_size() == (32, 32)
+    assert assets.image('ship.bmp').get_size() == (10, 20)
+    assert len(loads) == 1
+
+
+# Тест №1.3 (негативный)
+def test_missing_image_raises(tmp_path):
+    """Отсутствующий файл даёт ошибку при загрузке, а не пустую картинку."""
+    assets = AssetManager(str(tmp_path))
+
+    with pytest.raises(FileNotFoundError):
+        assets.image('missing.png')
+    assert len(assets) == 0
+
+
+# Тест №2.1 (позитивный)
+def test_preload_async(image_dir, monkeypatch):
+    """Фоновая загрузка готовит картинку, и первое обращение не читает файл заново."""
+    assets = AssetManager(str(image_dir))
+    assets.preload_async(['ship.bmp', 'missing.png']).join()
+
+    monkeypatch.setattr(pygame.image, 'load', lambda path: pytest.fail("повторная загрузка"))
+    assert assets.image('ship.bmp').get_at((0, 0)) == (255, 0, 0, 255)
+
+
+# Тест №2.2 (позитивный)
+def test_converted_for_display_and_cleared_on_quit(image_dir):
+    """При открытом окне картинка переводится в формат экрана; pygame.quit очищает кеш."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((1, 1))
+        assets = AssetManager(str(image_dir))
+        image = assets.image('ship.bmp', (64, 64))
+        assert image.get_flags() & pygame.SRCALPHA
+    finally:
+        pygame.quit()
+    assert len(assets) == 0
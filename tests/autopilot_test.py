@@ -0,0 +1,52 @@
+import pygame
+
+from app.autopilot import ThreatFieldPolicy
+from app.enemy import Enemy
+from app.headless import create_headless_game
+from app.tournament import IdlePolicy, run_session
+
+
+def make_game(use_enemy_pool):
+    game = create_headless_game('Легкий', size=(800, 600), use_enemy_pool=use_enemy_pool)
+    game.player_rect.update(368, 268, 64, 64)  # центр игрока - (400, 300)
+    return game
+
+
+# Тест №1.1 (позитивный)
+def test_flees_from_enemy_in_pool():
+    """Враг справа от игрока - автопилот уходит влево."""
+    game = make_game(True)
+    game.enemy_pool.add((484, 284), 0, (1, 1))
+
+    assert ThreatFieldPolicy()(game) == (pygame.K_a,)
+
+
+# Тест №1.2 (позитивный)
+def test_flees_from_enemy_in_list():
+    """Для врагов-объектов поле то же: враг снизу и летит вверх - автопилот уходит вверх."""
+    game = make_game(False)
+    enemy = Enemy((384, 420), 800, 600)
+    enemy.speed, enemy.direction = 2, [0, -1]
+    game.enemies.append(enemy)
+
+    assert ThreatFieldPolicy()(game) == (pygame.K_w,)
+
+
+# Тест №1.3 (позитивный)
+def test_no_threat():
+    """Без врагов игрок в центре стоит, а у левого края - отходит к центру."""
+    game = make_game(True)
+    assert ThreatFieldPolicy()(game) == ()
+
+    game.player_rect.update(0, 268, 64, 64)
+    assert ThreatFieldPolicy()(game) == (pygame.K_d,)
+
+
+# Тест №2.1 (позитивный)
+def test_outlives_idle_player():
+    """Автопилот живёт заметно дольше игрока, который стоит на месте."""
+    autopilot = sum(run_session(('Сложный', seed), ThreatFieldPolicy(), max_seconds=300)['duration']
+                    for seed in range(4))
+    idle = sum(run_session(('Сложный', seed), IdlePolicy(), max_seconds=300)['duration'] for seed in range(4))
+
+    assert autopilot > 2 * idle
@@ -0,0 +1,99 @@
+import pygame
+from unittest.mock import patch
+
+from app.dirty_rects import DirtyRectRenderer
+from app.enemy import Enemy
+from app.game import Game
+
+
+# Тест №1.1 (позитивный)
+def test_first_frame_is_full_flip():
+    """Первый кадр очищается и показывается целиком."""
+    screen = pygame.Surface((800, 600))
+    screen.fill((255, 255, 255))
+    renderer = DirtyRectRenderer(screen)
+
+    with patch('pygame.display.flip') as mock_flip, patch('pygame.display.update') as mock_update:
+        renderer.begin_frame()
+        partial = renderer.present([pygame.Rect(10, 10, 32, 32)])
+
+    assert partial is False
+    mock_flip.assert_called_once()
+    mock_update.assert_not_called()
+    assert screen.get_at((500, 500)) == (0, 0, 0)
+
+
+# Тест №1.2 (позитивный)
+def test_updates_previous_and_current_rects():
+    """Обновляются прежние и текущие области объектов."""
+    screen = pygame.Surface((800, 600))
+    renderer = DirtyRectRenderer(screen)
+    with patch('pygame.display.flip'):
+        renderer.begin_frame()
+        renderer.present([pygame.Rect(10, 10, 32, 32)])
+
+    with patch('pygame.display.update') as mock_update:
+        renderer.begin_frame()
+        partial = renderer.present([pygame.Rect(12, 12, 32, 32)])
+
+    assert partial is True
+    mock_update.assert_called_once_with([pygame.Rect(10, 10, 32, 32), pygame.Rect(12, 12, 32, 32)])
+
+
+# Тест №1.3 (позитивный)
+def test_erases_only_previous_rects():
+    """Фон восстанавливается только там, где объект был в прошлом кадре."""
+    screen = pygame.Surface((800, 600))
+    renderer = DirtyRectRenderer(screen)
+    with patch('pygame.display.flip'):
+        renderer.begin_frame()
+        drawn = pygame.draw.rect(screen, (255, 0, 0), (10, 10, 32, 32))
+        renderer.present([drawn])
+    screen.set_at((500, 500), (1, 2, 3))  # пиксель вне грязных областей
+
+    renderer.begin_frame()
+
+    assert screen.get_at((20, 20)) == (0, 0, 0)
+    assert screen.get_at((500, 500)) == (1, 2, 3)
+
+
+# Тест №1.4 (негативный)
+def test_large_dirty_area_falls_back_to_flip():
+    """При большой грязной площади кадр показывается целиком."""
+    screen = pygame.Surface((800, 600))
+    renderer = DirtyRectRenderer(screen, max_dirty_fraction=0.5)
+    with patch('pygame.display.flip'):
+        renderer.begin_frame()
+        renderer.present([])
+
+    with patch('pygame.display.flip') as mock_flip, patch('pygame.display.update') as mock_update:
+        renderer.begin_frame()
+        partial = renderer.present([pygame.Rect(0, 0, 800, 400)])
+
+    assert partial is False
+    mock_flip.assert_called_once()
+    mock_update.assert_not_called()
+
+
+# Тест №2.1 (позитивный)
+def test_render_game_with_dirty_rects():
+    """render_game в режиме грязных областей передаёт их в display.update."""
+    game = Game(pygame.Surface((800, 600)), 'Легкий', dirty_rects=True)
+    game.ship_image = pygame.Surface((64, 64))
+    game.hud = {name: _StubLabel() for name in ('timer', 'lives', 'shield')}
+    game.enemies = [Enemy((100, 100), 800, 600)]
+
+    with patch('pygame.display.flip'):
+        game.render_game([400, 300], '0:00')
+    with patch('pygame.display.update') as mock_update:
+        game.render_game([405, 300], '0:00')
+
+    dirty = mock_update.call_args.args[0]
+    assert pygame.Rect(400, 300, 64, 64) in dirty
+    assert pygame.Rect(405, 300, 64, 64) in dirty
+    assert pygame.Rect(100, 100, 32, 32) in dirty
+
+
+class _StubLabel:
+    def render(self, text):
+        return pygame.Surface((50, 20))
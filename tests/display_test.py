@@ -0,0 +1,47 @@
+import os
+
+import pygame
+
+from app.display import clear_on_quit, display_format
+
+
+# Тест №1.1 (позитивный)
+def test_clear_on_quit_registered_again_after_quit():
+    """Очистка выполняется при каждом pygame.quit(), один раз, даже если регистрировалась повторно."""
+    calls = []
+
+    def clear():
+        calls.append('clear')
+
+    pygame.init()
+    clear_on_quit(clear)
+    clear_on_quit(clear)
+    pygame.quit()
+    assert calls == ['clear']
+
+    pygame.init()
+    clear_on_quit(clear)
+    pygame.quit()
+    assert calls == ['clear', 'clear']
+
+
+# Тест №2.1 (позитивный)
+def test_display_format_with_window():
+    """При открытом окне поверхность переводится в формат экрана, с прозрачностью по запросу."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((1, 1))
+        surface = pygame.Surface((4, 4))
+        assert display_format(surface) is not surface
+        assert display_format(surface, alpha=True).get_flags() & pygame.SRCALPHA
+    finally:
+        pygame.quit()
+
+
+# Тест №2.2 (негативный)
+def test_display_format_without_window():
+    """Без окна поверхность возвращается без изменений."""
+    surface = pygame.Surface((4, 4))
+    assert display_format(surface) is surface
+    assert display_format(surface, alpha=True) is surface
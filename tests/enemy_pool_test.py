@@ -0,0 +1,172 @@
+import pygame
+import pytest
+from unittest.mock import MagicMock
+
+from app.enemy import Enemy
+from app.enemy_pool import EnemyPool
+from app.game import Game
+
+SCREEN_WIDTH = 1600
+SCREEN_HEIGHT = 900
+
+
+# Тест №1.1 (позитивный)
+def test_normal_movement():
+    """Все враги сдвигаются за один векторизованный шаг."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    pool.add((100, 100), 1, (1, 1))
+    pool.add((500, 500), 2, (-1, 1))
+
+    for _ in range(10):
+        pool.move()
+
+    assert pool.pos[0].tolist() == [110, 110]
+    assert pool.pos[1].tolist() == [480, 520]
+
+
+# Тест №1.2 (негативный)
+def test_edge_reflection():
+    """У края экрана направление по оси X меняется на обратное."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    pool.add((1560, 100), 1, (1, 1))
+
+    for _ in range(9):
+        pool.move()
+
+    assert pool.pos[0][0] + pool.size[0][0] <= SCREEN_WIDTH
+    assert pool.vel[0][0] == -1
+
+
+# Тест №1.3 (позитивный)
+def test_subpixel_speed_accumulates():
+    """Дробная скорость не теряется при округлении, как у Rect.move_ip."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    pool.add((100, 100), 0.5, (1, 1))
+
+    for _ in range(10):
+        pool.move()
+
+    assert pool.pos[0].tolist() == [105, 105]
+
+
+# Тест №2.1 (позитивный)
+def test_collide_and_remove():
+    """Столкновение находит только пересекающихся врагов, remove их удаляет."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    pool.add((400, 300), 1, (1, 1))
+    pool.add((1000, 800), 1, (1, 1))
+    pool.add((430, 330), 1, (1, 1))
+
+    hits = pool.collide(pygame.Rect(400, 300, 64, 64))
+    assert hits.tolist() == [0, 2]
+
+    pool.remove(hits)
+    assert len(pool) == 1
+    assert pool.pos[0].tolist() == [1000, 800]
+
+
+# Тест №2.2 (негативный)
+def test_touching_edges_do_not_collide():
+    """Касание краями не считается столкновением."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    pool.add((464, 300), 1, (1, 1))
+    assert len(pool.collide(pygame.Rect(400, 300, 64, 64))) == 0
+
+
+# Тест №3.1 (позитивный)
+def test_pool_grows():
+    """Хранилище расширяется при нехватке места."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT, capacity=2)
+    for i in range(5):
+        pool.add((i * 40, 0), 1, (1, 1))
+    assert len(pool) == 5
+    assert [rect.x for rect in pool.rects()] == [0, 40, 80, 120, 160]
+
+
+# Тест №3.2 (позитивный)
+def test_spawn_speed_range_from_enemy(monkeypatch):
+    """spawn берёт диапазон скоростей у Enemy: изменение Enemy.MAX_SPEED действует и на хранилище."""
+    monkeypatch.setattr(Enemy, 'MAX_SPEED', 1.5)
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    for i in range(50):
+        pool.spawn((0, 0))
+    speeds = abs(pool.vel[:len(pool)])
+    assert speeds.min() >= 1 and speeds.max() <= 1.5
+
+
+@pytest.fixture
+def pool_game():
+    screen = MagicMock()
+    screen.get_size.return_value = (800, 600)
+    return Game(screen, 'Легкий', use_enemy_pool=True)
+
+
+# Тест №4.1 (позитивный)
+def test_game_spawns_into_pool(pool_game):
+    """В режиме пула враги создаются в массивах, а не в списке."""
+    pool_game.spawn_enemy([400, 300])
+    assert len(pool_game.enemy_pool) == 1
+    assert pool_game.enemies == []
+
+
+# Тест №4.2 (позитивный)
+def test_game_collision_with_pool(pool_game):
+    """Столкновение с врагом из пула отнимает жизнь и удаляет врага."""
+    pool_game.enemy_pool.add((400, 300), 1, (1, 1))
+    pool_game.lives = 3
+    pool_game.check_collision(pygame.Rect(400, 300, 64, 64))
+    assert pool_game.lives == 2
+    assert len(pool_game.enemy_pool) == 0
+
+
+# Тест №5.1 (позитивный)
+def test_analytic_matches_integration_between_walls():
+    """Пока враг не дошёл до стены, аналитическое движение совпадает с пошаговым."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    analytic = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT, analytic=True)
+    for target in (pool, analytic):
+        target.add((100, 100), 1.5, (1, -1))
+        target.add((500, 500), 2, (-1, 1))
+        for _ in range(50):
+            target.move()
+
+    assert analytic.pos[:2].tolist() == pool.pos[:2].tolist()
+    assert analytic.vel[:2].tolist() == pool.vel[:2].tolist()
+
+
+# Тест №5.2 (позитивный)
+def test_analytic_reflects_and_fast_forwards():
+    """Положение после перемотки равно положению после тех же шагов по одному и отражается у стен."""
+    stepped = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT, analytic=True)
+    jumped = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT, analytic=True)
+    for target in (stepped, jumped):
+        target.add((1560, 100), 3, (1, 1))
+    for _ in range(1000):
+        stepped.move()
+    jumped.advance(1000)
+
+    assert jumped.pos[0].tolist() == pytest.approx(stepped.pos[0].tolist())
+    # Путь 3000 пикселей: 8 до правой стены (1568), 1568 до левой и ещё 1424 вправо
+    assert jumped.pos[0][0] == pytest.approx(1424)
+    assert jumped.vel[0][0] == 3
+    assert 0 <= jumped.pos[0][1] <= SCREEN_HEIGHT - 32
+
+
+# Тест №5.3 (позитивный)
+def test_analytic_interpolation_follows_wall():
+    """Промежуточное положение для отрисовки отражается у стены, а не срезается хордой."""
+    pool = EnemyPool(SCREEN_WIDTH, SCREEN_HEIGHT, analytic=True)
+    pool.add((1564, 100), 4, (1, 1))  # до стены (1568) - один шаг
+    pool.move()
+    pool.move()  # на шаге 2 враг уже в 1564, отражённый от стены
+
+    assert pool.prev_pos[0][0] == pytest.approx(1568)
+    assert pool.positions(0.5)[0][0] == pytest.approx(1566)
+    assert pool.pos[0][0] == pytest.approx(1564)
+
+
+# Тест №5.4 (негативный)
+def test_analytic_requires_pool():
+    """Аналитическое движение без пула врагов не поддерживается."""
+    with pytest.raises(ValueError):
+        Game(MagicMock(get_size=MagicMock(return_value=(800, 600))), 'Легкий', analytic_enemies=True)
@@ -0,0 +1,48 @@
+import pygame
+from unittest.mock import Mock, patch
+
+from app.events import wait_events
+from app.inputBox import InputBox
+
+
+# Тест №1.1 (позитивный)
+def test_wait_events_collects_queue():
+    """После пробуждения забирается вся накопившаяся очередь событий."""
+    first = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)
+    rest = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)]
+    with patch('pygame.event.wait', return_value=first) as mock_wait, \
+            patch('pygame.event.get', return_value=rest):
+        events = wait_events()
+
+    mock_wait.assert_called_once_with()
+    assert events == [first] + rest
+
+
+# Тест №1.2 (негативный)
+def test_wait_events_timeout_without_input():
+    """По истечении таймаута возвращается пустой список, а не NOEVENT."""
+    with patch('pygame.event.wait', return_value=pygame.event.Event(pygame.NOEVENT)) as mock_wait, \
+            patch('pygame.event.get', return_value=[]):
+        events = wait_events(500)
+
+    mock_wait.assert_called_once_with(500)
+    assert events == []
+
+
+# Тест №2.1 (позитивный)
+def test_caret_blinks():
+    """Курсор активного поля рисуется только в первой половине периода мигания."""
+    screen = pygame.Surface((800, 600))
+    font = Mock()
+    font.render.return_value = pygame.Surface((0, 0))
+    with patch('app.inputBox.get_font', return_value=font):
+        input_box = InputBox(screen)
+    input_box.active = True
+
+    with patch('pygame.time.get_ticks', return_value=0), patch('pygame.draw.line') as mock_line:
+        input_box.draw(screen)
+    assert mock_line.call_count == 1
+
+    with patch('pygame.time.get_ticks', return_value=500), patch('pygame.draw.line') as mock_line:
+        input_box.draw(screen)
+    mock_line.assert_not_called()
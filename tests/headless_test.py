@@ -0,0 +1,83 @@
+import pygame
+
+from app.bonus import Bonus
+from app.clock import SimulatedClock
+from app.headless import CallbackInput, KeyState, ScriptedInput, create_headless_game
+
+
+# Тест №1.1 (позитивный)
+def test_scripted_input_moves_player():
+    """Нажатия берутся из подставленного источника, а не с клавиатуры."""
+    game = create_headless_game('Легкий', size=(800, 600),
+                                input_source=ScriptedInput([[pygame.K_d], [pygame.K_d, pygame.K_s]]))
+    game.last_spawn_time = 0
+    player_position = [400, 300]
+
+    game.game_logic(100, player_position, 5)
+    game.game_logic(200, player_position, 5)
+    game.game_logic(300, player_position, 5)  # сценарий закончился - стоим на месте
+
+    assert player_position == [410, 305]
+
+
+# Тест №1.2 (позитивный)
+def test_callback_input_sees_game():
+    """Функция-политика получает объект игры."""
+    seen = []
+
+    def policy(game):
+        seen.append(game)
+        return [pygame.K_w]
+
+    source = CallbackInput(policy)
+    game = create_headless_game('Легкий', size=(800, 600), input_source=source)
+    game.last_spawn_time = 0
+    player_position = [400, 300]
+    game.game_logic(100, player_position, 5)
+
+    assert seen == [game]
+    assert player_position == [400, 295]
+
+
+# Тест №2.1 (позитивный)
+def test_run_headless_uses_simulated_time():
+    """Без окна за 500 шагов при 50 шагах в секунду проходит ровно 10 секунд игрового времени."""
+    game = create_headless_game('Легкий', size=(1920, 1080), sim_rate=50)
+    game.lives = 1000  # игрок не должен погибнуть раньше времени
+
+    result = game.run_headless(max_frames=500)
+
+    assert result['duration'] == 10
+    assert game.game_over is False
+
+
+# Тест №2.2 (позитивный)
+def test_run_headless_until_game_over():
+    """Без ограничения по кадрам сессия идёт до потери всех жизней."""
+    game = create_headless_game('Сложный', size=(800, 600), use_enemy_pool=True)
+    result = game.run_headless(max_frames=60 * 3600)
+
+    assert game.lives <= 0
+    assert game.game_over is True
+    assert result['difficulty'] == 'Сложный'
+
+
+# Тест №3.1 (позитивный)
+def test_bonus_expires_by_simulated_clock():
+    """Бонус истекает по игровым часам, а не по системным."""
+    clock = SimulatedClock()
+    bonus = Bonus((0, 0), 'life', 100, 100, duration=5, time_source=clock)
+
+    clock.advance(4000)
+    bonus.update()
+    assert bonus.active
+
+    clock.advance(2000)
+    bonus.update()
+    assert not bonus.active
+
+
+# Тест №3.2 (негативный)
+def test_key_state_unknown_key():
+    """Не нажатая клавиша читается как False."""
+    assert KeyState([pygame.K_w])[pygame.K_a] is False
@@ -0,0 +1,69 @@
+import pygame
+from unittest.mock import Mock
+
+from app.layers import LayerCache, composite_highlight
+
+
+# Тест №1.1 (позитивный)
+def test_layer_built_once():
+    """Статический слой собирается один раз и дальше берётся из кеша."""
+    cache = LayerCache()
+    build = Mock()
+
+    first = cache.get('help', (800, 600), build)
+    second = cache.get('help', (800, 600), build)
+
+    assert first is second
+    build.assert_called_once_with(first)
+
+
+# Тест №1.2 (позитивный)
+def test_layer_rebuilt_for_new_size():
+    """Для другого размера окна слой собирается заново."""
+    cache = LayerCache()
+    build = Mock()
+
+    small = cache.get('help', (800, 600), build)
+    large = cache.get('help', (1920, 1080), build)
+
+    assert build.call_count == 2
+    assert small.get_size() == (800, 600)
+    assert large.get_size() == (1920, 1080)
+    assert len(cache) == 2
+
+
+# Тест №2.1 (позитивный)
+def test_first_composite_covers_screen():
+    """Первый кадр выводит слой целиком вместе с подсвеченным элементом."""
+    screen = pygame.Surface((200, 100))
+    layer = pygame.Surface((200, 100))
+    layer.fill((255, 255, 255))
+    highlight = pygame.Surface((20, 10))
+    highlight.fill((0, 255, 0))
+    highlights = [(highlight, pygame.Rect(10, 10, 20, 10)), (highlight, pygame.Rect(10, 50, 20, 10))]
+
+    dirty = composite_highlight(screen, layer, highlights, None, 0)
+
+    assert dirty == [pygame.Rect(0, 0, 200, 100)]
+    assert screen.get_at((15, 15)) == (0, 255, 0)
+    assert screen.get_at((15, 55)) == (255, 255, 255)
+
+
+# Тест №2.2 (позитивный)
+def test_composite_touches_only_changed_items():
+    """При смене подсветки обновляются только старый и новый элементы."""
+    screen = pygame.Surface((200, 100))
+    layer = pygame.Surface((200, 100))
+    layer.fill((255, 255, 255))
+    highlight = pygame.Surface((20, 10))
+    highlight.fill((0, 255, 0))
+    highlights = [(highlight, pygame.Rect(10, 10, 20, 10)), (highlight, pygame.Rect(10, 50, 20, 10))]
+    composite_highlight(screen, layer, highlights, None, 0)
+    screen.set_at((150, 80), (1, 2, 3))  # пиксель вне элементов
+
+    dirty = composite_highlight(screen, layer, highlights, 0, 1)
+
+    assert dirty == [pygame.Rect(10, 10, 20, 10), pygame.Rect(10, 50, 20, 10)]
+    assert screen.get_at((15, 15)) == (255, 255, 255)
+    assert screen.get_at((15, 55)) == (0, 255, 0)
+    assert screen.get_at((150, 80)) == (1, 2, 3)
@@ -0,0 +1,134 @@
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.game import Game
+from app.leaderboard import Leaderboard
+from app.records import Records, SqliteRecords
+
+
+def record(name, duration, difficulty):
+    return {'name': name, 'duration': duration, 'difficulty': difficulty}
+
+
+# Тест №1.1 (позитивный)
+def test_insert_keeps_leaderboard_order():
+    """Вставка сохраняет порядок: сложность, затем убывание времени."""
+    board = Leaderboard([record('A', 10, 'Легкий'), record('B', 5, 'Сложный')])
+    place = board.insert(record('C', 7, 'Средний'))
+
+    assert place == 2
+    assert [r['name'] for r in board.page()] == ['B', 'C', 'A']
+
+
+# Тест №1.2 (позитивный)
+def test_rank_of_new_result():
+    """Место нового результата определяется без вставки."""
+    board = Leaderboard([record('A', 10, 'Сложный'), record('B', 5, 'Сложный'), record('C', 50, 'Легкий')])
+
+    assert board.rank_of(7, 'Сложный') == 2
+    assert board.rank_of(100, 'Легкий') == 3
+    assert len(board) == 3
+
+
+# Тест №1.3 (негативный)
+def test_equal_results_keep_insertion_order():
+    """Равный результат встаёт после уже существующих, как при стабильной сортировке."""
+    board = Leaderboard([record('A', 10, 'Сложный')])
+
+    assert board.rank_of(10, 'Сложный') == 2
+    assert board.insert(record('B', 10, 'Сложный')) == 2
+    assert [r['name'] for r in board.page()] == ['A', 'B']
+
+
+# Тест №1.4 (позитивный)
+def test_page():
+    """Страница k..k+n берётся срезом готового индекса."""
+    board = Leaderboard([record(str(i), i, 'Легкий') for i in range(10)])
+    assert [r['name'] for r in board.page(2, 3)] == ['7', '6', '5']
+
+
+@pytest.fixture
+def text_records():
+    temp_dir = tempfile.TemporaryDirectory()
+    filename = os.path.join(temp_dir.name, 'records.txt')
+    with open(filename, 'w') as f:
+        f.write('A, 10.00, Легкий\nB, 5.00, Сложный\n')
+    yield Records(filename)
+    temp_dir.cleanup()
+
+
+# Тест №1.5 (позитивный)
+def test_pages_around_key():
+    """Соседние страницы читаются от ключа крайней строки."""
+    board = Leaderboard([record(f'P{i}', i, 'Легкий') for i in range(10)])
+    page = board.keyed_page(4, 2)
+
+    assert [r['name'] for _, r in page] == ['P5', 'P4']
+    assert [r['name'] for _, r in board.page_after(page[-1][0], 3)] == ['P3', 'P2', 'P1']
+    assert [r['name'] for _, r in board.page_before(page[0][0], 3)] == ['P8', 'P7', 'P6']
+    assert board.page_before(board.keyed_page(0, 1)[0][0], 3) == []
+
+
+# Тест №2.1 (позитивный)
+def test_records_file_read_once(text_records):
+    """Файл читается один раз, затем индекс обновляется при сохранении."""
+    with patch.object(text_records, 'read_records', wraps=text_records.read_records) as mock_read:
+        text_records.load_records()
+        place = text_records.save_record(record('C', 7.0, 'Сложный'))
+        loaded = text_records.load_records()
+
+    assert mock_read.call_count == 1
+    assert place == 1
+    assert [r['name'] for r in loaded] == ['C', 'B', 'A']
+    assert Records(text_records.filename).load_records() == loaded
+
+
+# Тест №2.2 (позитивный)
+def test_sqlite_rank_of():
+    """Место нового результата в базе SQLite."""
+    temp_dir = tempfile.TemporaryDirectory()
+    records = SqliteRecords(os.path.join(temp_dir.name, 'records.db'))
+    records.save_records([record('A', 10, 'Сложный'), record('B', 5, 'Сложный'), record('C', 50, 'Легкий')])
+
+    assert records.rank_of(7, 'Сложный') == 2
+    assert records.save_record(record('D', 7, 'Сложный')) == 2
+
+    records.close()
+    temp_dir.cleanup()
+
+
+# Тест №2.3 (позитивный)
+def test_sqlite_index_read_once():
+    """Индекс читается из базы один раз; дальше место и сохранение не выполняют запросов на чтение."""
+    temp_dir = tempfile.TemporaryDirectory()
+    records = SqliteRecords(os.path.join(temp_dir.name, 'records.db'))
+    records.save_records([record('A', 10, 'Сложный'), record('B', 50, 'Легкий')])
+    assert records.rank_of(60, 'Легкий') == 2
+
+    statements = []
+    records.connection.set_trace_callback(statements.append)
+    assert records.rank_of(5, 'Сложный') == 2
+    assert records.save_record(record('C', 5, 'Сложный')) == 2
+    assert records.rank_of(5, 'Сложный') == 3
+    assert records.count() == 3
+
+    assert not [sql for sql in statements if sql.lstrip().upper().startswith('SELECT')]
+    records.close()
+    temp_dir.cleanup()
+
+
+# Тест №3.1 (позитивный)
+def test_game_over_shows_placement():
+    """Экран окончания игры показывает место игрока."""
+    screen = Mock()
+    screen.get_size.return_value = (800, 600)
+    records = Mock()
+    records.rank_of.return_value = 3
+    game = Game(screen, 'Легкий', records=records)
+    game.elapsed_seconds = 42.0
+
+    assert game.placement_text() == 'Ваше место: 3'
+    records.rank_of.assert_called_once_with(42.0, 'Легкий')
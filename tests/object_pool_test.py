@@ -0,0 +1,105 @@
+import pygame
+from unittest.mock import Mock
+
+from app.bonus import Bonus
+from app.enemy import Enemy
+from app.headless import create_headless_game
+from app.object_pool import ObjectPool, RegisteredList, slot_append, swap_remove
+
+
+# Тест №1.1 (позитивный)
+def test_released_object_is_reused():
+    """Освобождённый враг выдаётся снова, с новыми параметрами и тем же Rect."""
+    pool = ObjectPool(Enemy)
+    enemy = pool.acquire((10, 10), 800, 600)
+    rect = enemy.rect
+    pool.release(enemy)
+
+    again = pool.acquire((200, 300), 800, 600)
+
+    assert again is enemy
+    assert again.rect is rect
+    assert again.rect.topleft == (200, 300)
+    assert again.grid is None
+    assert len(pool) == 0
+
+
+# Тест №1.2 (негативный)
+def test_foreign_objects_not_pooled():
+    """Посторонние объекты и объекты сверх лимита в пул не попадают."""
+    pool = ObjectPool(Bonus, max_free=1)
+    pool.release(Mock())
+    pool.release(Bonus((0, 0), 'life', 100, 100))
+    pool.release(Bonus((0, 0), 'life', 100, 100))
+
+    assert len(pool) == 1
+
+
+# Тест №1.3 (позитивный)
+def test_entities_have_slots():
+    """У врагов и бонусов нет __dict__ - поля хранятся в слотах."""
+    assert not hasattr(Enemy((0, 0), 800, 600), '__dict__')
+    assert not hasattr(Bonus((0, 0), 'shield', 800, 600), '__dict__')
+
+
+# Тест №2.1 (позитивный)
+def test_swap_remove_moves_last_item():
+    """При удалении на место элемента встаёт последний, его индекс обновляется."""
+    items = []
+    enemies = [Enemy((i * 40, 0), 800, 600) for i in range(4)]
+    for enemy in enemies:
+        slot_append(items, enemy)
+
+    swap_remove(items, enemies[1])
+
+    assert items == [enemies[0], enemies[3], enemies[2]]
+    assert enemies[3].slot == 1
+    swap_remove(items, enemies[3])
+    assert items == [enemies[0], enemies[2]]
+
+
+# Тест №2.2 (негативный)
+def test_swap_remove_without_slots():
+    """Список, собранный без slot_append, тоже обрабатывается верно."""
+    first, second, third = Mock(), Mock(), Mock()
+    items = [first, second, third]
+
+    swap_remove(items, first)
+
+    assert items == [third, second]
+
+
+# Тест №3.1 (позитивный)
+def test_expired_bonus_returns_to_pool():
+    """Истёкший бонус возвращается в пул и используется при следующем появлении."""
+    game = create_headless_game('Легкий', size=(800, 600), seed=1)
+    game.ship_size = (1, 1)  # игрок в углу не задевает бонусы
+    game.last_spawn_time = 0
+    game.last_bonus_time = 0
+    player_position = [0, 0]
+
+    game.game_logic(8000, player_position, 0)
+    bonus = game.bonuses[0]
+    game.game_logic(13500, player_position, 0)  # через 5 секунд бонус исчезает
+    assert game.bonuses == []
+    assert len(game.bonus_objects) == 1
+
+    game.game_logic(16000, player_position, 0)
+    assert game.bonuses == [bonus]
+    assert bonus.active
+
+
+# Тест №4.1 (позитивный)
+def test_registered_list_reports_changes():
+    """RegisteredList сообщает о каждом добавленном и убранном объекте, в том числе при swap_remove."""
+    added, removed = [], []
+    first, second, third = Mock(), Mock(), Mock()
+    items = RegisteredList(added.append, removed.append, [first])
+
+    items.append(second)
+    items[0] = third
+    swap_remove(items, third)
+
+    assert items == [second]
+    assert added == [first, second, third]
+    assert removed == [first, third]
@@ -0,0 +1,116 @@
+import json
+
+import pygame
+from unittest.mock import Mock, patch
+
+from app.game import Game
+from app.profiler import FrameProfiler
+
+
+# Тест №1.1 (позитивный)
+def test_disabled_profiler_records_nothing():
+    """Выключенный профилировщик не копит замеры и не создаёт объектов на каждую фазу."""
+    profiler = FrameProfiler()
+
+    with profiler.phase('game_logic'):
+        pass
+    profiler.begin_frame()
+
+    assert profiler.phase('a') is profiler.phase('b')
+    assert profiler.samples == {}
+    assert len(profiler.trace) == 0
+
+
+# Тест №1.2 (позитивный)
+def test_phase_durations_and_percentiles():
+    """Длительности фаз копятся в скользящем окне, перцентили считаются по ближайшему рангу."""
+    profiler = FrameProfiler(window=100, enabled=True)
+    for ms in range(1, 101):
+        profiler.record('render_game', 0, ms * 1_000_000)
+
+    assert profiler.percentile('render_game', 50) == 50
+    assert profiler.percentile('render_game', 95) == 95
+    assert profiler.percentile('render_game', 99) == 99
+    assert profiler.percentile('missing', 50) is None
+
+
+# Тест №1.3 (негативный)
+def test_window_keeps_only_recent_samples():
+    """Старые замеры вытесняются из окна."""
+    profiler = FrameProfiler(window=3, enabled=True)
+    for ms in (100, 1, 2, 3):
+        profiler.record('display', 0, ms * 1_000_000)
+
+    assert list(profiler.samples['display']) == [1, 2, 3]
+
+
+# Тест №1.4 (позитивный)
+def test_frame_times_from_perf_counter():
+    """Время кадра - разница показаний perf_counter_ns между началами кадров."""
+    profiler = FrameProfiler(enabled=True)
+    with patch('time.perf_counter_ns', side_effect=[0, 16_000_000, 50_000_000]):
+        profiler.begin_frame()
+        profiler.begin_frame()
+        profiler.begin_frame()
+
+    assert list(profiler.frame_times) == [16, 34]
+
+
+# Тест №2.1 (позитивный)
+def test_export_chrome_trace(tmp_path):
+    """Замеры выгружаются в формате trace-событий Chrome."""
+    profiler = FrameProfiler(enabled=True)
+    profiler.record('game_logic', 1_000_000, 3_500_000)
+
+    filename = profiler.export_chrome_trace(str(tmp_path / 'trace.json'))
+
+    with open(filename) as file:
+        trace = json.load(file)
+    assert trace['traceEvents'] == [{'name': 'game_logic', 'ph': 'X', 'ts': 1000, 'dur': 2500,
+                                     'pid': 1, 'tid': 1}]
+
+
+# Тест №2.2 (позитивный)
+def test_overlay_draws_in_corner():
+    """Оверлей рисуется в правом верхнем углу экрана."""
+    pygame.font.init()
+    screen = pygame.Surface((800, 600))
+    profiler = FrameProfiler(enabled=True)
+    for ms in (10, 20, 40):
+        profiler.frame_times.append(ms)
+    profiler.record('game_logic', 0, 1_000_000)
+
+    rect = profiler.draw(screen)
+
+    assert rect.topright == (800, 0)
+    assert rect.size == FrameProfiler.OVERLAY_SIZE
+
+
+# Тест №3.1 (позитивный)
+def test_f3_toggles_profiler():
+    """F3 включает оверлей и замеры, повторное нажатие - выключает."""
+    screen = Mock()
+    screen.get_size.return_value = (800, 600)
+    game = Game(screen, 'Легкий')
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+
+    with patch('pygame.event.get', return_value=[event]):
+        assert game.process_events() is True
+        assert game.profiler.enabled and game.profiler.overlay
+        game.process_events()
+    assert not game.profiler.enabled and not game.profiler.overlay
+
+
+# Тест №3.2 (позитивный)
+def test_step_phases_are_timed():
+    """Шаг симуляции размечается фазами game_logic, check_collision и move_enemies."""
+    screen = Mock()
+    screen.get_size.return_value = (800, 600)
+    game = Game(screen, 'Легкий', profiler=FrameProfiler(enabled=True))
+    game.last_spawn_time = 0
+
+    with patch('pygame.key.get_pressed', return_value={pygame.K_w: False, pygame.K_a: False,
+                                                         pygame.K_s: False, pygame.K_d: False}):
+        game.step(100, [400, 300], 5)
+
+    assert set(game.profiler.samples) == {'game_logic', 'check_collision', 'move_enemies'}
@@ -0,0 +1,121 @@
+from app.record_cursor import RecordCursor
+
+
+class FakeRecords:
+    # Хранилище на миллион рекордов, которые генерируются по запросу
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def count(self):
+        return self.total
+
+    def entries(self, start, end):
+        # Ключ строки - её номер в таблице
+        return [(i, {'name': f'P{i}', 'duration': float(i), 'difficulty': 'Легкий'}) for i in range(start, end)]
+
+    def keyed_records(self, limit=None, offset=0):
+        self.calls.append((limit, offset))
+        end = self.total if limit is None else min(offset + limit, self.total)
+        return self.entries(offset, end)
+
+    def records_after(self, key, limit):
+        self.calls.append(('after', key, limit))
+        return self.entries(key + 1, min(key + 1 + limit, self.total))
+
+    def records_before(self, key, limit):
+        self.calls.append(('before', key, limit))
+        return self.entries(max(0, key - limit), key)
+
+
+# Тест №1.1 (позитивный)
+def test_loads_only_visible_window():
+    """Загружается видимая часть с запасом, а не вся таблица."""
+    records = FakeRecords(1_000_000)
+    cursor = RecordCursor(records, page_size=20)
+
+    rows = cursor.rows(0)
+
+    assert [r['name'] for r in rows[:2]] == ['P0', 'P1']
+    assert len(rows) == 20
+    assert records.calls == [(60, 0)]
+    assert len(cursor) == 1_000_000
+
+
+# Тест №1.2 (позитивный)
+def test_scrolling_inside_window_does_not_reload():
+    """Прокрутка в пределах загруженного окна не обращается к хранилищу."""
+    records = FakeRecords(1_000_000)
+    cursor = RecordCursor(records, page_size=20)
+    cursor.rows(0)
+
+    for offset in range(1, 21):
+        rows = cursor.rows(offset)
+
+    assert rows[0]['name'] == 'P20'
+    assert len(records.calls) == 1
+
+
+# Тест №1.3 (позитивный)
+def test_window_moves_with_scroll():
+    """При выходе за окно загружается новое окно вокруг позиции прокрутки."""
+    records = FakeRecords(1_000_000)
+    cursor = RecordCursor(records, page_size=20)
+    cursor.rows(0)
+
+    rows = cursor.rows(500_000)
+
+    assert rows[0]['name'] == 'P500000'
+    assert records.calls[-1] == (60, 499_980)
+    assert len(cursor.window) == 60
+
+
+# Тест №1.4 (негативный)
+def test_end_of_table():
+    """В конце таблицы возвращается столько строк, сколько осталось."""
+    records = FakeRecords(25)
+    cursor = RecordCursor(records, page_size=20)
+
+    assert len(cursor.rows(5)) == 20
+    assert len(cursor.rows(20)) == 5
+    assert len(records.calls) == 1
+
+
+# Тест №1.5 (негативный)
+def test_empty_table():
+    """Пустая таблица не вызывает ошибок."""
+    cursor = RecordCursor(FakeRecords(0), page_size=20)
+    assert cursor.rows(0) == []
+
+
+# Тест №1.6 (позитивный)
+def test_scrolling_down_reads_after_last_row():
+    """Прокрутка вниз дочитывает окно от ключа последней строки, без смещения."""
+    records = FakeRecords(1_000_000)
+    cursor = RecordCursor(records, page_size=20)
+    cursor.rows(0)
+
+    rows = cursor.rows(41)
+
+    assert rows[0]['name'] == 'P41'
+    assert records.calls[-1] == ('after', 59, 21)
+    assert cursor.window_range() == (21, 81)
+    for offset in range(42, 1000):
+        rows = cursor.rows(offset)
+    assert [r['name'] for r in rows] == [f'P{i}' for i in range(999, 1019)]
+    assert all(call[0] == 'after' for call in records.calls[1:])
+
+
+# Тест №1.7 (позитивный)
+def test_scrolling_up_reads_before_first_row():
+    """Прокрутка вверх дочитывает окно перед первой строкой."""
+    records = FakeRecords(1_000_000)
+    cursor = RecordCursor(records, page_size=20)
+    cursor.rows(500_000)
+
+    rows = cursor.rows(499_979)
+
+    assert [r['name'] for r in rows] == [f'P{i}' for i in range(499_979, 499_999)]
+    assert records.calls[-1] == ('before', 499_980, 21)
+    assert cursor.window_range() == (499_959, 500_019)
+    assert cursor.window[0]['name'] == 'P499959'
@@ -1,52 +1,276 @@
-import unittest
-import os
-import tempfile
-from app.records import Records
-
-class TestRecords(unittest.TestCase):
-    def setUp(self):
-        # Создаем временный файл для тестов
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.filename = self.temp_file.name
-        self.temp_file.close()
-        self.records = Records(filename=self.filename)
-
-    def tearDown(self):
-        # Удаляем временный файл после теста
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
-
-    def test_save_record_positive(self):
-        # Тест №1.1: успешное сохранение записи
-        data = {'name': 'Player1', 'duration': 12.34, 'difficulty': 'Средний'}
-        self.records.save_record(data)
-        with open(self.filename, 'r') as f:
-            content = f.read()
-        self.assertIn('Player1', content)
-        self.assertIn('12.34', content)
-        self.assertIn('Средний', content)
-
-    def test_load_records_single(self):
-        # Тест №2.1: загрузка одного рекорда
-        with open(self.filename, 'w') as f:
-            f.write('Player2, 15.50, Легкий\n')
-        loaded = self.records.load_records()
-        self.assertEqual(len(loaded), 1)
-        self.assertEqual(loaded[0]['name'], 'Player2')
-        self.assertEqual(loaded[0]['duration'], 15.50)
-        self.assertEqual(loaded[0]['difficulty'], 'Легкий')
-
-    def test_load_records_empty(self):
-        # Тест №2.2: пустой файл
-        open(self.filename, 'w').close()
-        loaded = self.records.load_records()
-        self.assertEqual(loaded, [])
-
-    def test_load_records_no_file(self):
-        # Тест №2.3: файл не существует
-        # Удаляем файл
-        os.remove(self.filename)
-        # Создаем экземпляр с несуществующим файлом
-        rec = Records(filename=self.filename)
-        loaded = rec.load_records()
-        self.assertEqual(loaded, [])
\ No newline at end of file
+import unittest
+import os
+import sqlite3
+import tempfile
+from app.records import RecordWriter, Records, SqliteRecords
+
+class TestRecords(unittest.TestCase):
+    def setUp(self):
+        # Создаем временный файл для тестов
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
+        self.filename = self.temp_file.name
+        self.temp_file.close()
+        self.records = Records(filename=self.filename)
+
+    def tearDown(self):
+        # Удаляем временный файл после теста
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def test_save_record_positive(self):
+        # Тест №1.1: успешное сохранение записи
+        data = {'name': 'Player1', 'duration': 12.34, 'difficulty': 'Средний'}
+        self.records.save_record(data)
+        with open(self.filename, 'r') as f:
+            content = f.read()
+        self.assertIn('Player1', content)
+        self.assertIn('12.34', content)
+        self.assertIn('Средний', content)
+
+    def test_load_records_single(self):
+        # Тест №2.1: загрузка одного рекорда
+        with open(self.filename, 'w') as f:
+            f.write('Player2, 15.50, Легкий\n')
+        loaded = self.records.load_records()
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0]['name'], 'Player2')
+        self.assertEqual(loaded[0]['duration'], 15.50)
+        self.assertEqual(loaded[0]['difficulty'], 'Легкий')
+
+    def test_load_records_empty(self):
+        # Тест №2.2: пустой файл
+        open(self.filename, 'w').close()
+        loaded = self.records.load_records()
+        self.assertEqual(loaded, [])
+
+    def test_load_records_no_file(self):
+        # Тест №2.3: файл не существует
+        # Удаляем файл
+        os.remove(self.filename)
+        # Создаем экземпляр с несуществующим файлом
+        rec = Records(filename=self.filename)
+        loaded = rec.load_records()
+        self.assertEqual(loaded, [])
+
+    def test_load_records_page(self):
+        # Тест №2.4: постраничная загрузка в порядке таблицы рекордов
+        with open(self.filename, 'w') as f:
+            f.write('A, 10.00, Легкий\nB, 5.00, Сложный\nC, 20.00, Легкий\n')
+        page = self.records.load_records(limit=2, offset=1)
+        self.assertEqual([r['name'] for r in page], ['C', 'A'])
+
+
+class TestSqliteRecords(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_name = os.path.join(self.temp_dir.name, 'records.db')
+        self.text_name = os.path.join(self.temp_dir.name, 'records.txt')
+        self.records = SqliteRecords(self.db_name)
+
+    def tearDown(self):
+        self.records.close()
+        self.temp_dir.cleanup()
+
+    def test_save_and_load(self):
+        # Тест №3.1: сохранённый рекорд читается обратно
+        self.records.save_record({'name': 'Player1', 'duration': 12.345, 'difficulty': 'Средний'})
+        loaded = self.records.load_records()
+        self.assertEqual(loaded, [{'name': 'Player1', 'duration': 12.35, 'difficulty': 'Средний'}])
+
+    def test_leaderboard_order_and_paging(self):
+        # Тест №3.2: порядок как у текстового хранилища, выборка по страницам
+        for name, duration, difficulty in [('A', 10, 'Легкий'), ('B', 5, 'Сложный'),
+                                           ('C', 20, 'Легкий'), ('D', 7, 'Средний'), ('E', 9, 'Сложный')]:
+            self.records.save_record({'name': name, 'duration': duration, 'difficulty': difficulty})
+        names = [r['name'] for r in self.records.load_records()]
+        self.assertEqual(names, ['E', 'B', 'D', 'C', 'A'])
+        self.assertEqual([r['name'] for r in self.records.load_records(limit=2, offset=2)], ['D', 'C'])
+        self.assertEqual(self.records.count(), 5)
+
+    def test_query_uses_index(self):
+        # Тест №3.3: выборка top-N идёт по индексу, без сортировки во временном дереве
+        plan = self.records.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT name, duration, difficulty FROM records "
+            "ORDER BY difficulty_rank, duration DESC LIMIT 10").fetchall()
+        details = ' '.join(row[-1] for row in plan)
+        self.assertIn('records_leaderboard', details)
+        self.assertNotIn('TEMP B-TREE', details)
+
+    def test_keyset_pages_match_table_order(self):
+        # Тест №3.4: страницы от ключа крайней строки совпадают с порядком таблицы, в том числе при равных временах
+        rows = [{'name': f'P{i}', 'duration': (i * 7) % 5, 'difficulty': ('Легкий', 'Средний', 'Сложный')[i % 3]}
+                for i in range(60)]
+        self.records.save_records(rows)
+        table = self.records.keyed_records()
+        self.assertEqual([record for _, record in table], self.records.load_records())
+        key = table[25][0]
+        self.assertEqual(self.records.records_after(key, 20), table[26:46])
+        self.assertEqual(self.records.records_before(key, 20), table[5:25])
+        self.assertEqual(self.records.records_after(table[-1][0], 20), [])
+        self.assertEqual(self.records.records_before(table[3][0], 20), table[:3])
+
+    def test_keyset_queries_use_index(self):
+        # Тест №3.5: чтение от ключа идёт по индексу, без OFFSET и сортировки во временном дереве
+        self.records.save_records([{'name': 'A', 'duration': 5, 'difficulty': 'Средний'}])
+        statements = []
+        self.records.connection.set_trace_callback(statements.append)
+        self.records.records_after((2, 5.0, 1), 10)
+        self.records.records_before((2, 5.0, 1), 10)
+        self.records.connection.set_trace_callback(None)
+        self.assertEqual(len(statements), 6)
+        for sql in statements:
+            self.assertNotIn('OFFSET', sql)
+            plan = self.records.connection.execute('EXPLAIN QUERY PLAN ' + sql).fetchall()
+            details = ' '.join(row[-1] for row in plan)
+            self.assertIn('USING INDEX records_leaderboard', details)
+            self.assertNotIn('TEMP B-TREE', details)
+
+    def test_index_follows_other_connection(self):
+        # Тест №3.6: запись другой кассы в общую базу видна месту и числу записей, как и страницам
+        self.records.save_record({'name': 'A', 'duration': 10, 'difficulty': 'Легкий'})
+        self.assertEqual(self.records.count(), 1)
+        other = SqliteRecords(self.db_name)
+        other.save_record({'name': 'B', 'duration': 20, 'difficulty': 'Легкий'})
+        other.close()
+        self.assertEqual(self.records.count(), 2)
+        self.assertEqual(self.records.rank_of(15, 'Легкий'), 2)
+        self.assertEqual([r['name'] for r in self.records.load_records()], ['B', 'A'])
+        self.assertEqual(self.records.save_record({'name': 'C', 'duration': 30, 'difficulty': 'Легкий'}), 1)
+
+    def test_migrate_from_text_once(self):
+        # Тест №4.1: перенос рекордов из текстового файла выполняется один раз
+        with open(self.text_name, 'w') as f:
+            f.write('Player2, 15.50, Легкий\nPlayer3, 3.00, Сложный\n')
+        self.assertEqual(self.records.migrate_from_text(self.text_name), 2)
+        self.assertEqual(self.records.migrate_from_text(self.text_name), 0)
+        self.assertEqual([r['name'] for r in self.records.load_records()], ['Player3', 'Player2'])
+
+    def test_migrate_without_text_file(self):
+        # Тест №4.2: отсутствие текстового файла не приводит к ошибке
+        self.assertEqual(self.records.migrate_from_text(self.text_name), 0)
+        self.assertEqual(self.records.load_records(), [])
+
+
+    def test_migrate_cp1251_file(self):
+        # Тест №4.3: файл в кодировке cp1251 (как data/records.txt) переносится без ошибок декодирования
+        with open(self.text_name, 'w', encoding='cp1251') as f:
+            f.write('Игрок, 15.50, Легкий\nexample, 2.79, Сложный\n')
+        self.assertEqual(self.records.migrate_from_text(self.text_name), 2)
+        self.assertEqual(self.records.load_records(),
+                         [{'name': 'example', 'duration': 2.79, 'difficulty': 'Сложный'},
+                          {'name': 'Игрок', 'duration': 15.5, 'difficulty': 'Легкий'}])
+
+    def test_migrate_is_atomic(self):
+        # Тест №4.4: сбой при отметке о переносе откатывает и вставленные строки, повтор переносит их один раз
+        with open(self.text_name, 'w', encoding='utf-8') as f:
+            f.write('Игрок, 15.50, Легкий\n')
+        connection = self.records.connection
+
+        class FailingConnection:
+            def __getattr__(self, name):
+                return getattr(connection, name)
+
+            def __enter__(self):
+                return connection.__enter__()
+
+            def __exit__(self, *exc):
+                return connection.__exit__(*exc)
+
+            def execute(self, sql, *args):
+                if sql == "PRAGMA user_version = 1":
+                    raise sqlite3.OperationalError("disk I/O error")
+                return connection.execute(sql, *args)
+
+        self.records.connection = FailingConnection()
+        with self.assertRaises(sqlite3.OperationalError):
+            self.records.migrate_from_text(self.text_name)
+        self.records.connection = connection
+        self.assertEqual(self.records.count(), 0)
+        self.assertEqual(self.records.migrate_from_text(self.text_name), 1)
+        self.assertEqual(self.records.count(), 1)
+
+class TestWriteBehind(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.text_name = os.path.join(self.temp_dir.name, 'records.txt')
+        self.db_name = os.path.join(self.temp_dir.name, 'records.db')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_text_read_your_writes(self):
+        # Тест №5.1: отложенная запись видна следующему чтению, место считается сразу
+        records = Records(self.text_name, write_behind=True)
+        self.assertEqual(records.save_record({'name': 'A', 'duration': 10, 'difficulty': 'Легкий'}), 1)
+        self.assertEqual(records.save_record({'name': 'B', 'duration': 20, 'difficulty': 'Легкий'}), 1)
+        self.assertEqual([r['name'] for r in records.load_records()], ['B', 'A'])
+        records.close()
+        with open(self.text_name) as f:
+            self.assertEqual(f.read(), 'A, 10.00, Легкий\nB, 20.00, Легкий\n')
+        self.assertEqual(len(Records(self.text_name).load_records()), 2)
+
+    def test_sqlite_drained_on_close(self):
+        # Тест №5.2: при закрытии очередь дописывается в базу целиком
+        records = SqliteRecords(self.db_name, write_behind=True)
+        places = [records.save_record({'name': f'P{i}', 'duration': i, 'difficulty': 'Средний'})
+                  for i in range(100)]
+        self.assertEqual(places, [1] * 100)
+        self.assertEqual(records.count(), 100)
+        records.close()
+        reopened = SqliteRecords(self.db_name)
+        self.assertEqual(reopened.load_records(limit=1), [{'name': 'P99', 'duration': 99, 'difficulty': 'Средний'}])
+        reopened.close()
+
+    def test_writes_batched(self):
+        # Тест №5.3: записи, накопившиеся в очереди, пишутся одной пачкой
+        batches = []
+        writer = RecordWriter(batches.append, batch_size=64)
+        writer.queue.put(None)  # занимаем поток, пока в очередь добавляются записи
+        for i in range(10):
+            writer.write(i)
+        writer.close()
+        self.assertEqual(sum(batches, []), [None] + list(range(10)))
+        self.assertLessEqual(len(batches), 2)
+
+    def test_failed_write_reported(self):
+        # Тест №5.4: ошибка записи не теряет рекорд и сообщается при закрытии
+        records = Records(os.path.join(self.temp_dir.name, 'missing', 'records.txt'), write_behind=True)
+        records.save_record({'name': 'A', 'duration': 1, 'difficulty': 'Легкий'})
+        records.writer.flush()
+        self.assertEqual(len(records.writer.unwritten), 1)
+        with self.assertRaises(FileNotFoundError):
+            records.close()
+        with self.assertRaises(ValueError):
+            records.save_record({'name': 'B', 'duration': 2, 'difficulty': 'Легкий'})
+
+    def test_sqlite_save_does_not_wait_for_writer(self):
+        # Тест №5.5: сохранение с отложенной записью не ждёт очередь и не считает место в базе
+        records = SqliteRecords(self.db_name, write_behind=True)
+        records.save_records([{'name': 'A', 'duration': 30, 'difficulty': 'Средний'}])
+        records.leaderboard()
+        flushes = []
+        records.sync = lambda: flushes.append(True)
+        place = records.save_record({'name': 'B', 'duration': 20, 'difficulty': 'Средний'})
+        self.assertEqual(place, 2)
+        self.assertEqual(flushes, [])
+        records.close()
+
+    def test_unexpected_error_keeps_writer_alive(self):
+        # Тест №5.6: неожиданная ошибка записи не останавливает поток, и flush не зависает
+        batches = []
+
+        def write_batch(records):
+            if 'bad' in records:
+                raise ValueError('bad record')
+            batches.append(records)
+
+        writer = RecordWriter(write_batch)
+        with self.assertLogs('app.records', level='ERROR'):
+            writer.write('bad')
+            writer.flush()
+        self.assertIsInstance(writer.error, ValueError)
+        self.assertTrue(writer.thread.is_alive())
+        writer.write('good')
+        writer.flush()
+        self.assertEqual(batches, [['good']])
+        writer.close()
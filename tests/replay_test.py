@@ -0,0 +1,130 @@
+import pygame
+import pytest
+
+from app.clock import SimulatedClock, StepClock
+from app.game import Game
+from app.headless import CallbackInput, KeyState
+from app.replay import HEADER, InputLog, InputRecorder, pack_keys, play, replay, unpack_keys
+
+
+def record_session(steps, seed=7, **options):
+    # Сессия с «живым» вводом, записанная в журнал
+    def policy(game):
+        # Кружим по экрану, меняя направление каждые 40 шагов
+        phase = len(recorder.frames) // 40 % 4
+        return [[pygame.K_d], [pygame.K_s], [pygame.K_a], [pygame.K_w]][phase]
+
+    source = CallbackInput(policy)
+    recorder = InputRecorder(source)
+    game = Game(pygame.Surface((800, 600)), 'Сложный', input_source=recorder,
+                time_source=StepClock(SimulatedClock(1234)), seed=seed, **options)
+    source.game = game
+    game.begin_session()
+    player_position = play(game, steps)
+    return game, player_position, recorder.to_log(game)
+
+
+def enemy_state(game):
+    if game.enemy_pool is not None:
+        return game.enemy_pool.pos[:len(game.enemy_pool)].tolist()
+    return [(enemy.rect.topleft, enemy.speed, tuple(enemy.direction)) for enemy in game.enemies]
+
+
+# Тест №1.1 (позитивный)
+def test_pack_keys_roundtrip():
+    """Нажатия WASD упаковываются в один байт и восстанавливаются."""
+    mask = pack_keys(KeyState([pygame.K_w, pygame.K_d]))
+
+    assert mask < 256
+    keys = unpack_keys(mask)
+    assert keys[pygame.K_w] and keys[pygame.K_d]
+    assert not keys[pygame.K_a] and not keys[pygame.K_s]
+
+
+# Тест №1.2 (позитивный)
+def test_log_roundtrip(tmp_path):
+    """Журнал сохраняется в файл и читается обратно без потерь."""
+    log = InputLog('Средний', (1920, 1080), 60, 2 ** 40 + 3, (1500, 1.5), b'\x01\x00\x09',
+                   {'use_enemy_pool': True, 'swept_collisions': True})
+    filename = tmp_path / 'session.rec'
+    log.save(filename)
+
+    loaded = InputLog.load(filename)
+
+    assert filename.stat().st_size == HEADER.size + 3
+    assert (loaded.difficulty, loaded.size, loaded.sim_rate, loaded.seed, loaded.session_start, loaded.frames) == \
+        ('Средний', (1920, 1080), 60, 2 ** 40 + 3, (1500, 1.5), b'\x01\x00\x09')
+    assert loaded.options == {'use_enemy_pool': True, 'enemy_collisions': False, 'analytic_enemies': False,
+                              'swept_collisions': True}
+
+
+# Тест №1.3 (негативный)
+def test_log_rejects_foreign_data():
+    """Чужие или обрезанные данные не принимаются за журнал."""
+    with pytest.raises(ValueError):
+        InputLog.from_bytes(b'abc')
+    with pytest.raises(ValueError):
+        InputLog.from_bytes(b'X' * HEADER.size)
+
+
+# Тест №2.1 (позитивный)
+def test_same_seed_same_spawns():
+    """Игры с одинаковым сидом создают одинаковых врагов."""
+    first = Game(pygame.Surface((800, 600)), 'Легкий', seed=42)
+    second = Game(pygame.Surface((800, 600)), 'Легкий', seed=42)
+    for _ in range(5):
+        first.spawn_enemy([400, 300])
+        second.spawn_enemy([400, 300])
+
+    assert enemy_state(first) == enemy_state(second)
+
+
+@pytest.mark.parametrize('use_enemy_pool', [False, True])
+# Тест №2.2 (позитивный)
+def test_replay_reproduces_session(use_enemy_pool):
+    """Повтор журнала даёт в точности то же состояние игры."""
+    game, player_position, log = record_session(1200, use_enemy_pool=use_enemy_pool)
+
+    replayed, replayed_position = replay(InputLog.from_bytes(log.to_bytes()))
+
+    assert replayed.game_over == game.game_over
+    assert replayed_position == player_position
+    assert replayed.lives == game.lives
+    assert replayed.elapsed_seconds == game.elapsed_seconds
+    assert enemy_state(replayed) == enemy_state(game)
+    assert [bonus.rect.topleft for bonus in replayed.bonuses] == [bonus.rect.topleft for bonus in game.bonuses]
+
+
+# Тест №2.3 (негативный)
+def test_other_seed_diverges():
+    """С другим сидом та же запись ввода даёт другую сессию."""
+    game, _, log = record_session(600)
+    log.seed += 1
+
+    replayed, _ = replay(log)
+
+    assert enemy_state(replayed) != enemy_state(game)
+
+
+
+# Тест №2.4 (позитивный)
+def test_replay_restores_game_options():
+    """Настройки Game берутся из журнала: повтор без аргументов совпадает с записью, как у main."""
+    options = {'use_enemy_pool': True, 'enemy_collisions': True, 'swept_collisions': True}
+    game, player_position, log = record_session(1200, **options)
+
+    replayed, replayed_position = replay(InputLog.from_bytes(log.to_bytes()))
+
+    assert replayed.enemy_collisions and replayed.swept_collisions and replayed.enemy_pool is not None
+    assert replayed_position == player_position
+    assert replayed.lives == game.lives
+    assert enemy_state(replayed) == enemy_state(game)
+
+# Тест №3.1 (позитивный)
+def test_step_clock_follows_simulation():
+    """Таймеры игры идут по времени шага, а не по часам кадров."""
+    clock = StepClock(SimulatedClock(5000))
+    clock.sync(16.5)
+
+    assert clock.ticks() == 5000
+    assert clock.now() == 0.0165
@@ -0,0 +1,92 @@
+from unittest.mock import Mock, patch
+
+from app.bonus import Bonus
+from app.headless import create_headless_game
+from app.scheduler import Scheduler
+
+
+# Тест №1.1 (позитивный)
+def test_events_fire_in_due_order():
+    """События срабатывают по порядку сроков и только после наступления срока."""
+    scheduler = Scheduler()
+    scheduler.advance(0)
+    fired = []
+    scheduler.schedule_at(300, fired.append, 'c')
+    scheduler.schedule_at(100, fired.append, 'a')
+    scheduler.schedule_at(200, fired.append, 'b')
+
+    scheduler.advance(200)
+    scheduler.run_due()
+    assert fired == ['a']
+
+    scheduler.advance(1000)
+    scheduler.run_due()
+    assert fired == ['a', 'b', 'c']
+    assert len(scheduler) == 0
+
+
+# Тест №1.2 (негативный)
+def test_cancelled_timer_does_not_fire():
+    """Отменённый таймер пропускается."""
+    scheduler = Scheduler()
+    scheduler.advance(0)
+    callback = Mock()
+    scheduler.schedule(100, callback).cancel()
+
+    scheduler.advance(500)
+
+    assert scheduler.run_due() == 0
+    callback.assert_not_called()
+
+
+# Тест №1.3 (позитивный)
+def test_pause_and_time_scale():
+    """На паузе игровое время стоит, time_scale меняет его скорость."""
+    scheduler = Scheduler()
+    scheduler.advance(1000)
+    scheduler.pause()
+    scheduler.advance(5000)
+    assert scheduler.time == 1000
+
+    scheduler.resume()
+    scheduler.time_scale = 0.5
+    scheduler.advance(7000)
+    assert scheduler.time == 2000
+
+
+# Тест №2.1 (позитивный)
+def test_bonuses_not_polled_every_frame():
+    """Игра не опрашивает каждый бонус в кадре: исчезновение приходит событием."""
+    game = create_headless_game('Легкий', size=(1920, 1080), seed=3)
+    game.ship_size = (1, 1)
+    game.last_spawn_time = 0
+    game.last_bonus_time = 0
+    player_position = [0, 0]
+
+    with patch.object(Bonus, 'update') as mock_update:
+        game.game_logic(7100, player_position, 0)
+        assert len(game.bonuses) == 1
+        for current_time in range(7200, 12100, 100):
+            game.game_logic(current_time, player_position, 0)
+        assert len(game.bonuses) == 1
+        game.game_logic(12200, player_position, 0)
+
+    mock_update.assert_not_called()
+    assert game.bonuses == []
+
+
+# Тест №2.2 (позитивный)
+def test_paused_timers_stop_spawning():
+    """Пока очередь таймеров на паузе, враги не появляются."""
+    game = create_headless_game('Сложный', size=(1920, 1080), seed=3)
+    game.last_spawn_time = 0
+    player_position = [400, 300]
+    game.game_logic(500, player_position, 0)
+
+    game.timers.pause()
+    game.game_logic(5000, player_position, 0)
+    assert len(game.enemies) == 0
+
+    game.timers.resume()
+    game.game_logic(5600, player_position, 0)
+    assert len(game.enemies) == 1
@@ -0,0 +1,99 @@
+import pygame
+
+from app.bonus import Bonus
+from app.enemy import Enemy
+from app.game import Game
+from app.spatial_hash import SpatialHash
+
+
+class Box:
+    def __init__(self, x, y, w=32, h=32):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+# Тест №1.1 (позитивный)
+def test_query_returns_nearby_objects():
+    """Запрос возвращает объекты из ячеек, которые покрывает прямоугольник."""
+    grid = SpatialHash(64)
+    near = Box(100, 100)
+    far = Box(1000, 800)
+    grid.insert(near)
+    grid.insert(far)
+
+    found = grid.query(pygame.Rect(90, 90, 64, 64))
+
+    assert near in found
+    assert far not in found
+
+
+# Тест №1.2 (позитивный)
+def test_object_on_cell_border_reported_once():
+    """Объект, лежащий сразу в нескольких ячейках, возвращается один раз."""
+    grid = SpatialHash(64)
+    box = Box(50, 50)  # занимает 4 ячейки
+    grid.insert(box)
+
+    found = grid.query(pygame.Rect(0, 0, 128, 128))
+
+    assert found == [box]
+
+
+# Тест №2.1 (позитивный)
+def test_update_moves_object_between_cells():
+    """После перемещения объект ищется по новому месту."""
+    grid = SpatialHash(64)
+    box = Box(10, 10)
+    grid.insert(box)
+
+    box.rect.topleft = (500, 500)
+    grid.update(box)
+
+    assert grid.colliding(pygame.Rect(0, 0, 64, 64)) == []
+    assert grid.colliding(pygame.Rect(490, 490, 64, 64)) == [box]
+
+
+# Тест №3.1 (негативный)
+def test_remove_unknown_object():
+    """Удаление незарегистрированного объекта не вызывает ошибок."""
+    grid = SpatialHash(64)
+    grid.remove(Box(0, 0))
+    assert len(grid) == 0
+
+
+# Тест №2.2 (позитивный)
+def test_enemy_move_updates_grid():
+    """Enemy.move сам переносит врага в новые ячейки сетки."""
+    grid = SpatialHash(64)
+    enemy = Enemy((100, 100), 1600, 900)
+    enemy.speed = 3
+    enemy.direction = [1, 1]
+    enemy.grid = grid
+    grid.insert(enemy)
+
+    for _ in range(100):
+        enemy.move()
+
+    assert grid.ranges[enemy] == grid.cell_range(enemy.rect)
+    assert enemy in grid.colliding(enemy.rect)
+
+
+# Тест №4.1 (позитивный)
+def test_game_lists_register_objects():
+    """Враги и бонусы, добавленные в списки игры или подменённые присваиванием, сразу попадают в сетки."""
+    game = Game(pygame.Surface((800, 600)), 'Легкий', enemy_collisions=True)
+    game.enemies.append(Enemy((100, 100), 800, 600))
+    game.bonuses = [Bonus((100, 100), 'life', 800, 600)]
+    bonus = game.bonuses[0]
+
+    # Подмена врага тем же числом объектов: старый уходит из сетки, новый появляется
+    enemy = Enemy((400, 300), 800, 600)
+    old = game.enemies[0]
+    game.enemies[0] = enemy
+
+    assert old not in game.enemy_grid and old not in game.enemy_sweep
+    assert enemy.grid is game.enemy_grid and enemy in game.enemy_grid and enemy in game.enemy_sweep
+    assert game.bonus_grid.colliding(pygame.Rect(100, 100, 10, 10)) == [bonus]
+
+    game.check_collision(pygame.Rect(400, 300, 64, 64))
+
+    assert game.enemies == [] and len(game.enemy_grid) == 0 and len(game.enemy_sweep) == 0
@@ -0,0 +1,69 @@
+import pygame
+from unittest.mock import MagicMock, patch
+
+from app.bonus import Bonus
+from app.enemy import Enemy
+from app.game import Game
+from app.sprites import blit_rects, get_sprite
+
+
+# Тест №1.1 (позитивный)
+def test_sprite_is_cached():
+    """Спрайт одного размера и цвета создаётся один раз."""
+    sprite = get_sprite((32, 32), (255, 0, 0))
+    assert get_sprite([32, 32], [255, 0, 0]) is sprite
+    assert sprite.get_at((5, 5)) == (255, 0, 0)
+
+
+# Тест №1.2 (позитивный)
+def test_blit_rects_one_call_per_size():
+    """Объекты одного размера выводятся одним вызовом blits."""
+    screen = MagicMock()
+    rects = [pygame.Rect(i * 40, 0, 32, 32) for i in range(5)] + [pygame.Rect(0, 100, 16, 16)]
+
+    blit_rects(screen, (255, 0, 0), rects)
+
+    assert screen.blits.call_count == 2
+    sizes = sorted(len(call.args[0]) for call in screen.blits.call_args_list)
+    assert sizes == [1, 5]
+
+
+# Тест №1.3 (негативный)
+def test_blit_rects_nothing_to_draw():
+    """Пустой список не приводит к вызову blits."""
+    screen = MagicMock()
+    assert blit_rects(screen, (255, 0, 0), []) == []
+    screen.blits.assert_not_called()
+
+
+# Тест №2.1 (позитивный)
+def test_bonus_color_computed_once():
+    """Цвет бонуса определяется при создании, а не при каждой отрисовке."""
+    life = Bonus((0, 0), 'life', 100, 100)
+    shield = Bonus((0, 0), 'shield', 100, 100)
+    assert life.color == (0, 255, 0)
+    assert shield.color == (0, 0, 255)
+
+    screen = pygame.Surface((100, 100))
+    life.draw(screen)
+    assert screen.get_at((10, 10)) == (0, 255, 0)
+
+
+# Тест №2.2 (позитивный)
+def test_render_game_batches_enemies():
+    """render_game выводит всех врагов списка и пула одним blits на вид."""
+    screen = MagicMock()
+    screen.get_size.return_value = (800, 600)
+    screen.blits.side_effect = lambda pairs: [rect for _, rect in pairs]
+    game = Game(screen, 'Легкий', use_enemy_pool=True)
+    game.ship_image = pygame.Surface((64, 64))
+    game.hud = {name: MagicMock() for name in ('timer', 'lives', 'shield')}
+    game.enemies = [Enemy((i * 40, 100), 800, 600) for i in range(10)]
+    for i in range(10):
+        game.enemy_pool.add((i * 40, 300), 1, (1, 1))
+
+    with patch('pygame.display.flip'):
+        game.render_game([400, 300], '0:00')
+
+    assert screen.blits.call_count == 2
+    assert all(len(call.args[0]) == 10 for call in screen.blits.call_args_list)
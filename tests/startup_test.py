@@ -0,0 +1,47 @@
+import time
+
+import pygame
+
+from app.startup import FAST_START_MODULES, StartupTimer, init_pygame
+
+
+# Тест №1.1 (позитивный)
+def test_fast_start_initialises_needed_modules_only():
+    """Быстрый запуск поднимает окно и шрифты, но не звук и не джойстики."""
+    pygame.quit()
+    try:
+        init_pygame(fast=True)
+        assert pygame.display.get_init()
+        assert pygame.font.get_init()
+        assert not pygame.mixer.get_init()
+        assert not pygame.joystick.get_init()
+        assert FAST_START_MODULES == ('display', 'font')
+    finally:
+        pygame.quit()
+
+
+# Тест №2.1 (позитивный)
+def test_startup_timer_phases():
+    """Каждый этап считается от предыдущей отметки, итог - сумма этапов."""
+    timer = StartupTimer()
+    time.sleep(0.01)
+    timer.mark('окно')
+    timer.mark('меню')
+
+    names = [name for name, _ in timer.phases]
+    assert names == ['окно', 'меню']
+    assert timer.phases[0][1] >= 0.01
+    assert abs(timer.total() - sum(seconds for _, seconds in timer.phases)) < 1e-9
+
+
+# Тест №2.2 (позитивный)
+def test_startup_timer_report():
+    """В отчёте по строке на этап и итог до первого кадра."""
+    timer = StartupTimer(start=time.perf_counter() - 0.5)
+    timer.mark('импорт модулей')
+
+    lines = timer.report().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith('импорт модулей')
+    assert lines[1].startswith('итого до первого кадра')
+    assert lines[1].endswith('мс')
@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+import pygame
+
+from app.enemy import Enemy
+from app.enemy_pool import EnemyPool
+from app.game import Game
+from app.sweep_prune import SweepAndPrune, sweep_pairs
+
+
+class Box:
+    def __init__(self, x, y, size=32):
+        self.rect = pygame.Rect(x, y, size, size)
+
+
+def brute_force_pairs(boxes):
+    return {frozenset((a, b)) for i, a in enumerate(boxes) for b in boxes[i + 1:] if a.rect.colliderect(b.rect)}
+
+
+# Тест №1.1 (позитивный)
+def test_pairs_match_brute_force():
+    """Проход по упорядоченному списку находит те же пары, что и перебор всех пар."""
+    rnd = random.Random(1)
+    boxes = [Box(rnd.randint(0, 600), rnd.randint(0, 400)) for _ in range(200)]
+    sweep = SweepAndPrune()
+    for box in boxes:
+        sweep.insert(box)
+
+    found = {frozenset(pair) for pair in sweep.pairs()}
+
+    assert found == brute_force_pairs(boxes)
+    assert len(found) > 0
+
+
+# Тест №1.2 (позитивный)
+def test_pairs_after_movement_and_removal():
+    """После сдвига объектов и удаления одного пересортировка даёт верные пары."""
+    boxes = [Box(0, 0), Box(100, 0), Box(200, 0)]
+    sweep = SweepAndPrune()
+    sweep.rebuild(boxes)
+    assert sweep.pairs() == []
+
+    boxes[2].rect.x = 10  # третий догнал первый и обогнал второй
+    boxes[1].rect.x = 20
+    assert {frozenset(pair) for pair in sweep.pairs()} == brute_force_pairs(boxes)
+
+    sweep.remove(boxes[0])
+    sweep.remove(boxes[0])  # повторное удаление ничего не ломает
+    assert len(sweep) == 2 and boxes[0] not in sweep
+    assert [set(pair) for pair in sweep.pairs()] == [{boxes[1], boxes[2]}]
+
+
+# Тест №1.3 (негативный)
+def test_touching_edges_not_pair():
+    """Касание краями не считается столкновением, как у Rect.colliderect."""
+    sweep = SweepAndPrune()
+    sweep.rebuild([Box(0, 0), Box(32, 0), Box(0, 32)])
+
+    assert sweep.pairs() == []
+
+
+# Тест №2.1 (позитивный)
+def test_array_pairs_match_brute_force():
+    """Вариант для массивов совпадает с перебором и возвращает упорядоченную перестановку."""
+    rnd = np.random.default_rng(2)
+    pos = rnd.uniform(0, 500, size=(300, 2))
+    size = np.full((300, 2), 32.0)
+
+    order, a, b = sweep_pairs(np.arange(300)[::-1], pos, size)
+
+    far = pos + size
+    expected = {frozenset((i, j)) for i in range(300) for j in range(i + 1, 300)
+                if pos[i, 0] < far[j, 0] and pos[j, 0] < far[i, 0] and pos[i, 1] < far[j, 1] and pos[j, 1] < far[i, 1]}
+    assert {frozenset(pair) for pair in zip(a.tolist(), b.tolist())} == expected
+    assert np.all(np.diff(pos[order, 0]) >= 0)
+
+
+# Тест №3.1 (позитивный)
+def test_enemies_bounce_apart():
+    """Два врага, летящие навстречу, после столкновения разлетаются (объекты и пул)."""
+    game = Game(pygame.Surface((800, 600)), 'Легкий', enemy_collisions=True)
+    left, right = Enemy((100, 100), 800, 600), Enemy((140, 100), 800, 600)
+    left.speed = right.speed = 3
+    left.direction[:], right.direction[:] = [1, 1], [-1, 1]
+    game.enemies[:] = [left, right]
+
+    pool_game = Game(pygame.Surface((800, 600)), 'Легкий', use_enemy_pool=True, enemy_collisions=True)
+    pool = pool_game.enemy_pool
+    pool.add((100, 100), 3, (1, 1))
+    pool.add((140, 100), 3, (-1, 1))
+
+    for _ in range(5):
+        game.move_enemies()
+        pool_game.move_enemies()
+
+    assert left.direction == [-1, 1] and right.direction == [1, 1]
+    assert left.rect.right <= right.rect.left
+    assert list(pool.vel[:2, 0]) == [-3, 3]
+    assert pool.pos[0, 0] + 32 <= pool.pos[1, 0]
+
+
+# Тест №3.2 (позитивный)
+def test_pool_order_survives_removal():
+    """После удаления врагов порядок пула переводится на новые индексы."""
+    pool = EnemyPool(800, 600)
+    for x in (300, 100, 200, 0):
+        pool.add((x, 0), 0, (1, 1))
+    pool.bounce()
+
+    pool.remove(np.array([1]))
+
+    assert sorted(pool.order.tolist()) == [0, 1, 2]
+    assert list(pool.pos[pool.order, 0]) == [0, 200, 300]
@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pygame
+import pytest
+
+from app.enemy import Enemy
+from app.game import Game
+from app.swept import time_of_impact
+
+
+def impact(start, delta, other_start, other_delta, size=(32, 32), other_size=(32, 32)):
+    return time_of_impact(start, delta, size, np.array([other_start], dtype=np.float64),
+                          np.array([other_delta], dtype=np.float64), np.array([other_size], dtype=np.float64))[0]
+
+
+# Тест №1.1 (позитивный)
+def test_tunnelling_detected():
+    """Прямоугольник пролетает неподвижный насквозь за один шаг - касание найдено в момент входа."""
+    # Правый край 32 доходит до левого края 100 на 68 пикселях из 200
+    assert impact((0, 0), (200, 0), (100, 0), (0, 0)) == pytest.approx(68 / 200)
+
+
+# Тест №1.2 (позитивный)
+def test_head_on_impact():
+    """Встречное движение: время касания считается по относительной скорости."""
+    assert impact((0, 0), (50, 0), (100, 10), (-50, 0)) == pytest.approx(68 / 100)
+
+
+# Тест №1.3 (негативный)
+def test_miss_and_touching():
+    """Параллельный пролёт и касание краями столкновением не считаются."""
+    assert math.isinf(impact((0, 0), (200, 0), (100, 40), (0, 0)))
+    assert math.isinf(impact((0, 0), (0, 0), (32, 0), (0, 0)))
+    assert math.isinf(impact((0, 0), (68, 0), (100, 0), (0, 0)))  # дошёл ровно до края в конце шага
+
+
+# Тест №1.4 (позитивный)
+def test_overlap_at_start():
+    """Пересечение уже в начале шага даёт момент 0."""
+    assert impact((0, 0), (0, 0), (10, 10), (3, 3)) == 0
+
+
+@pytest.fixture(params=[False, True], ids=['list', 'pool'])
+def game(request):
+    game = Game(pygame.Surface((800, 600)), 'Легкий', use_enemy_pool=request.param, swept_collisions=True)
+    if request.param:
+        game.enemy_pool.add((300, 100), 0, (1, 1))
+    else:
+        enemy = Enemy((300, 100), 800, 600)
+        enemy.grid = game.enemy_grid
+        game.enemy_grid.insert(enemy)
+        game.enemies.append(enemy)
+    return game
+
+
+# Тест №2.1 (позитивный)
+def test_game_swept_collision(game):
+    """Игрок перепрыгнул врага за шаг: жизнь потеряна, враг удалён, момент касания известен."""
+    game.lives = 3
+    game.check_collision(pygame.Rect(500, 100, 64, 64), (100, 100))
+
+    assert game.lives == 2
+    assert game.impact_time == pytest.approx((300 - 164) / 400)
+    assert len(game.enemy_pool if game.enemy_pool is not None else game.enemies) == 0
+
+
+# Тест №2.2 (негативный)
+def test_game_discrete_check_misses_tunnelling(game):
+    """Без непрерывной проверки тот же прыжок остаётся незамеченным."""
+    game.swept_collisions = False
+    game.lives = 3
+    game.check_collision(pygame.Rect(500, 100, 64, 64), (100, 100))
+
+    assert game.lives == 3
+    assert game.impact_time is None
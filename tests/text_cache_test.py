@@ -0,0 +1,91 @@
+import pygame
+import pytest
+from unittest.mock import Mock, patch
+
+from app import text_cache
+from app.game import Game
+from app.text_cache import Label, TextCache, get_font
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+# Тест №1.1 (позитивный)
+def test_font_is_created_once():
+    """Повторный запрос шрифта возвращает объект из реестра."""
+    assert get_font(None, 32) is get_font(None, 32)
+    assert get_font(None, 32) is not get_font(None, 36)
+
+
+# Тест №1.2 (негативный)
+def test_registry_cleared_on_quit():
+    """После pygame.quit() реестр и кеш надписей очищаются."""
+    font = get_font(None, 32)
+    text_cache.render_text(font, 'abc', (255, 255, 255))
+
+    pygame.quit()
+    assert text_cache._fonts == {}
+    assert len(text_cache.text_cache) == 0
+
+    pygame.init()
+    new_font = get_font(None, 32)
+    assert new_font is not font
+    assert new_font.render('abc', True, (255, 255, 255)).get_width() > 0
+
+
+# Тест №2.1 (позитивный)
+def test_text_cache_reuses_surface():
+    """Одинаковые (шрифт, текст, цвет) отрисовываются один раз."""
+    cache = TextCache()
+    font = Mock()
+    first = cache.render(font, 'Играть', (0, 255, 0))
+    second = cache.render(font, 'Играть', [0, 255, 0])
+
+    assert first is second
+    font.render.assert_called_once_with('Играть', True, (0, 255, 0))
+
+
+# Тест №2.2 (позитивный)
+def test_text_cache_evicts_least_recent():
+    """При переполнении вытесняется давно не использованная надпись."""
+    cache = TextCache(max_size=2)
+    font = Mock()
+    cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'b', (0, 0, 0))
+    cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'c', (0, 0, 0))
+
+    assert len(cache) == 2
+    assert (font, 'a', (0, 0, 0), True) in cache.surfaces
+    assert (font, 'b', (0, 0, 0), True) not in cache.surfaces
+
+
+# Тест №3.1 (позитивный)
+def test_label_rerenders_only_on_change():
+    """Надпись HUD перерисовывается только при смене значения."""
+    font = Mock()
+    label = Label(font)
+    label.render('Жизни: 3')
+    label.render('Жизни: 3')
+    label.render('Жизни: 2')
+
+    assert font.render.call_count == 2
+
+
+# Тест №3.2 (позитивный)
+def test_render_game_reuses_hud_surfaces():
+    """render_game не создаёт шрифт и не перерисовывает неизменный HUD каждый кадр."""
+    game = Game(pygame.Surface((800, 600)), 'Легкий')
+    game.ship_image = pygame.Surface((64, 64))
+
+    with patch('pygame.display.flip'), patch('pygame.font.SysFont', wraps=pygame.font.SysFont) as mock_sysfont:
+        game.render_game([400, 300], '0:01')
+        timer_surface = game.hud['timer'].surface
+        game.render_game([400, 300], '0:01')
+
+    assert game.hud['timer'].surface is timer_surface
+    assert mock_sysfont.call_count <= 1
@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+
+import pygame
+
+from app.headless import ScriptedInput
+from app.tournament import IdlePolicy, RandomWalkPolicy, ResultLog, run_session, run_tournament
+
+
+class ListSink:
+    # Хранилище с тем же методом, что и Records
+    def __init__(self):
+        self.saved = []
+
+    def save_record(self, data):
+        self.saved.append(data)
+
+
+# Тест №1.1 (позитивный)
+def test_session_result_fields():
+    """Сессия до конца игры сообщает длительность, потерянные жизни и число врагов."""
+    result = run_session(('Сложный', 1), RandomWalkPolicy(), size=(800, 600))
+
+    assert result['name'] == 'bot-1'
+    assert result['difficulty'] == 'Сложный'
+    assert result['game_over'] is True
+    assert result['lives_lost'] >= 1
+    assert result['enemies_alive'] >= 0
+    assert result['duration'] > 0
+
+
+# Тест №1.2 (позитивный)
+def test_session_repeats_for_seed():
+    """Один и тот же сид и бот дают одинаковый результат; состояние бота не переносится."""
+    policy = RandomWalkPolicy()
+    first = run_session(('Средний', 7), policy, size=(800, 600))
+    second = run_session(('Средний', 7), policy, size=(800, 600))
+
+    assert first == second
+    assert policy.rng is None
+
+
+# Тест №1.3 (позитивный)
+def test_session_with_scripted_input():
+    """Вместо функции-бота можно передать источник ввода; длительность ограничена max_seconds."""
+    result = run_session(('Легкий', 3), ScriptedInput([[pygame.K_d]] * 10), size=(800, 600), max_seconds=1)
+
+    assert result['duration'] <= 1.0 + 1e-9
+
+
+# Тест №2.1 (позитивный)
+def test_tournament_streams_into_sink():
+    """Результаты процессов приходят в порядке сессий и совпадают с прогоном в одном процессе."""
+    sessions = [('Легкий', 1), ('Средний', 2), ('Сложный', 3), ('Сложный', 4)]
+    sink = ListSink()
+
+    results = list(run_tournament(sessions, sink, workers=2, chunksize=1, policy=IdlePolicy(),
+                                  size=(800, 600), max_seconds=30))
+
+    assert sink.saved == results
+    assert [(r['difficulty'], r['seed']) for r in results] == sessions
+    assert results[2] == run_session(('Сложный', 3), IdlePolicy(), size=(800, 600), max_seconds=30)
+
+
+# Тест №3.1 (позитивный)
+def test_result_log_keeps_all_fields():
+    """Журнал результатов хранит все поля сессии и перезаписывается при новом прогоне."""
+    temp_dir = tempfile.TemporaryDirectory()
+    filename = os.path.join(temp_dir.name, 'tournament.jsonl')
+    result = run_session(('Сложный', 1), IdlePolicy(), size=(800, 600), max_seconds=30)
+
+    for run in range(2):
+        log = ResultLog(filename)
+        log.save_record(result)
+        log.close()
+
+    with open(filename, encoding='utf-8') as file:
+        lines = file.readlines()
+    assert [json.loads(line) for line in lines] == [result]
+    temp_dir.cleanup()